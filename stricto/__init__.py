@@ -12,6 +12,7 @@ from .in_type import In
 from .bool import Bool
 from .float import Float
 from .generic import GenericType, ViewType
+from .view_proxy import ViewProxy
 from .error import (
     StrictoError,
     STypeError,
@@ -21,10 +22,11 @@ from .error import (
     SConstraintError,
     SRightError,
     SError,
+    NodePath,
 )
 from .toolbox import validation_parameters
 from .extend import Extend
-from .json_encoder import StrictoEncoder
+from .json_encoder import StrictoEncoder, dumps
 from .extended.bytes import Bytes
 from .extended.date_time import Datetime
 from .extended.free_dict import FreeDict
@@ -33,4 +35,10 @@ from .extended.ip_network import Ipnetwork
 from .permissions import Permissions
 from .extended.complex import Complex
 from .selector import Selector
+from .jsonpath import JsonPath, compile_path
+from .query import Query, compile_query
+from .transaction import Transaction
 from .kparse import Kparse
+from .jsonl import JsonlValidator
+from .mapper import mapper, Mapper, Constant
+from .model import Model
@@ -0,0 +1,69 @@
+"""
+Command line for stricto
+
+    python -m stricto validate my_app.models:user users.jsonl --workers 8
+"""
+
+import argparse
+import os
+import sys
+from .jsonl import JsonlValidator, DEFAULT_CHUNK_SIZE
+
+
+def validate(args: argparse.Namespace) -> int:
+    """
+    validate a JSON Lines file. Errors go to stdout, stats to stderr.
+    Return 1 if some errors.
+    """
+    validator = JsonlValidator(
+        args.schema, args.file, workers=args.workers, chunk_size=args.chunk_size
+    )
+    for line, message in validator.errors():
+        print(f"{args.file}:{line}: {message}")
+
+    stats = validator.stats
+    print(
+        f"{stats['records']} records, {stats['errors']} errors"
+        f" in {stats['seconds']:.3f}s"
+        f" ({stats['records_per_second']:.0f} records/s,"
+        f" {stats['megabytes_per_second']:.2f} MB/s, {stats['workers']} workers)",
+        file=sys.stderr,
+    )
+    return 1 if stats["errors"] else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Entry point
+    """
+    parser = argparse.ArgumentParser(prog="python -m stricto")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parser_validate = commands.add_parser(
+        "validate", help="validate a JSON Lines file against a schema"
+    )
+    parser_validate.add_argument(
+        "schema", help='the schema to import, as "module:attribute"'
+    )
+    parser_validate.add_argument("file", help="the JSON Lines file")
+    parser_validate.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of processes (default: number of cpus)",
+    )
+    parser_validate.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="bytes of the file given to a worker at once",
+    )
+    parser_validate.set_defaults(func=validate)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
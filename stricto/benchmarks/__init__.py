@@ -0,0 +1,521 @@
+"""
+Benchmarks of stricto hot paths (standard library only)
+
+    python -m stricto.benchmarks --output report.json
+"""
+
+import datetime
+import io
+import json
+import platform
+import statistics
+import sys
+import timeit
+import tracemalloc
+from importlib import metadata
+from typing import Any, Callable
+
+from ..dict import Dict
+from ..int import Int
+from ..string import String
+from ..list import List
+from ..json_encoder import StrictoEncoder
+from ..model import Model
+from ..query import compile_query
+
+# Format of the report, changed when the report is not comparable
+REPORT_VERSION = 1
+
+# Parameters of benchmarks
+WIDTHS = (10, 50)
+DEPTHS = (1, 4)
+LIST_SIZES = (10, 1000)
+
+# Smaller parameters for a quick run
+QUICK_WIDTHS = (10,)
+QUICK_DEPTHS = (2,)
+QUICK_LIST_SIZES = (10,)
+
+# All benchmarks, filled by the @benchmark decorator
+BENCHMARKS = {}
+
+
+def benchmark(*parameters: str) -> Callable:
+    """
+    Register a benchmark. The function gets its parameters
+    (among "width", "depth" and "size") and returns the function to time.
+
+    :meta private:
+    """
+
+    def register(func: Callable) -> Callable:
+        BENCHMARKS[func.__name__.removeprefix("bench_")] = (func, parameters)
+        return func
+
+    return register
+
+
+def document_schema(width: int, depth: int, **kwargs) -> Dict:
+    """
+    A Dict with width fields (half Int, half String)
+    and a "sub" Dict of the same shape until depth
+    """
+    fields = {}
+    for i in range(width):
+        fields[f"f{i}"] = Int(views=["short"]) if i % 2 == 0 else String()
+    if depth > 1:
+        fields["sub"] = document_schema(width, depth - 1)
+    return Dict(fields, **kwargs)
+
+
+def document_value(width: int, depth: int) -> dict:
+    """
+    A value for :py:func:`document_schema`
+    """
+    value = {}
+    for i in range(width):
+        value[f"f{i}"] = i if i % 2 == 0 else f"value {i}"
+    if depth > 1:
+        value["sub"] = document_value(width, depth - 1)
+    return value
+
+
+def document(width: int, depth: int) -> Dict:
+    """
+    A filled document
+    """
+    d = document_schema(width, depth)
+    d.set(document_value(width, depth))
+    return d
+
+
+def record_schema() -> Dict:
+    """
+    A small record, for lists
+    """
+    return Dict({"id": Int(), "name": String(), "tags": List(String())})
+
+
+def record_values(size: int) -> list:
+    """
+    Values for a list of records
+    """
+    return [{"id": i, "name": f"name {i}", "tags": ["a", "b"]} for i in range(size)]
+
+
+def records(size: int) -> List:
+    """
+    A list of size records
+    """
+    l = List(record_schema())
+    l.set(record_values(size))
+    return l
+
+
+@benchmark("width", "depth")
+def bench_dict_set(width: int, depth: int) -> Callable:
+    """Dict.set() of a whole document"""
+    d = document_schema(width, depth)
+    value = document_value(width, depth)
+    return lambda: d.set(value)
+
+
+@benchmark("width", "depth")
+def bench_check(width: int, depth: int) -> Callable:
+    """check() of a whole document"""
+    d = document_schema(width, depth)
+    value = document_value(width, depth)
+    return lambda: d.check(value)
+
+
+@benchmark("size")
+def bench_list_append(size: int) -> Callable:
+    """size List.append() in an empty list"""
+    schema = List(record_schema())
+    values = record_values(size)
+
+    def body():
+        l = schema.copy()
+        for value in values:
+            l.append(value)
+
+    return body
+
+
+@benchmark("size")
+def bench_list_extend(size: int) -> Callable:
+    """one List.extend() of size elements in an empty list"""
+    schema = List(record_schema())
+    values = record_values(size)
+
+    def body():
+        l = schema.copy()
+        l.extend(values)
+
+    return body
+
+
+@benchmark("size")
+def bench_list_load_stream(size: int) -> Callable:
+    """List.load_stream() of a JSON array of size records"""
+    schema = List(record_schema())
+    data = json.dumps(record_values(size))
+    return lambda: schema.copy().load_stream(io.StringIO(data))
+
+
+@benchmark("depth")
+def bench_select(depth: int) -> Callable:
+    """select() of the deepest field"""
+    d = document(10, depth)
+    selector = "$." + "sub." * (depth - 1) + "f0"
+    return lambda: d.select(selector)
+
+
+@benchmark("size")
+def bench_select_list(size: int) -> Callable:
+    """select() of a field in all elements of a list"""
+    l = records(size)
+    return lambda: l.select("$.name")
+
+
+@benchmark("size")
+def bench_list_find(size: int) -> Callable:
+    """List.find() of an element with an index on its name"""
+    l = records(size)
+    l.create_index("$.name")
+    query = {"name": f"name {size // 2}"}
+    return lambda: l.find(query)
+
+
+@benchmark("size")
+def bench_transaction_rollback(size: int) -> Callable:
+    """A transaction with 2 changes in a list of size records, rolled back"""
+    l = records(size)
+
+    def body():
+        with l.transaction() as t:
+            l[0].name = "changed"
+            l.append({"id": size})
+            t.rollback()
+
+    return body
+
+
+@benchmark("size")
+def bench_patch_many(size: int) -> Callable:
+    """patch_many() of 3 operations in a list of size records"""
+    l = records(size)
+    operations = [
+        {"op": "replace", "path": "$[0].name", "value": "changed"},
+        {"op": "add", "path": "$[-]", "value": {"id": size}},
+        {"op": "remove", "path": "$[1]"},
+    ]
+    return lambda: l.patch_many(operations)
+
+
+@benchmark("size")
+def bench_diff(size: int) -> Callable:
+    """diff() of two lists of size records, with 3 changes"""
+    l = records(size)
+    other = l.copy()
+    other[size // 2].name = "changed"
+    other.insert(size // 3, {"id": -1})
+    other.pop(0)
+    return lambda: l.diff(other)
+
+
+@benchmark("size")
+def bench_list_eq(size: int) -> Callable:
+    """== of two lists of size records, after a change in one of them"""
+    l = records(size)
+    other = l.copy()
+    element = other[size // 2]
+
+    def body():
+        element.name = "changed"
+        assert l != other
+        element.name = f"name {size // 2}"
+        assert l == other
+
+    return body
+
+
+@benchmark("width", "depth")
+def bench_get_schema(width: int, depth: int) -> Callable:
+    """get_schema() of a document model"""
+    d = document_schema(width, depth)
+    return d.get_schema
+
+
+def short_records(size: int) -> List:
+    """
+    A list of records with a view of two fields ("short")
+    """
+    l = List(
+        Dict(
+            {
+                "id": Int(views=["short"]),
+                "name": String(views=["short"]),
+                "tags": List(String()),
+            }
+        )
+    )
+    l.set(record_values(size))
+    return l
+
+
+@benchmark("size")
+def bench_list_get_view(size: int) -> Callable:
+    """get_view("+short").to_json() of a list of records"""
+    l = short_records(size)
+    return lambda: l.get_view("+short").to_json()
+
+
+@benchmark("size")
+def bench_list_view_proxy(size: int) -> Callable:
+    """view_proxy("+short").to_json() of a list of records"""
+    l = short_records(size)
+    return lambda: l.view_proxy("+short").to_json()
+
+
+@benchmark("size")
+def bench_select_filter(size: int) -> Callable:
+    """select() with a rfc 9535 filter on the elements of a list"""
+    l = records(size)
+    return lambda: l.select("$[?@.id >= 10 && length(@.tags) == 2].name")
+
+
+@benchmark("width", "depth")
+def bench_select_descendant(width: int, depth: int) -> Callable:
+    """select() of a name at any depth ($..f0)"""
+    d = document(width, depth)
+    return lambda: d.select("$..f0")
+
+
+@benchmark("width")
+def bench_match(width: int) -> Callable:
+    """match() with all fields"""
+    d = document(width, 1)
+    query = document_value(width, 1)
+    return lambda: d.match(query)
+
+
+@benchmark("width")
+def bench_match_compiled(width: int) -> Callable:
+    """match() with all fields of a compiled query (to compare with match)"""
+    d = document(width, 1)
+    query = compile_query(document_value(width, 1))
+    return lambda: d.match(query)
+
+
+@benchmark("size")
+def bench_list_find_scan(size: int) -> Callable:
+    """List.find() with operators on all elements (no index)"""
+    l = records(size)
+    query = {
+        "id": ("$gte", size // 2),
+        "name": ("$reg", r"name \d*1$"),
+        "tags": ("$contains", "a"),
+    }
+    return lambda: l.find(query)
+
+
+@benchmark("width", "depth")
+def bench_get_view(width: int, depth: int) -> Callable:
+    """get_view() of a view with half of the fields"""
+    d = document(width, depth)
+    return lambda: d.get_view("+short")
+
+
+@benchmark("width", "depth")
+def bench_copy(width: int, depth: int) -> Callable:
+    """copy() of a whole document"""
+    d = document(width, depth)
+    return d.copy
+
+
+@benchmark("width", "depth")
+def bench_model_new(width: int, depth: int) -> Callable:
+    """Model.new() of an empty document (to compare with copy())"""
+    return Model(document_schema(width, depth)).new
+
+
+@benchmark("size")
+def bench_model_records(size: int) -> Callable:
+    """size Model.new() of filled records"""
+    model = Model(record_schema())
+    values = record_values(size)
+    return lambda: [model.new(value) for value in values]
+
+
+@benchmark("width", "depth")
+def bench_get_value(width: int, depth: int) -> Callable:
+    """get_value() of a whole document"""
+    d = document(width, depth)
+    return d.get_value
+
+
+@benchmark("size")
+def bench_list_get_value(size: int) -> Callable:
+    """get_value() of a list of records"""
+    l = records(size)
+    return l.get_value
+
+
+@benchmark("width", "depth")
+def bench_json_dumps(width: int, depth: int) -> Callable:
+    """json.dumps( ..., cls=StrictoEncoder ) of a whole document"""
+    d = document(width, depth)
+    return lambda: json.dumps(d, cls=StrictoEncoder)
+
+
+@benchmark("width", "depth")
+def bench_to_json(width: int, depth: int) -> Callable:
+    """to_json() of a whole document (to compare with json_dumps)"""
+    return document(width, depth).to_json
+
+
+@benchmark("size")
+def bench_list_to_json(size: int) -> Callable:
+    """to_json() of a list of records"""
+    l = records(size)
+    return l.to_json
+
+
+def measure(func: Callable, min_time: float = 0.2, repeat: int = 5) -> dict:
+    """Time a function and measure its allocations
+
+    :param func: the function to measure
+    :type func: Callable
+    :param min_time: minimal duration of one timing, in seconds
+    :type min_time: float
+    :param repeat: number of timings
+    :type repeat: int
+    :return: timings per call (in seconds) and memory (in bytes)
+    :rtype: dict
+    """
+    timer = timeit.Timer(func)
+    once = timer.timeit(number=1)
+    number = max(1, int(min_time / once)) if once > 0 else 1000
+    timings = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        func()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "number": number,
+        "repeat": repeat,
+        "best": min(timings),
+        "median": statistics.median(timings),
+        "peak_bytes": peak - before,
+        "retained_bytes": after - before,
+    }
+
+
+def parameters_of(names: tuple, quick: bool) -> list[dict]:
+    """
+    All combinations of parameters for a benchmark
+
+    :meta private:
+    """
+    values = {
+        "width": QUICK_WIDTHS if quick else WIDTHS,
+        "depth": QUICK_DEPTHS if quick else DEPTHS,
+        "size": QUICK_LIST_SIZES if quick else LIST_SIZES,
+    }
+    combinations = [{}]
+    for name in names:
+        combinations = [
+            {**c, name: value} for c in combinations for value in values[name]
+        ]
+    return combinations
+
+
+def case_name(name: str, params: dict) -> str:
+    """
+    A unique name for a benchmark with its parameters, like "dict_set[width=10,depth=1]"
+
+    :meta private:
+    """
+    return name + "[" + ",".join(f"{k}={v}" for k, v in params.items()) + "]"
+
+
+def run_case(name: str, func: Callable, params: dict, quick: bool) -> dict:
+    """
+    Build a benchmark with its parameters, time it and return its result
+
+    :meta private:
+    """
+    result = measure(
+        func(**params), min_time=0.01 if quick else 0.2, repeat=1 if quick else 5
+    )
+    result["benchmark"] = name
+    result["parameters"] = params
+    return result
+
+
+def run(
+    names: list[str] | None = None,
+    quick: bool = False,
+    progress: Callable[[str], Any] | None = None,
+) -> dict:
+    """Run benchmarks and return the report
+
+    :param names: the benchmarks to run (all if None)
+    :type names: list[str] | None
+    :param quick: smaller parameters and shorter timings
+    :type quick: bool
+    :param progress: called with the name of each benchmark before running it
+    :type progress: Callable[[str], Any] | None
+    :return: the report
+    :rtype: dict
+    """
+    try:
+        version = metadata.version("stricto")
+    except metadata.PackageNotFoundError:
+        version = None
+
+    results = {}
+    for name, (func, parameters) in BENCHMARKS.items():
+        if names is not None and name not in names:
+            continue
+        for params in parameters_of(parameters, quick):
+            case = case_name(name, params)
+            if progress is not None:
+                progress(case)
+            results[case] = run_case(name, func, params, quick)
+
+    return {
+        "report_version": REPORT_VERSION,
+        "stricto_version": version,
+        "python": sys.version,
+        "platform": platform.platform(),
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "quick": quick,
+        "results": results,
+    }
+
+
+def compare(old: dict, new: dict) -> dict:
+    """Compare two reports
+
+    :param old: the reference report
+    :type old: dict
+    :param new: the new report
+    :type new: dict
+    :return: ``{ case : new time / old time }`` for cases in both reports
+    :rtype: dict
+    """
+    ratios = {}
+    for case, result in new["results"].items():
+        reference = old["results"].get(case)
+        if reference is None or not reference["best"]:
+            continue
+        ratios[case] = result["best"] / reference["best"]
+    return ratios
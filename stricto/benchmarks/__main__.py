@@ -0,0 +1,61 @@
+"""
+Command line for benchmarks
+
+    python -m stricto.benchmarks --output report.json
+    python -m stricto.benchmarks --compare old_report.json
+"""
+
+import argparse
+import json
+import sys
+from . import BENCHMARKS, run, compare
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Entry point
+    """
+    parser = argparse.ArgumentParser(prog="python -m stricto.benchmarks")
+    parser.add_argument(
+        "names",
+        nargs="*",
+        help=f"benchmarks to run (default: all) among {', '.join(BENCHMARKS)}",
+    )
+    parser.add_argument(
+        "--output", "-o", help="write the JSON report in this file (default: stdout)"
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="small parameters and short timings"
+    )
+    parser.add_argument(
+        "--compare", help="a previous JSON report, to print time ratios against it"
+    )
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    report = run(
+        args.names or None,
+        quick=args.quick,
+        progress=lambda case: print(case, file=sys.stderr),
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            old = json.load(f)
+        for case, ratio in compare(old, report).items():
+            print(f"{case}: x{ratio:.2f}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
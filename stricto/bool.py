@@ -2,7 +2,7 @@
 
 from typing import Any
 from .generic import GenericType
-from .error import STypeError
+from .error import STypeError, NodePath
 
 
 class Bool(GenericType):
@@ -13,6 +13,8 @@ class Bool(GenericType):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         """Constructor method"""
 
@@ -30,7 +32,7 @@ class Bool(GenericType):
         """
         if isinstance(value, (bool, Bool)):
             return True
-        raise STypeError('{0}: Not a bool "{value}"', self.path_name(), value=value)
+        raise STypeError('{0}: Not a bool "{value}"', NodePath(self), value=value)
 
     def check_constraints(self, value: Any) -> None:
         """Check constraint
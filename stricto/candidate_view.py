@@ -0,0 +1,189 @@
+"""
+Module providing the read-only view of a candidate value (see :py:meth:`GenericType.validate_many`)
+"""
+
+# pylint: disable=protected-access
+from typing import Any, Iterator
+from .error import SAttributeError, SKeyError, STypeError, SRightError, NodePath
+from .view_proxy import ViewProxy
+
+# The value of an object on the way to the candidate is read from the object
+READ = object()
+# No key (or index) in the view
+_MISSING = object()
+
+
+class CandidateView:
+    """A read-only view of an object as if a candidate value was set in one of
+    its sub objects (or in itself), without :py:meth:`set` : nothing is copied,
+    modified or triggered. Rules checking the candidate get this view as root.
+
+    Keys of a Dict are attributes (and items), elements of a List or a Tuple
+    are items. Sub objects are returned as views too, other ones as values.
+
+    :param node: the object
+    :type node: GenericType
+    :param value: its candidate value, or ``READ`` to read it from the object
+    :type value: Any
+    :param target: ( the object checked, its candidate value, ids of its parents )
+    :type target: tuple
+    """
+
+    __slots__ = ("_node", "_value", "_target")
+
+    def __init__(self, node, value: Any, target: tuple):
+        object.__setattr__(self, "_node", node)
+        object.__setattr__(self, "_value", value)
+        object.__setattr__(self, "_target", target)
+
+    def get_value(self) -> Any:
+        """
+        Return the value, with the candidate in it
+        """
+        if self._value is not READ:
+            return self._value
+        if self._node._match_kind == "dict":
+            return {key: _value_of(self._child(key)) for key in self}
+        return [_value_of(element) for element in self]
+
+    def _candidate(self, node, value: Any) -> Any:
+        """
+        Return a sub object of the candidate as a view, or its value
+
+        :meta private:
+        """
+        if node._view_items(None) is None:
+            default = node._default
+            if value is None and not callable(default):
+                # as set() does
+                return default
+            return value
+        return CandidateView(node, value, self._target)
+
+    def _child(self, key: str | int) -> Any:
+        """
+        Return the view or the value of a key (or an index), _MISSING if not found
+
+        :meta private:
+        """
+        node = self._node
+        if self._value is not READ:
+            found = node._candidate_child(self._value, key)
+            return _MISSING if found is None else self._candidate(*found)
+
+        found = node._view_child(None, key)
+        if found is None:
+            return _MISSING
+        child, view_name = found
+        target, value, parents = self._target
+        if child is target:
+            return self._candidate(child, value)
+        if id(child) in parents:
+            return CandidateView(child, READ, self._target)
+        if child._view_items(view_name) is None:
+            return child.get_value()
+        return ViewProxy(child, view_name)
+
+    def __getattr__(self, key: str) -> Any:
+        found = self._child(key)
+        if found is _MISSING:
+            raise SAttributeError(
+                '{0}: candidate has no attribute "{k}"', NodePath(self._node), k=key
+            )
+        return found
+
+    def __getitem__(self, key: str | int) -> Any:
+        found = self._child(key)
+        if found is _MISSING:
+            raise SKeyError(
+                '{0}: candidate has no item "{k}"', NodePath(self._node), k=key
+            )
+        return found
+
+    def _keys(self) -> Iterator[str | int]:
+        """
+        Return keys of a Dict, or indexes of a List or a Tuple
+
+        :meta private:
+        """
+        node = self._node
+        if self._value is not READ:
+            keys = node._candidate_keys(self._value)
+        else:
+            items = node._view_items(None)
+            keys = None if items is None else (key for key, _, _ in items)
+        if keys is None:
+            raise STypeError("{0}: candidate is not iterable", NodePath(node))
+        return keys
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Keys of a Dict, elements of a List or a Tuple
+        """
+        if self._node._match_kind == "dict":
+            yield from self._keys()
+            return
+        for index in self._keys():
+            yield self._child(index)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._keys())
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        A key of a Dict, or the value of an element of a List or a Tuple
+        """
+        if self._node._match_kind == "dict":
+            return key in self._keys()
+        return any(_value_of(element) == key for element in self)
+
+    def keys(self) -> Iterator[str]:
+        """
+        Return keys
+        """
+        return iter(self)
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        """
+        Return ( key, sub object )
+        """
+        for key in self._keys():
+            yield key, self._child(key)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (CandidateView, ViewProxy)):
+            other = other.get_value()
+        return self.get_value() == other
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.get_value())
+
+    def _read_only(self, *args, **kwargs):
+        """
+        All modifications raise an error
+
+        :meta private:
+        """
+        raise SRightError("{0}: candidate is read-only", NodePath(self._node))
+
+    __setattr__ = _read_only
+    __delattr__ = _read_only
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    set = _read_only
+
+
+def _value_of(found: Any) -> Any:
+    """
+    Return the value of a view or a value
+
+    :meta private:
+    """
+    if isinstance(found, (CandidateView, ViewProxy)):
+        return found.get_value()
+    return found
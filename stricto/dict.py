@@ -1,8 +1,20 @@
 """Module providing the Dict() Class"""
 
 import copy
-from .generic import GenericType, ViewType
-from .error import SSyntaxError, STypeError, SAttributeError
+from .generic import (
+    GenericType,
+    SpecAttribute,
+    ViewType,
+    attributes_of,
+    parse_view,
+    with_decisions,
+    forget_decisions,
+)
+from .error import SSyntaxError, STypeError, SAttributeError, NodePath
+from .json_writer import encode_key
+from .query import Query
+from .diff import pointer
+from .digest import new_hash
 from .selector import Selector
 from .toolbox import validation_parameters
 
@@ -14,6 +26,15 @@ class Dict(GenericType):
     :type schema: dict
     """
 
+    __slots__ = ("_keys", "_children", "_locked")
+    _not_rules = ("_locked", "_view_keys")
+
+    # keys in each view, see _keys_in_view()
+    _view_keys = SpecAttribute("_view_keys")
+    _rule_cache_names = GenericType._rule_cache_names + ("_view_keys",)
+
+    _match_kind = "dict"
+
     @validation_parameters
     def __init__(self, schema: dict, **kwargs):
         """Dict object
@@ -25,48 +46,58 @@ class Dict(GenericType):
 
         GenericType.__init__(self, **kwargs)
         self._keys = []
+        self._children = {}
         for key in schema.keys():
             m = schema.get(key)
             if isinstance(m, GenericType) is False:
                 raise SSyntaxError('Key "{0}" is not a schema "{1}"', key, type(schema))
+            if key in attributes_of(type(self)):
+                raise SSyntaxError('Key "{0}" is forbidden (already used)', key)
             if key in Dict.__dict__:
                 raise SSyntaxError(
                     'Key "{0}" is forbidden (already used as method)', key
                 )
-            if key in self.__dict__:
-                raise SSyntaxError('Key "{0}" is forbidden (already used)', key)
             mm = copy.copy(m)
-            mm._parent = self
-            mm._attribute_name = key
-            setattr(self, key, mm)
+            mm._attach(self, key)
+            self._children[key] = mm
             self._keys.append(key)
 
         self._locked = True
 
+    def _init_caches(self):
+        GenericType._init_caches(self)
+        # keys of each view (see _keys_in_view())
+        self._view_keys = None
+
     @validation_parameters
     def add_to_model(self, key: str, model) -> None:
         """
         add new element to the model
         """
         mm = copy.copy(model)
-        mm._parent = self
-        mm._attribute_name = key
-        self.__dict__["_locked"] = False
-        setattr(self, key, mm)
-        self._keys.append(key)
-        self.__dict__["_locked"] = True
+        mm._attach(self, key)
+        if key not in self._children:
+            self._keys.append(key)
+        self._children[key] = mm
+        self._invalidate_compiled()
+        self._forget_schema()
+        self._forget_digest()
+        self._view_keys = None
 
     @validation_parameters
     def remove_model(self, key: str) -> None:
         """
         remove a key Model to the model
         """
-        self.__dict__["_locked"] = False
-        delattr(self, key)
+        forget_decisions()
+        del self._children[key]
         self._keys.remove(key)
-        self.__dict__["_locked"] = True
+        self._invalidate_compiled()
+        self._forget_schema()
+        self._forget_digest()
+        self._view_keys = None
 
-    def get_schema(self):
+    def _build_schema(self):
         """Return meta information for a float
 
         :param self: Description
@@ -76,11 +107,11 @@ class Dict(GenericType):
 
         :meta private:
         """
-        a = GenericType.get_schema(self)
+        a = GenericType._build_schema(self)
         a["sub_scheme"] = {}
         for key in self._keys:
-            v = object.__getattribute__(self, key)
-            a["sub_scheme"][key] = v.get_schema()
+            v = self._children[key]
+            a["sub_scheme"][key] = v._schema_of()
         return a
 
     def get_current_meta(self, parent: dict = None):
@@ -90,7 +121,7 @@ class Dict(GenericType):
         a = GenericType.get_current_meta(self, parent)
         a["sub_scheme"] = {}
         for key in self._keys:
-            v = object.__getattribute__(self, key)
+            v = self._children[key]
             a["sub_scheme"][key] = v.get_current_meta(a)
         return a
 
@@ -100,7 +131,7 @@ class Dict(GenericType):
         """
         GenericType.enable_permissions(self)
         for key in self._keys:
-            v = object.__getattribute__(self, key)
+            v = self._children[key]
             v.enable_permissions()
 
     def disable_permissions(self):
@@ -109,7 +140,7 @@ class Dict(GenericType):
         """
         GenericType.disable_permissions(self)
         for key in self._keys:
-            v = object.__getattribute__(self, key)
+            v = self._children[key]
             v.disable_permissions()
 
     def keys(self):
@@ -118,83 +149,280 @@ class Dict(GenericType):
         """
         return self._keys
 
+    @with_decisions
     def get_view(self, view_name, final=True):
         """
         Return all elements belonging to view_name
         tue return is a subset of this Dict
         """
+        my_view, r = self._view(view_name)
+        if r is not None:
+            r._reroot(None, 0)
+        return (my_view, r) if final is False else r
+
+    def _view(self, view_name):
+        """
+        Return ``( ViewType, subset )`` for :py:meth:`get_view`.
+        Only keys in the view are copied, and the cached root
+        of the subset is not set.
+
+        :meta private:
+        """
         my_view = self._belongs_to_view(view_name)
 
         if my_view is ViewType.YES:
-            return (ViewType.YES, self.copy()) if final is False else self.copy()
+            return ViewType.YES, self._copy_node()
 
         if my_view is ViewType.NO:
-            return (ViewType.NO, None) if final is False else None
+            return ViewType.NO, None
+
+        r = GenericType._copy_node(self)
+        children = self._children
+        r_keys = []
+        r_children = {}
+        same_rules = True
+        for key, view in self._keys_in_view(view_name).items():
+            v = children[key]
+            if v.exists_or_can_read() is False:
+                continue
+
+            if view is ViewType.YES:
+                sub = v._copy_node()
+            elif isinstance(v, Dict):
+                view, sub = v._view(view_name)
+            else:
+                view, sub = v.get_view(view_name, False)
+
+            if view is ViewType.NO:
+                continue
+            sub._parent = r
+            sub._attribute_name = key
+            r_keys.append(key)
+            r_children[key] = sub
+            same_rules = same_rules and sub._spec is v._spec
+        r._keys = r_keys
+        r._children = r_children
+
+        # ViewType.EXPLICIT_UNKNOWN or ViewType.UNKNOWN
+        if len(r_keys) == 0:
+            return ViewType.NO, None
+
+        if not same_rules or len(r_keys) != len(self._keys):
+            # another model : its own spec, with nothing kept
+            r._own_spec()
+            r._compiled = None
+            r._schema_cache = None
+            r._schema_digest = None
+            r._view_keys = None
+            r._digest = None
+        return ViewType.YES, r
+
+    def _keys_in_view(self, view_name):
+        """
+        Return ``{ key : ViewType }`` of keys which can be in a view.
+        Sub objects which are not containers are YES or not in the list.
+        Built once for all views named by sub objects (see :py:meth:`get_view`),
+        and kept until the model changes.
 
-        r = self.copy()
+        :meta private:
+        """
+        explicit, name = parse_view(view_name)
+        spec = self._rule_caches()
+        views = spec._view_keys
+        if views is None:
+            names = set()
+            for key in self._keys:
+                for view in self._children[key]._views:
+                    names.add(view)
+                    names.add(view.removeprefix("!"))
+            # views not named by any key are at False (for "name") and True ("+name")
+            views = {
+                (e, n): self._build_keys_in_view(e, n)
+                for n in names
+                for e in (False, True)
+            }
+            views[False] = self._build_keys_in_view(False, None)
+            views[True] = self._build_keys_in_view(True, None)
+            # the keys depend on rules only : kept in the shared spec
+            spec._view_keys = views
+        keys = views.get((explicit, name))
+        return views[explicit] if keys is None else keys
+
+    def _build_keys_in_view(self, explicit, name):
+        """
+        Return the keys of :py:meth:`_keys_in_view`.
+        A name None is a view not named by any key.
+
+        :meta private:
+        """
+        keys = {}
         for key in self._keys:
-            v = object.__getattribute__(self, key)
+            v = self._children[key]
+            if name is not None:
+                view = v._view_of(explicit, name)
+            elif explicit:
+                view = ViewType.EXPLICIT_UNKNOWN
+            else:
+                view = ViewType.UNKNOWN
+
+            if type(v).get_view is GenericType.get_view:
+                # same as GenericType.get_view()
+                if view is ViewType.UNKNOWN:
+                    view = ViewType.YES
+                elif view is ViewType.EXPLICIT_UNKNOWN:
+                    view = ViewType.NO
+            if view is not ViewType.NO:
+                keys[key] = view
+        return keys
+
+    @with_decisions
+    def _in_view(self, view_name):
+        my_view = self._belongs_to_view(view_name)
+        if my_view is ViewType.YES:
+            return True
+        if my_view is ViewType.NO:
+            return False
+        children = self._children
+        for key, view in self._keys_in_view(view_name).items():
+            v = children[key]
             if v.exists_or_can_read() is False:
-                r.remove_model(key)
                 continue
+            if view is ViewType.YES or v._in_view(view_name):
+                return True
+        return False
 
-            s = v.get_view(view_name, False)
+    def _always_in_view(self, view_name):
+        if self._exists is not True:
+            return False
+        my_view = self._belongs_to_view(view_name)
+        if my_view in (ViewType.YES, ViewType.NO):
+            return my_view is ViewType.YES
+        # one sub object always in the view is enough
+        children = self._children
+        return any(
+            view is ViewType.YES and children[key]._exists is True
+            for key, view in self._keys_in_view(view_name).items()
+        )
 
-            if s[0] is ViewType.YES:
-                object.__setattr__(r, key, s[1])
+    def _project(self, view_name, encoded):
+        my_view = self._belongs_to_view(view_name)
+        if my_view is ViewType.YES:
+            return True, self.get_encoded() if encoded else self.get_value()
+        if my_view is ViewType.NO:
+            return False, None
+        children = self._children
+        a = {}
+        for key, view in self._keys_in_view(view_name).items():
+            v = children[key]
+            if v.exists_or_can_read() is False:
+                continue
+            if view is ViewType.YES:
+                a[key] = v.get_encoded() if encoded else v.get_value()
                 continue
+            inside, value = v._project(view_name, encoded)
+            if inside:
+                a[key] = value
+        return len(a) != 0, a
 
-            if s[0] is ViewType.NO:
-                r.remove_model(key)
+    def _view_items(self, view_name):
+        my_view = self._belongs_to_view(view_name)
+        children = self._children
+        if my_view is ViewType.YES:
+            for key in self._keys:
+                v = children[key]
+                if v.exists_or_can_read() is not False:
+                    yield key, v, None
+            return
+        if my_view is ViewType.NO:
+            return
+        for key, view in self._keys_in_view(view_name).items():
+            v = children[key]
+            if v.exists_or_can_read() is False:
                 continue
+            if view is ViewType.YES:
+                yield key, v, None
+            elif v._in_view(view_name):
+                yield key, v, view_name
+
+    def _view_child(self, view_name, key):
+        v = self._children.get(key) if isinstance(key, str) else None
+        if v is None or v.exists_or_can_read() is False:
+            return None
+        my_view = self._belongs_to_view(view_name)
+        if my_view is ViewType.YES:
+            return v, None
+        if my_view is ViewType.NO:
+            return None
+        view = self._keys_in_view(view_name).get(key)
+        if view is ViewType.YES:
+            return v, None
+        if view is not None and v._in_view(view_name):
+            return v, view_name
+        return None
 
-        if my_view is ViewType.EXPLICIT_UNKNOWN:
-            if len(r) == 0:
-                return (ViewType.NO, None) if final is False else None
-            return (ViewType.YES, r) if final is False else r
+    def _candidate_value(self, value):
+        if not isinstance(value, dict):
+            return value
+        candidate = dict(value)
+        for key in self._keys:
+            child = self._children[key]
+            if key in value:
+                candidate[key] = child._candidate_value(value[key])
+            else:
+                # as set(), a missing key keeps its value
+                candidate[key] = child.get_value()
+        return candidate
 
-        # my_view is ViewType.UNKNOWN:
-        if len(r) == 0:
-            return (ViewType.NO, None) if final is False else None
-        return (ViewType.YES, r) if final is False else r
+    def _candidate_keys(self, value):
+        return iter(self._keys) if isinstance(value, dict) else None
+
+    def _candidate_child(self, value, key):
+        if not isinstance(value, dict) or key not in self._children:
+            return None
+        return self._children[key], value.get(key)
 
     def __len__(self):
         return len(self._keys)
 
     def __getitem__(self, k):
         if k in self._keys:
-            v = object.__getattribute__(self, k)
+            v = self._children[k]
             if v.exists_or_can_read() is False:
                 raise KeyError(k)
-            return self.__dict__[k]
+            return v
         return None
 
     def __setattr__(self, k, value):
 
         # Set a "normal" value
         try:
-            _keys = object.__getattribute__(self, "_keys")
+            children = object.__getattribute__(self, "_children")
         except AttributeError:
-            _keys = []
+            children = {}
 
-        if k in _keys:
-            v = object.__getattribute__(self, k)
+        if k in children:
+            v = children[k]
             if v.exists_or_can_read() is False:
                 raise SAttributeError(
-                    '{0}: "Dict" object has no attribute "{k}"', self.path_name(), k=k
+                    '{0}: "Dict" object has no attribute "{k}"', NodePath(self), k=k
                 )
 
             # a reference
             if type(value) == type(v):  # pylint: disable=unidiomatic-typecheck
                 v.check(value)
-                self.__dict__[k] = value
+                forget_decisions()
+                children[k] = value
+                self._invalidate_compiled()
+                self._forget_schema()
+                self._view_keys = None
             else:
                 v.set(self._get_other_value(value))
                 self._release_events()
             return
 
-        if k in ["root", "_parent", "_attribute_name"]:
-            self.__dict__[k] = value
+        # internal attributes
+        if k in attributes_of(type(self)):
+            object.__setattr__(self, k, value)
             return
 
         try:
@@ -203,8 +431,8 @@ class Dict(GenericType):
             locked = False
 
         if locked is True:
-            raise SAttributeError('{0}: Key "{k}" locked', self.path_name(), k=k)
-        self.__dict__[k] = value
+            raise SAttributeError('{0}: Key "{k}" locked', NodePath(self), k=k)
+        object.__setattr__(self, k, value)
 
     def __getattr__(self, k):
         """ """
@@ -214,49 +442,37 @@ class Dict(GenericType):
         """
         replicate all atributes from value, but prefere self attribute first.
         """
-
-        if k == "__getattribute__":
-            return object.__getattribute__(self, "__getattribute__")
-
-        # if k == "_value":
-        #    raise TypeError(f"dict getattr want {k}")
         try:
-            d = object.__getattribute__(self, "_keys")
+            children = object.__getattribute__(self, "_children")
         except AttributeError:
             return object.__getattribute__(self, k)
 
-        obj = object.__getattribute__(self, k)
-        if k in d:
+        if k in children:
+            obj = children[k]
             if obj.exists_or_can_read() is False:
                 raise SAttributeError(
-                    '{0}: Dict object has no attribute "{k}"', self.path_name(), k=k
+                    '{0}: Dict object has no attribute "{k}"', NodePath(self), k=k
                 )
+            return obj
 
-        return obj
-
-    def __copy__(self):
-        result = GenericType.__copy__(self)
-        # result._keys = self._keys.copy()
-        result.__dict__["_locked"] = False
-        for key, v in self.__dict__.items():
-            if key == "_locked":
-                continue
-            if key == "_parent":
-                continue
-            if key == "_attribute_name":
-                continue
-            result.__dict__[key] = copy.copy(v)
+        return object.__getattribute__(self, k)
 
+    def _copy_node(self):
+        result = GenericType._copy_node(self)
+        result._keys = self._keys.copy()
+        result._children = {}
         for key in self._keys:
-            result.__dict__[key]._parent = result
-            result.__dict__[key]._attribute_name = key
+            sub = self._children[key]._copy_node()
+            sub._parent = result
+            sub._attribute_name = key
+            result._children[key] = sub
+        return result
 
-        # parent and attribute name are reseted
-        result._parent = None
-        result._attribute_name = "$"
+    def _sub_nodes(self):
+        return [v for v in self._children.values() if v._parent is self]
 
-        result._locked = True
-        return result
+    def _json_children(self):
+        return self._children
 
     def trigg(self, event_name, from_id=None, **kwargs):
         """
@@ -267,7 +483,7 @@ class Dict(GenericType):
 
         if self._keys is not None:
             for key in self._keys:
-                v = object.__getattribute__(self, key)
+                v = self._children[key]
                 if v.exists_or_can_read() is False:
                     continue
                 v.trigg(event_name, from_id, **kwargs)
@@ -277,7 +493,7 @@ class Dict(GenericType):
     def __repr__(self):
         a = {}
         for key in self._keys:
-            v = object.__getattribute__(self, key)
+            v = self._children[key]
             if v.exists_or_can_read() is False:
                 continue
             a[key] = getattr(self, key)
@@ -291,25 +507,19 @@ class Dict(GenericType):
         """
         if operator in {"$and", "$or"}:
             if not isinstance(other, list):
-                raise SSyntaxError("{0}: $and need a list", self.path_name())
+                raise SSyntaxError("{0}: $and need a list", NodePath(self))
             for sub in other:
                 if not isinstance(sub, dict):
                     raise SSyntaxError(
                         "{0}: $and/$or list item not a dict for conditions",
-                        self.path_name(),
+                        NodePath(self),
                     )
-
-                for key, value in sub.items():
-                    if key not in self._keys and operator == "$and":
-                        return False
-                    a = self.__dict__[key]
-                    exists_or_can_read = a.exists_or_can_read()
-                    if exists_or_can_read is False and operator == "$and":
-                        return False
-                    if a.match(value) is False and operator == "$and":
-                        return False
-
-            return True
+                resp = self.match(sub)
+                if resp is False and operator == "$and":
+                    return False
+                if resp is True and operator == "$or":
+                    return True
+            return operator == "$and"
         return GenericType._match_operator(self, operator, other)
 
     def match(self, other: dict) -> bool:  # pylint: disable=too-many-return-statements
@@ -323,6 +533,9 @@ class Dict(GenericType):
         if other is None:
             return self.get_value() is None
 
+        if isinstance(other, Query):
+            return other.match(self)
+
         if isinstance(other, tuple) is True:
             return GenericType.match(self, other)
 
@@ -332,7 +545,7 @@ class Dict(GenericType):
         for key, value in other.items():
             if key not in self._keys:
                 return False
-            a = self.__dict__[key]
+            a = self._children[key]
             exists_or_can_read = a.exists_or_can_read()
             if exists_or_can_read is False:
                 return False
@@ -344,64 +557,51 @@ class Dict(GenericType):
         """
         equality test two objects
         """
-        if other is None:
-            return False
-
-        if isinstance(other, Dict) is False:
-            return False
-
-        if self._keys != other._keys:
+        if not isinstance(other, Dict) or self._keys != other._keys:
             return False
 
-        for key in self._keys:
-            a = self.__dict__[key]
-            o = other.__dict__[key]
-            exists_or_can_read = a.exists_or_can_read()
-            if exists_or_can_read != o.exists_or_can_read():
-                return False
-            if exists_or_can_read is False:
-                continue
-            if a != o:
-                return False
-        return True
+        # same digests (see digest())
+        same = self._same_content(other)
+        if same is not None:
+            return same
+        return self._same_children(other)
 
     def __ne__(self, other):
         """
         equality test two objects
         """
-        if other is None:
-            return True
-
-        if isinstance(other, Dict) is False:
-            return True
+        return not self == other
 
-        if self._keys != other._keys:
-            return True
+    def _same_children(self, other) -> bool:
+        """
+        Return True if the sub objects of two Dict with the same keys are equal
 
+        :meta private:
+        """
         for key in self._keys:
-            a = self.__dict__[key]
-            o = other.__dict__[key]
+            a = self._children[key]
+            o = other._children[key]
             exists_or_can_read = a.exists_or_can_read()
             if exists_or_can_read != o.exists_or_can_read():
-                return True
-            if exists_or_can_read is False:
-                continue
-            if a != o:
-                return True
-        return False
+                return False
+            if exists_or_can_read is not False and a != o:
+                return False
+        return True
 
+    @with_decisions
     def get_value(self):
         """
         return the value
         """
         a = {}
         for key in self._keys:
-            v = object.__getattribute__(self, key)
+            v = self._children[key]
             if v.exists_or_can_read() is False:
                 continue
             a[key] = v.get_value()
         return a
 
+    @with_decisions
     def get_encoded(self) -> dict:
         """Return the encoded value
 
@@ -411,7 +611,7 @@ class Dict(GenericType):
 
         a = {}
         for key in self._keys:
-            v = object.__getattribute__(self, key)
+            v = self._children[key]
             if v.exists_or_can_read() is False:
                 continue
             a[key] = v.get_encoded()
@@ -422,7 +622,7 @@ class Dict(GenericType):
         reset to the old value
         """
         for key in self._keys:
-            v = object.__getattribute__(self, key)
+            v = self._children[key]
             v.rollback()
 
     def get_old_value(self):
@@ -431,7 +631,7 @@ class Dict(GenericType):
         """
         a = {}
         for key in self._keys:
-            v = object.__getattribute__(self, key)
+            v = self._children[key]
             if v.exists_or_can_read() is False:
                 continue
             a[key] = v.get_old_value()
@@ -443,12 +643,49 @@ class Dict(GenericType):
         """
         a = {}
         for key in self._keys:
-            v = object.__getattribute__(self, key)
+            v = self._children[key]
             if v.exists_or_can_read() is False:
                 continue
             a[key] = v
         return a
 
+    def _write_json(self, parts):
+        if type(self).__json_encode__ is not Dict.__json_encode__:
+            GenericType._write_json(self, parts)
+            return
+        self._write_members(parts, False)
+
+    def _write_encoded(self, parts):
+        if type(self).get_encoded is not Dict.get_encoded:
+            GenericType._write_encoded(self, parts)
+            return
+        self._write_members(parts, True)
+
+    def _write_members(self, parts: list[str], encoded: bool) -> None:
+        """
+        Append readable keys as a JSON object to parts,
+        with values as :py:meth:`get_encoded` if encoded is True
+
+        :meta private:
+        """
+        parts.append("{")
+        first = True
+        alive = self.exists(None) is not False
+        children = self._children
+        for key in self._keys:
+            v = children[key]
+            if v._readable_in(alive) is False:
+                continue
+            if first is False:
+                parts.append(", ")
+            first = False
+            parts.append(encode_key(key))
+            if encoded:
+                v._write_encoded(parts)
+            else:
+                v._write_json(parts)
+        parts.append("}")
+
     def get(self, key: str, default=None):
         """
         return the value of a key
@@ -456,7 +693,7 @@ class Dict(GenericType):
         if key not in self._keys:
             return default
 
-        v = object.__getattribute__(self, key)
+        v = self._children[key]
         if v.exists_or_can_read() is False:
             return None
         return v
@@ -482,7 +719,7 @@ class Dict(GenericType):
         (key, sub_index_or_slice) = sel.pop()
 
         if key in self._keys:
-            v = self.__dict__[key]
+            v = self._children[key]
             if v.exists_or_can_read():
                 return v.get_selectors(sub_index_or_slice, sel)
             return None
@@ -491,7 +728,7 @@ class Dict(GenericType):
         if key in ("", "*"):
             a = []
             for k in self._keys:
-                v = self.__dict__[k]
+                v = self._children[k]
                 if v.exists_or_can_read():
                     result = v.get_selectors(sub_index_or_slice, sel.copy())
                     if result is not None:
@@ -502,47 +739,162 @@ class Dict(GenericType):
 
         return None
 
+    def _patch_value(self, value, step, position):
+        if position == len(step.tokens):
+            return GenericType._patch_value(self, value, step, position)
+        key = step.tokens[position]
+        child = self._children.get(key)
+        if child is None or not isinstance(value, dict):
+            raise self._not_found(step)
+        if key not in value:
+            # only a key can be added
+            if step.op != "add" or position + 1 < len(step.tokens):
+                raise self._not_found(step)
+            value[key] = None
+        value[key] = child._patch_value(value[key], step, position + 1)
+        return value
+
+    def _merged_value(self, value, new_value):
+        if new_value is None:
+            return value
+        if not isinstance(new_value, dict) or not isinstance(value, dict):
+            return new_value
+        for key, sub in new_value.items():
+            child = self._children.get(key)
+            if child is not None:
+                sub = child._merged_value(value.get(key), sub)
+            value[key] = sub
+        return value
+
+    def _compute_digest(self, full):
+        h = new_hash(b"D")
+        kept = True
+        for key in self._keys:
+            v = self._children[key]
+            if v._exists is not True or v._permissions._enabled:
+                # depends on other fields or on rights
+                kept = False
+                if not full:
+                    break
+                if v.exists_or_can_read() is False:
+                    continue
+            digest = v._digest_of(full)
+            if digest is None:
+                kept = False
+                break
+            kept = kept and v._digest is not False
+            encoded = key.encode("utf-8", "surrogatepass")
+            h.update(b"%d:" % len(encoded) + encoded + digest)
+        self._digest = h.digest() if kept else False
+        if not kept and not full:
+            return None
+        return h.digest()
+
+    def _patch_node(self, step, position):
+        if position == len(step.tokens):
+            GenericType._patch_node(self, step, position)
+            return
+        self._children[step.tokens[position]]._patch_node(step, position + 1)
+
+    def _diff(self, other, path, operations):
+        if not isinstance(other, Dict):
+            GenericType._diff(self, other, path, operations)
+            return
+        if self._same_content(other) is True:
+            return
+        for key in self._keys:
+            a = self._children[key]
+            if a.exists_or_can_read() is False:
+                continue
+            o = other._children.get(key)
+            if o is None or o.exists_or_can_read() is False:
+                operations.append({"op": "remove", "path": pointer(path, key)})
+                continue
+            a._diff(o, pointer(path, key), operations)
+        for key in other._keys:
+            o = other._children[key]
+            if o.exists_or_can_read() is False:
+                continue
+            a = self._children.get(key)
+            if a is None or a.exists_or_can_read() is False:
+                operations.append(
+                    {"op": "add", "path": pointer(path, key), "value": o.get_value()}
+                )
+
     def set_value_without_checks(self, value):
         if not isinstance(value, (dict, Dict)):
             return
         for key in self._keys:
             if key in value:
                 v = value.get(key)
-                self.__dict__[key].set_value_without_checks(v)
+                self._children[key].set_value_without_checks(v)
 
     def check(self, value) -> None:
-        # self.check_type(value)
-        # self.check_constraints(value)
-        GenericType.check(self, value)
+        self._check_compiled(value)
 
-        # check reccursively subtypes
-        if isinstance(value, dict):
-            for key in self._keys:
-                key_object = self.__dict__[key]
-                if key_object.exists_or_can_read() is False:
-                    continue
-                if key not in value:
-                    continue
-                sub_value = value.get(key)
-                key_object.check(sub_value)
-
-            # check if a non-described value
-            for key in value:
-                if key not in self._keys:
-                    raise SAttributeError(
-                        '{0}: Unknown key "{key}"', self.path_name(), key=key
-                    )
-            return
+    def _compile(self):
+        """
+        Build the inner validator for this Dict and all its keys
+        (see :py:meth:`GenericType.compile`)
 
-        if isinstance(value, Dict):
-            for key in self._keys:
-                key_object = self.__dict__[key]
-                # if key_object.exists_or_can_read() is False:
-                #    continue
+        :meta private:
+        """
+        if type(self).check is not Dict.check:
+            return self._compile_fallback()
 
-                sub_value = value.get(key).get_value()
-                key_object.check(sub_value)
-            return
+        prelude = self._compile_generic()
+        own_exists = self._compile_exists()
+        known_keys = frozenset(self._keys)
+        children = []
+        for key in self._keys:
+            key_object = self._children[key]
+            children.append(
+                (
+                    key,
+                    key_object._compile_exists(),
+                    key_object._plan(),
+                )
+            )
+
+        def validate(node, value, root, alive):
+            prelude(node, value, root)
+
+            if alive and own_exists is not True:
+                alive = own_exists is not False and own_exists(root)
+
+            # check reccursively subtypes
+            if isinstance(value, dict):
+                if alive:
+                    nodes = node._children
+                    for key, exists, sub_validate in children:
+                        if key not in value:
+                            continue
+                        # same as key_object.exists_or_can_read()
+                        if exists is not True and (exists is False or not exists(root)):
+                            continue
+                        key_object = nodes[key]
+                        if (
+                            key_object._permissions._enabled
+                            and key_object.can_read() is False
+                        ):
+                            continue
+                        sub_validate(key_object, value.get(key), root, True)
+
+                # check if a non-described value
+                for key in value:
+                    if key not in known_keys:
+                        raise SAttributeError(
+                            '{0}: Unknown key "{key}"', NodePath(node), key=key
+                        )
+                return
+
+            if isinstance(value, Dict):
+                nodes = node._children
+                for key, _, sub_validate in children:
+                    sub_value = value.get(key).get_value()
+                    sub_validate(nodes[key], sub_value, root, alive)
+
+        return validate
 
     def check_type(self, value):
         """
@@ -555,7 +907,7 @@ class Dict(GenericType):
             return True
 
         raise STypeError(
-            '{0}: Must be a dict (value="{value}")', self.path_name(), value=value
+            '{0}: Must be a dict (value="{value}")', NodePath(self), value=value
         )
 
     def check_constraints(self, value):
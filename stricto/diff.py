@@ -0,0 +1,91 @@
+"""
+Module providing diffs between objects (see :py:meth:`GenericType.diff`)
+"""
+
+# pylint: disable=protected-access
+from difflib import SequenceMatcher
+from typing import Any
+
+
+def pointer(path: str, token: str | int) -> str:
+    """
+    Return the JSON pointer of a child (rfc 6901)
+
+    :meta private:
+    """
+    return f"{path}/{str(token).replace('~', '~0').replace('/', '~1')}"
+
+
+def content_key(value: Any) -> Any:
+    """
+    Return a hashable key of a plain value, equal for equal values
+
+    :meta private:
+    """
+    if isinstance(value, dict):
+        return (dict, tuple((key, content_key(v)) for key, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(content_key(v) for v in value))
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), repr(value))
+    return value
+
+
+def diff_elements(elements: list, others: list, path: str, operations: list) -> None:
+    """
+    Add to operations what changes the elements of a list into the others.
+    Elements are matched by content (a longest common subsequence, see difflib),
+    changed elements at the same place are diffed.
+
+    :meta private:
+    """
+    keys = [e._content_key() for e in elements]
+    other_keys = [e._content_key() for e in others]
+
+    # common head and tail first
+    start = 0
+    size = min(len(keys), len(other_keys))
+    while start < size and keys[start] == other_keys[start]:
+        start += 1
+    tail = 0
+    while tail < size - start and keys[-1 - tail] == other_keys[-1 - tail]:
+        tail += 1
+    a = elements[start : len(elements) - tail]
+    b = others[start : len(others) - tail]
+    if not a and not b:
+        return
+
+    keys = keys[start : len(keys) - tail]
+    other_keys = other_keys[start : len(other_keys) - tail]
+    matcher = SequenceMatcher(None, keys, other_keys, False)
+    for opcode in matcher.get_opcodes():
+        if opcode[0] != "equal":
+            diff_opcode(opcode, a, b, path, start, operations)
+
+
+def diff_opcode(
+    opcode: tuple, a: list, b: list, path: str, start: int, operations: list
+) -> None:
+    """
+    Add to operations what changes a[ i1:i2 ] into b[ j1:j2 ] for an opcode
+    ( tag, i1, i2, j1, j2 ) of difflib (see :py:func:`diff_elements`).
+    The position in the list being modified is b[ :j1 ] + a[ i1: ].
+
+    :meta private:
+    """
+    tag, i1, i2, j1, j2 = opcode
+    paired = min(i2 - i1, j2 - j1) if tag == "replace" else 0
+    for k in range(paired):
+        a[i1 + k]._diff(b[j1 + k], pointer(path, start + j1 + k), operations)
+    for _ in range(i2 - i1 - paired):
+        operations.append({"op": "remove", "path": pointer(path, start + j1 + paired)})
+    for k in range(paired, j2 - j1):
+        operations.append(
+            {
+                "op": "add",
+                "path": pointer(path, start + j1 + k),
+                "value": b[j1 + k].get_value(),
+            }
+        )
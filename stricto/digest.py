@@ -0,0 +1,97 @@
+"""
+Module providing content digests (see :py:meth:`GenericType.digest`)
+"""
+
+import datetime
+import hashlib
+import json
+import math
+import numbers
+from typing import Any
+
+# Size of digests in bytes
+DIGEST_SIZE = 16
+
+
+def new_hash(tag: bytes):
+    """
+    Return a new hash object, started with the tag of a kind of object
+
+    :meta private:
+    """
+    return hashlib.blake2b(tag, digest_size=DIGEST_SIZE)
+
+
+def encode_value(value: Any) -> tuple[bytes, bool]:
+    """
+    Return the bytes to hash for a value, and True if equal values
+    (with ``==``) always give the same bytes.
+    Numbers are encoded as int when possible (``1 == 1.0 == True``).
+
+    :meta private:
+    """
+    encoder = ENCODERS.get(type(value))
+    if encoder is None:
+        # the encoder of the nearest parent class (IntEnum, str subclasses...)
+        encoder = next(
+            (ENCODERS[cls] for cls in type(value).__mro__ if cls in ENCODERS),
+            encode_object,
+        )
+    return encoder(value)
+
+
+def encode_float(value: float) -> tuple[bytes, bool]:
+    """
+    :meta private:
+    """
+    if math.isfinite(value) and value.is_integer():
+        return b"i%d" % value, True
+    # nan is not equal to itself
+    return b"f" + repr(value).encode(), not math.isnan(value)
+
+
+def encode_datetime(value: datetime.datetime) -> tuple[bytes, bool]:
+    """
+    :meta private:
+    """
+    if value.tzinfo is None:
+        return encode_object(value)
+    # equal instants in different time zones are equal
+    utc = value.astimezone(datetime.timezone.utc)
+    return b"u" + utc.isoformat().encode(), True
+
+
+def encode_object(value: Any) -> tuple[bytes, bool]:
+    """
+    :meta private:
+    """
+    cls = type(value)
+    encoded = b"o" + f"{cls.__module__}.{cls.__qualname__}:{value!r}".encode()
+    if isinstance(value, (datetime.date, datetime.time)):
+        return encoded, getattr(value, "tzinfo", None) is None
+    # other objects are equal if their repr() are, when it shows their value
+    # (numbers like Decimal can be equal to int, containers to other containers)
+    return encoded, cls.__repr__ is not object.__repr__ and not isinstance(
+        value, (numbers.Number, list, dict, tuple, set, frozenset)
+    )
+
+
+# Encoders by class (bool is an int)
+ENCODERS = {
+    type(None): lambda value: (b"n", True),
+    str: lambda value: (b"s" + value.encode("utf-8", "surrogatepass"), True),
+    int: lambda value: (b"i%d" % value, True),
+    float: encode_float,
+    bytes: lambda value: (b"b" + value, True),
+    datetime.datetime: encode_datetime,
+}
+
+
+def encode_schema(schema: dict) -> bytes:
+    """
+    Return the bytes to hash for a schema (see :py:meth:`GenericType.get_schema`),
+    the same whatever the order of keys
+
+    :meta private:
+    """
+    return json.dumps(schema, sort_keys=True, default=repr).encode()
@@ -2,12 +2,69 @@
 Module providing Error management
 """
 
-from copy import deepcopy
+import reprlib
+
+# Maximal size of a value in a message
+PREVIEW_SIZE = 200
+
+_preview = reprlib.Repr()
+_preview.maxlevel = 4
+_preview.maxlist = _preview.maxtuple = _preview.maxset = 20
+_preview.maxdict = 20
+_preview.maxstring = PREVIEW_SIZE
+_preview.maxother = PREVIEW_SIZE
+
+
+def preview(value: object) -> object:
+    """Return a value ready for a message, bounded to about
+    :py:data:`PREVIEW_SIZE` characters. Small values are unchanged.
+
+    :param value: the value
+    :type value: object
+    :return: the value or a shortened string
+    :rtype: object
+    """
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, NodePath):
+        return str(value)
+    if isinstance(value, (list, tuple, dict, set)):
+        if len(value) <= _preview.maxlist:
+            text = str(value)
+            if len(text) <= PREVIEW_SIZE:
+                return text
+        return _preview.repr(value)
+    text = str(value)
+    if len(text) <= PREVIEW_SIZE:
+        return text
+    return text[: PREVIEW_SIZE - 3] + "..."
+
+
+class NodePath:  # pylint: disable=too-few-public-methods
+    """The path of an object, computed only when the message of an error is built
+
+    :param node: the object (a :py:class:`GenericType`)
+    """
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node) -> None:
+        """Constructor"""
+        self._node = node
+
+    def __str__(self):
+        return self._node.path_name()
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
 
 
 class StrictoError:
     """Stricto Error main object
 
+    The message is built on the first call to :py:meth:`to_string` (or ``str()``),
+    with a bounded preview of each argument (see :py:func:`preview`).
+
     :param self: Description
     :param string_format: The string for the error Message
     :type string_format: str
@@ -22,13 +79,14 @@ class StrictoError:
         self.string_format = string_format
 
         self._my_kwargs = kwargs
-        self._my_args = deepcopy(args)
+        self._my_args = args
+        self._message = None
 
     def __repr__(self):
-        return self.string_format.format(*self._my_args, **self._my_kwargs)
+        return self.to_string()
 
     def __str__(self):
-        return self.string_format.format(*self._my_args, **self._my_kwargs)
+        return self.to_string()
 
     def to_string(self) -> str:
         """
@@ -38,7 +96,12 @@ class StrictoError:
         :return: a string
         :rtype: str
         """
-        return self.string_format.format(*self._my_args, **self._my_kwargs)
+        if self._message is None:
+            self._message = self.string_format.format(
+                *[preview(a) for a in self._my_args],
+                **{k: preview(v) for k, v in self._my_kwargs.items()},
+            )
+        return self._message
 
 
 class STypeError(TypeError, StrictoError):
@@ -1,7 +1,7 @@
 """Module providing the Int() Class"""
 
-from .generic import GenericType
-from .error import STypeError, SError
+from .generic import GenericType, SpecAttribute
+from .error import STypeError, SError, NodePath
 
 
 class Extend(GenericType):
@@ -9,6 +9,10 @@ class Extend(GenericType):
     A Extent type for any types type
     """
 
+    __slots__ = ()
+
+    _type = SpecAttribute("_type")
+
     def __init__(self, type_for_extend, **kwargs):
         """
         available arguments
@@ -39,14 +43,14 @@ class Extend(GenericType):
             try:
                 self.__json_decode__(value)
             except ValueError as e:
-                raise SError(e, self.path_name(), json=value) from e
+                raise SError(e, NodePath(self), json=value) from e
             return True
 
         if isinstance(value, (self._type, type(self))):
             return True
         raise STypeError(
             '{0}: Must be a extend type (type="{type}", value="{value}")',
-            self.path_name(),
+            NodePath(self),
             type=self._type,
             value=value,
         )
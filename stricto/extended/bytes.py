@@ -4,7 +4,7 @@ Module for bytes
 
 import base64
 import binascii
-from stricto.extend import Extend, STypeError
+from stricto.extend import Extend, STypeError, NodePath
 
 
 class Bytes(Extend):
@@ -12,6 +12,8 @@ class Bytes(Extend):
     A specific class to play with datetime
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         """
         initialisation. Myst pass the type (datetime)
@@ -37,5 +39,5 @@ class Bytes(Extend):
             return base64.b64decode(value.encode("utf-8"), validate=True)
         except binascii.Error as e:
             raise STypeError(
-                "{0} is not a valide base64 encoded string", self.path_name()
+                "{0} is not a valide base64 encoded string", NodePath(self)
             ) from e
@@ -5,7 +5,7 @@ Module for complex
 
 from stricto.dict import Dict
 from stricto.float import Float
-from stricto.error import STypeError
+from stricto.error import STypeError, NodePath
 
 
 class Complex(Dict):
@@ -13,6 +13,8 @@ class Complex(Dict):
     A specific class to play with Dict
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         """
         initialisation. Must define the struct
@@ -27,7 +29,7 @@ class Complex(Dict):
         add two complex
         """
         if not isinstance(other, Complex):
-            raise STypeError("{0}: can only add Complex", self.path_name())
+            raise STypeError("{0}: can only add Complex", NodePath(self))
 
         r = self.__copy__()
         r.real = self.real + other.real
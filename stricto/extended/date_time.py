@@ -5,7 +5,7 @@ Module for datetime
 
 from datetime import datetime
 from stricto.extend import Extend
-from stricto import STypeError, SConstraintError
+from stricto import STypeError, SConstraintError, NodePath
 from ..kparse import Kparse  # pylint: disable=relative-beyond-top-level
 
 
@@ -29,6 +29,8 @@ class Datetime(Extend):
     A specific class to play with datetime
     """
 
+    __slots__ = ("_min", "_max")
+
     def __init__(self, **kwargs):
         """
         initialisation. Must pass the type (datetime)
@@ -72,7 +74,7 @@ class Datetime(Extend):
         if isinstance(value, (datetime, Datetime, str)):
             return True
         raise STypeError(
-            '{0}: Must be a datetime (value="{value}")', self.path_name(), value=value
+            '{0}: Must be a datetime (value="{value}")', NodePath(self), value=value
         )
 
     def set_now(self):
@@ -88,13 +90,13 @@ class Datetime(Extend):
         if self._min is not None and value < self._min:
             raise SConstraintError(
                 '{0}: Must be above Minimal (value="{value}")',
-                self.path_name(),
+                NodePath(self),
                 value=value,
             )
         if self._max is not None and value > self._max:
             raise SConstraintError(
                 '{0}: Must be below Maximal (value="{value}")',
-                self.path_name(),
+                NodePath(self),
                 value=value,
             )
         return True
@@ -11,6 +11,8 @@ class FreeDict(Extend):
     A specific class for a free dict
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         """
         initialisation.
@@ -4,7 +4,7 @@ Module for ip adresses
 """
 import ipaddress
 from stricto.extend import Extend
-from stricto import STypeError
+from stricto import STypeError, NodePath
 
 
 class Ipaddress(Extend):
@@ -12,6 +12,8 @@ class Ipaddress(Extend):
     A specific class to play with ipadsress
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         """
         initialisation. Must pass the type (ipaddress)
@@ -55,7 +57,7 @@ class Ipaddress(Extend):
         if fault is True:
             raise STypeError(
                 '{0}: Must be a ipaddress (value="{value}")',
-                self.path_name(),
+                NodePath(self),
                 value=value,
             )
         return True
@@ -1,8 +1,8 @@
 """Module providing the Float() Class"""
 
 from typing import Any
-from .generic import GenericType
-from .error import STypeError, SConstraintError
+from .generic import GenericType, SpecAttribute
+from .error import STypeError, SConstraintError, NodePath
 from .kparse import Kparse
 
 KPARSE_MODEL = {
@@ -25,6 +25,11 @@ class Float(GenericType):
 
     """
 
+    __slots__ = ()
+
+    _min = SpecAttribute("_min")
+    _max = SpecAttribute("_max")
+
     def __init__(self, **kwargs):
         """Constructor method"""
 
@@ -35,7 +40,7 @@ class Float(GenericType):
         self._min = options.get("min")
         self._max = options.get("max")
 
-    def get_schema(self):
+    def _build_schema(self):
         """Return meta information for a float
 
         :param self: Description
@@ -45,7 +50,7 @@ class Float(GenericType):
 
         :meta private:
         """
-        a = GenericType.get_schema(self)
+        a = GenericType._build_schema(self)
         a["min"] = self.get_as_string(self._min)
         a["max"] = self.get_as_string(self._max)
         return a
@@ -55,7 +60,7 @@ class Float(GenericType):
         if isinstance(value, (float, Float)):
             return True
         raise STypeError(
-            '{0}: Not a float (value="{value}")', self.path_name(), value=value
+            '{0}: Not a float (value="{value}")', NodePath(self), value=value
         )
 
     def check_constraints(self, value):
@@ -65,13 +70,13 @@ class Float(GenericType):
         if self._min is not None and value < self._min:
             raise SConstraintError(
                 '{0}: Must be above Minimal (value="{value}")',
-                self.path_name(),
+                NodePath(self),
                 value=value,
             )
         if self._max is not None and value > self._max:
             raise SConstraintError(
                 '{0}: Must be below Maximal (value="{value}")',
-                self.path_name(),
+                NodePath(self),
                 value=value,
             )
         return True
@@ -7,8 +7,11 @@ This class must not be used directly
 
 import copy
 import re
+import threading
 from enum import Enum, auto
-from typing import Any, Callable, Self
+from functools import cache, lru_cache, wraps
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Iterator, Self
 from .kparse import Kparse
 from .error import (
     SConstraintError,
@@ -17,13 +20,28 @@ from .error import (
     SRightError,
     SAttributeError,
     SError,
+    StrictoError,
+    NodePath,
 )
 from .permissions import Permissions
+from .json_writer import write_value
 from .selector import Selector
+from .jsonpath import JsonPath, compile_path, is_jsonpath
+from .list_index import ListIndex
+from .query import Query
+from .transaction import Transaction, log_change
+from .patch import OPERATIONS, PatchStep, read_operation, value_at
+from .diff import content_key
+from .digest import encode_schema, encode_value, new_hash
+from .view_proxy import ViewProxy
+from .candidate_view import CandidateView, READ
 
 
 PREFIX = "MODEL_"
 
+# Number of view names kept parsed
+VIEW_CACHE_SIZE = 1024
+
 
 class ViewType(Enum):
     """
@@ -60,6 +78,206 @@ KPARSE_MODEL = {
 }
 
 
+class _Decisions(threading.local):  # pylint: disable=too-few-public-methods
+    """
+    Decisions (exists, rights) already taken during the current operation,
+    as ``{ ( id( object ), right_name ): bool }``. None outside an operation.
+    """
+
+    cache: dict | None = None
+
+
+_decisions = _Decisions()
+
+
+class _Candidates(threading.local):  # pylint: disable=too-few-public-methods
+    """
+    The read-only view given as root to rules while a candidate value is checked
+    (see :py:meth:`GenericType.validate_many`). None outside a check.
+    """
+
+    view: CandidateView | None = None
+
+
+_candidates = _Candidates()
+
+
+class _Models:  # pylint: disable=too-few-public-methods
+    """
+    Number of changes of models (see :py:meth:`GenericType._rule_caches`)
+    """
+
+    changes = 0
+
+
+def with_decisions(method: Callable) -> Callable:
+    """
+    Decorator for an operation (set, get_value, get_view, ...).
+    During the operation, the "exists" and the rights of each object
+    are computed once (see :py:meth:`GenericType.is_allowed_to`).
+
+    :meta private:
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if _decisions.cache is not None:
+            return method(self, *args, **kwargs)
+        _decisions.cache = {}
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _decisions.cache = None
+
+    return wrapper
+
+
+def forget_decisions() -> None:
+    """
+    Something was modified, decisions taken in the current operation must be computed again
+
+    :meta private:
+    """
+    if _decisions.cache:
+        _decisions.cache.clear()
+
+
+@cache
+def slots_of(cls: type) -> tuple[str, ...]:
+    """
+    Return all slots names of a class (with those of its parents)
+
+    :meta private:
+    """
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name not in ("__dict__", "__weakref__") and name not in names:
+                names.append(name)
+    return tuple(names)
+
+
+@cache
+def encoded_as_value(cls: type) -> bool:
+    """
+    Return True if objects of this class are encoded in JSON as their value
+    (:py:meth:`GenericType.__json_encode__` and :py:meth:`GenericType.get_value`
+    are not overwritten)
+
+    :meta private:
+    """
+    return (
+        cls.__json_encode__ is GenericType.__json_encode__
+        and cls.get_value is GenericType.get_value
+    )
+
+
+class FieldSpec:  # pylint: disable=too-few-public-methods
+    """
+    The rules of an object (constraints, views, events, ...).
+    Copies of an object share the same FieldSpec,
+    which is copied before a modification (see :py:meth:`GenericType._own_spec`).
+
+    :meta private:
+    """
+
+    __slots__ = ("__dict__", "_shared")
+
+    # changes of models when caches were built (see GenericType._rule_caches())
+    _model_changes = -1
+
+    def __init__(self):
+        self._shared = False
+
+    def __copy__(self):
+        result = FieldSpec()
+        result.__dict__.update(self.__dict__)
+        return result
+
+
+class SpecAttribute(property):
+    """
+    An attribute of an object stored in its :py:class:`FieldSpec`
+
+    :meta private:
+    """
+
+    def __init__(self, name: str):
+        def set_attribute(node, value):
+            setattr(node._own_spec(), name, value)  # pylint: disable=protected-access
+
+        super().__init__(attrgetter("_spec." + name), set_attribute)
+
+
+@lru_cache(maxsize=VIEW_CACHE_SIZE)
+def parse_view(view_name: str) -> tuple[bool, str]:
+    """
+    Split a view name (see :py:meth:`GenericType.get_view`) in
+    ``( explicit, name )``, explicit for ``+name``. Results are cached.
+
+    :meta private:
+    """
+    match = re.match(r"^\+(.*)\s*$", view_name)
+    if match:
+        return True, match.group(1)
+    return False, view_name
+
+
+# types copied by copy_schema()
+SCHEMA_CONTAINERS = frozenset((dict, list))
+
+
+def copy_schema(schema: dict | list) -> dict | list:
+    """
+    Return a copy of a schema (see :py:meth:`GenericType.get_schema`),
+    with new dicts and lists only
+
+    :meta private:
+    """
+    if type(schema) is dict:  # pylint: disable=unidiomatic-typecheck
+        return {
+            key: copy_schema(value) if type(value) in SCHEMA_CONTAINERS else value
+            for key, value in schema.items()
+        }
+    return [
+        copy_schema(value) if type(value) in SCHEMA_CONTAINERS else value
+        for value in schema
+    ]
+
+
+@cache
+def not_rules_of(cls: type) -> frozenset[str]:
+    """
+    Return names of the attributes of a class which are not rules for its values
+    (the state of the object, caches...), declared by each class in ``_not_rules``
+
+    :meta private:
+    """
+    names = set()
+    for klass in cls.__mro__:
+        names.update(klass.__dict__.get("_not_rules", ()))
+    return frozenset(names)
+
+
+@cache
+def attributes_of(cls: type) -> frozenset[str]:
+    """
+    Return names of all internal attributes of a class
+    (slots and attributes stored in the :py:class:`FieldSpec`)
+
+    :meta private:
+    """
+    names = set(slots_of(cls))
+    for klass in cls.__mro__:
+        for name, value in klass.__dict__.items():
+            if isinstance(value, SpecAttribute):
+                names.add(name)
+    return frozenset(names)
+
+
 class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-public-methods
     """Generic Type
     This is the main Object for Int, Float, String, ...
@@ -89,6 +307,70 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
           list of views Access-list
     """
 
+    # No __dict__ : all nodes share the same compact layout
+    # with only the state of the object. Rules are in a FieldSpec shared by copies
+    __slots__ = (
+        "_spec",
+        "_permissions",
+        "_parent",
+        "_root",
+        "_depth",
+        "_attribute_name",
+        "_value",
+        "_old_value",
+        "_pushed_events",
+        "_trigging_events",
+        "_digest",
+        "_undo_log",
+    )
+    # attributes which are not rules for values (see mapper.same_rules())
+    _not_rules = (
+        "_spec",
+        "_permissions",
+        "_parent",
+        "_root",
+        "_depth",
+        "_attribute_name",
+        "_value",
+        "_old_value",
+        "_pushed_events",
+        "_trigging_events",
+        "_digest",
+        "_undo_log",
+        "_json_path_separator",
+        "_default_value",
+        "_description",
+        "_views",
+        "_events",
+        "_default",
+        "_on_change",
+        "_compiled",
+        "_schema_cache",
+        "_schema_digest",
+    )
+
+    _exists = SpecAttribute("_exists")
+    _json_path_separator = SpecAttribute("_json_path_separator")
+    _transform = SpecAttribute("_transform")
+    _default_value = SpecAttribute("_default_value")
+    _description = SpecAttribute("_description")
+    _views = SpecAttribute("_views")
+    _not_none = SpecAttribute("_not_none")
+    _union = SpecAttribute("_union")
+    _constraints = SpecAttribute("_constraints")
+    _events = SpecAttribute("_events")
+    _default = SpecAttribute("_default")
+    _on_change = SpecAttribute("_on_change")
+    _compiled = SpecAttribute("_compiled")
+    _schema_cache = SpecAttribute("_schema_cache")
+    _schema_digest = SpecAttribute("_schema_digest")
+
+    # caches built from rules, kept in the shared spec (see _rule_caches())
+    _rule_cache_names = ("_compiled", "_schema_cache", "_schema_digest")
+
+    # how a compiled query matches this type (see stricto.query)
+    _match_kind = "value"
+
     def __init__(self, **kwargs):
         """Constructor method"""
 
@@ -98,6 +380,13 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
         self._parent: Self = None
         """parent is a reference to the parent :py:class:`GenericType`
         """
+        self._root: Self = None
+        """cached root (None if this object is the root), see :py:meth:`_attach`
+        """
+        self._depth = 0
+        self._init_caches()
+        # the log of open transactions, kept by the root (see transaction())
+        self._undo_log = None
 
         options = Kparse(kwargs, KPARSE_MODEL, strict=True)
 
@@ -121,13 +410,14 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
         )
 
         # for events
-        self._on = options.get("on")
+        on = options.get("on")
         self._events = {}
-        self._pushed_events = {}
+        # created on demand by push_event() (only the root get events)
+        self._pushed_events = None
         self._trigging_events = False
 
-        if self._on is not None:
-            l = self._on if isinstance(self._on, list) else [self._on]
+        if on is not None:
+            l = on if isinstance(on, list) else [on]
             for event in l:
                 if not isinstance(event, tuple):
                     continue
@@ -172,14 +462,54 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
                 lambda event_name, root, self: self._change_trigg_wrap(root, auto_set)
             )
 
+    def _init_caches(self) -> None:
+        """
+        Start with empty caches (digest, compiled validator, schema...).
+        Containers add their own caches.
+
+        :meta private:
+        """
+        # cached digest (see digest()), False if it cannot be cached
+        self._digest = None
+        # the validator built by compile()
+        self._compiled = None
+        # the schema and its digest (see get_schema() and schema_digest())
+        self._schema_cache = None
+        self._schema_digest = None
+
+    def _own_spec(self) -> FieldSpec:
+        """
+        Return the :py:class:`FieldSpec` of this object, ready to be modified
+        (copied first if shared with copies of this object)
+
+        :meta private:
+        """
+        try:
+            spec = object.__getattribute__(self, "_spec")
+        except AttributeError:
+            spec = FieldSpec()
+            object.__setattr__(self, "_spec", spec)
+            return spec
+        if spec._shared:
+            spec = copy.copy(spec)
+            object.__setattr__(self, "_spec", spec)
+        return spec
+
     def enable_permissions(self) -> None:
         """set permissions to on"""
+        forget_decisions()
+        self._forget_digest()
+        if self._permissions._enabled is False:
+            # disabled permissions are shared by copies
+            self._permissions = copy.copy(self._permissions)
         self._permissions.enable()
 
     def disable_permissions(self) -> None:
         """
         set permissions to off
         """
+        forget_decisions()
+        self._forget_digest()
         self._permissions.disable()
 
     def _wrap_recheck_value(self) -> None:
@@ -201,7 +531,40 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
         :return: True if have right, or False
         :rtype: bool
         """
-        rep = self._permissions.is_allowed_to(right_name, self.get_root())
+        permissions = self._permissions
+        if permissions._enabled is False:
+            return True
+
+        decisions = _decisions.cache
+        if decisions is None:
+            return self._is_allowed_to(right_name)
+
+        key = (id(self), right_name)
+        rep = decisions.get(key)
+        if rep is None:
+            rep = self._is_allowed_to(right_name)
+            decisions[key] = rep
+        return rep
+
+    def _is_allowed_to(self, right_name: str) -> bool:
+        """
+        Compute the right "right_name" (see :py:meth:`is_allowed_to`)
+
+        :meta private:
+        """
+        permissions = self._permissions
+        if callable(permissions.get(right_name, None)):
+            # Decisions taken while a rule is running are not kept
+            # (the rights of this object are off during the call)
+            saved = _decisions.cache
+            _decisions.cache = None
+            try:
+                rep = permissions.is_allowed_to(right_name, self._rules_root())
+            finally:
+                _decisions.cache = saved
+        else:
+            rep = permissions.is_allowed_to(right_name, self._rules_root())
+
         # --- the result is a bool. got it
         if rep is not None:
             return rep
@@ -260,7 +623,52 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
         :return: the schema as a json object (dict)
         :rtype: dict
 
-        Return a schema for this object
+        Return a schema for this object. It is built once and kept
+        until the model changes (see :py:meth:`Dict.add_to_model`)
+        """
+        return copy_schema(self._schema_of())
+
+    def schema_digest(self) -> str:
+        """Return a digest (a hash) of the schema of this object, as an hex string.
+        Objects with the same rules have the same digest (the order of keys
+        of a Dict does not matter), so it can be used as a key of a cache
+        or to check that two models are compatible ::
+
+            d = a.schema_digest()
+            a.add_to_model("name", String())
+            d == a.schema_digest() # False, the model changed
+
+        :return: the digest
+        :rtype: str
+        """
+        spec = self._rule_caches()
+        digest = spec._schema_digest
+        if digest is None:
+            digest = new_hash(b"S" + encode_schema(self._schema_of())).hexdigest()
+            spec._schema_digest = digest
+        return digest
+
+    def _schema_of(self) -> dict:
+        """
+        Return the kept schema of this object (see :py:meth:`get_schema`),
+        build it if needed. Must not be modified.
+
+        :meta private:
+        """
+        spec = self._rule_caches()
+        schema = spec._schema_cache
+        if schema is None:
+            # the schema depends on rules only : cached in the shared spec
+            schema = self._build_schema()
+            spec._schema_cache = schema
+        return schema
+
+    def _build_schema(self) -> dict:
+        """
+        Build the schema of this object (see :py:meth:`get_schema`)
+        Overwritten by types with more rules and containers.
+
+        :meta private:
         """
         ty = str(type(self))
 
@@ -279,6 +687,20 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
         }
         return a
 
+    def _forget_schema(self) -> None:
+        """
+        Forget the schema kept by this object and all its parents
+        (the model has changed).
+
+        :meta private:
+        """
+        _Models.changes += 1
+        node = self
+        while node is not None and node._schema_cache is not None:
+            node._schema_cache = None
+            node._schema_digest = None
+            node = node._parent
+
     def get_current_meta(self, parent: dict = None) -> dict:
         """
         Return a schema with all rights correctly set depending on fonctions
@@ -295,7 +717,7 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
         if parent is None and self.am_i_root() is False:
             raise SSyntaxError(
                 "{0}: get_current_meta() must start at root",
-                self.path_name(),
+                NodePath(self),
             )
 
         ty = str(type(self))
@@ -352,23 +774,30 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
 
         if view_name is None:
             return ViewType.YES
+        return self._view_of(*parse_view(view_name))
 
+    def _view_of(self, explicit: bool, name: str) -> ViewType:
+        """
+        Same as :py:meth:`_belongs_to_view` for a parsed view name
+        (see :py:func:`parse_view`)
+
+        :meta private:
+        """
         # Explicite "+blabla"
-        match = re.match(r"^\+(.*)\s*$", view_name)
-        if match:
-            # return match.group(1) in self._views
-            if match.group(1) in self._views:
+        if explicit:
+            if name in self._views:
                 return ViewType.YES
-            if f"!{match.group(1)}" in self._views:
+            if f"!{name}" in self._views:
                 return ViewType.NO
             return ViewType.EXPLICIT_UNKNOWN
 
         # if "!view"
-        if f"!{view_name}" in self._views:
+        if f"!{name}" in self._views:
             return ViewType.NO
 
         return ViewType.UNKNOWN
 
+    @with_decisions
     def get_view(self, view_name: str, final: bool = True) -> Any:
         """
         Return all elements belonging to view_name
@@ -404,6 +833,128 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
         # my_view is ViewType.EXPLICIT_UNKNOWN:
         return (ViewType.NO, None) if final is False else None
 
+    @with_decisions
+    def view_proxy(self, view_name: str) -> ViewProxy | None:
+        """Return the elements belonging to view_name, as :py:meth:`get_view`,
+        in a read-only :py:class:`ViewProxy` : nothing is copied, values are
+        read from this object when asked ::
+
+            v = a.view_proxy("+short")
+            v.name # the value of a.name, if in the view
+            json.dumps(v, cls=StrictoEncoder) # the same as a.get_view("+short")
+            v.name = "John" # raise an SRightError
+
+        :param view_name: the named view
+        :type view_name: str
+        :return: the proxy, or None if nothing is in the view
+        :rtype: ViewProxy | None
+        """
+        if not self._in_view(view_name):
+            return None
+        return ViewProxy(self, view_name)
+
+    @with_decisions
+    def _in_view(self, view_name: str | None) -> bool:
+        """
+        Return True if :py:meth:`get_view` has a result.
+        Overwritten by containers.
+
+        :meta private:
+        """
+        return self._belongs_to_view(view_name) in (ViewType.YES, ViewType.UNKNOWN)
+
+    def _always_in_view(self, view_name: str | None) -> bool:
+        """
+        Return True if this object and its copies are in a view
+        (see :py:meth:`_in_view`) whatever their values, while permissions
+        are disabled. False if it cannot be known from rules.
+        Overwritten by containers.
+
+        :meta private:
+        """
+        return self._exists is True and self._in_view(view_name)
+
+    @with_decisions
+    def _view_value(self, view_name: str | None, encoded: bool) -> Any:
+        """
+        Return the value of :py:meth:`get_view` (encoded for json or not)
+        without copy, for a view with a result (see :py:meth:`_in_view`).
+
+        :meta private:
+        """
+        return self._project(view_name, encoded)[1]
+
+    def _project(self, view_name: str | None, encoded: bool) -> tuple[bool, Any]:
+        """
+        Return ``( True, value )`` if :py:meth:`get_view` has a result
+        (see :py:meth:`_view_value`), ``( False, None )`` if not.
+        Overwritten by containers.
+
+        :meta private:
+        """
+        if self._belongs_to_view(view_name) in (ViewType.YES, ViewType.UNKNOWN):
+            return True, self.get_encoded() if encoded else self.get_value()
+        return False, None
+
+    # the arguments are used by containers overwriting these hooks
+    def _view_items(  # pylint: disable=unused-argument
+        self, view_name: str | None
+    ) -> Iterator[tuple] | None:
+        """
+        Return ``( key, sub object, view name for it )`` of sub objects
+        in a view (the view name is None if the sub object is in the view
+        with all its content), None if this object is not a container.
+        Overwritten by containers.
+
+        :meta private:
+        """
+        return None
+
+    def _view_child(  # pylint: disable=unused-argument
+        self, view_name: str | None, key: str | int
+    ) -> tuple[Self, str | None] | None:
+        """
+        Return ``( sub object, view name for it )`` of a key (or an index)
+        in a view, None if not in the view (see :py:meth:`_view_items`).
+        Overwritten by containers.
+
+        :meta private:
+        """
+        return None
+
+    def _candidate_value(self, value: Any) -> Any:
+        """
+        Return the value this object would have once a value set
+        (see :py:meth:`validate_many`). Overwritten by containers.
+
+        :meta private:
+        """
+        return value
+
+    def _candidate_keys(  # pylint: disable=unused-argument
+        self, value: Any
+    ) -> Iterator[str | int] | None:
+        """
+        Return keys (or indexes) of a candidate value of this object,
+        None if this object is not a container (see :py:class:`CandidateView`).
+        Overwritten by containers.
+
+        :meta private:
+        """
+        return None
+
+    def _candidate_child(  # pylint: disable=unused-argument
+        self, value: Any, key: str | int
+    ) -> tuple[Self, Any] | None:
+        """
+        Return ``( sub object, its candidate value )`` of a key (or an index)
+        in a candidate value of this object, None if not found.
+        Overwritten by containers.
+
+        :meta private:
+        """
+        return None
+
     def _change_trigg_wrap(self, root, auto_set: Callable) -> None:
         """
         transform a set=... option to an event.
@@ -433,8 +984,10 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
 
         :meta private:
         """
+        if self._pushed_events is None:
+            self._pushed_events = {}
         if event_name not in self._pushed_events:
-            self.__dict__["_pushed_events"][event_name] = {
+            self._pushed_events[event_name] = {
                 "from_id": from_id,
                 "kwargs": kwargs,
             }
@@ -451,23 +1004,25 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
         if self._trigging_events is True:
             return
 
-        self.__dict__["_trigging_events"] = True
+        events = self._pushed_events
+        if not events:
+            return
 
-        events = self._pushed_events.copy()
-        self.__dict__["_pushed_events"] = {}
+        self._trigging_events = True
+        self._pushed_events = None
 
         for event_name, v in events.items():
             try:
                 self.trigg(event_name, v["from_id"], **v["kwargs"])
             except Exception as e:  # pylint: disable=broad-exception-caught
                 self.rollback()
-                self.__dict__["_trigging_events"] = False
+                self._trigging_events = False
                 raise e
 
-        self.__dict__["_trigging_events"] = False
+        self._trigging_events = False
 
         # somme events added during last trigged events, restart
-        if len(self._pushed_events.keys()) != 0:
+        if self._pushed_events:
             self._release_events()
 
     def trigg(self, event_name: str, from_id: str, **kwargs) -> None:
@@ -505,9 +1060,86 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
 
 
         """
-        if self._parent is None:
-            return self
-        return self._parent.get_root()
+        root = self._root
+        return self if root is None else root
+
+    def get_depth(self) -> int:
+        """
+        Return the depth of this object (0 for the root object)
+
+        :param self: Description
+        :return: the number of parents
+        :rtype: int
+
+        """
+        return self._depth
+
+    def _attach(self, parent: Self | None, attribute_name: str) -> None:
+        """
+        Set the parent of this object, and update the cached root and depth
+        of this object and its sub objects
+
+        :meta private:
+        """
+        forget_decisions()
+        self._parent = parent
+        self._attribute_name = attribute_name
+        if parent is None:
+            self._reroot(None, 0)
+        else:
+            self._reroot(parent.get_root(), parent._depth + 1)
+
+    def _reroot(self, root: Self | None, depth: int) -> None:
+        """
+        Set the cached root and depth of this object and its sub objects
+
+        :meta private:
+        """
+        self._root = root
+        self._depth = depth
+        sub_root = self if root is None else root
+        for sub in self._sub_nodes():
+            sub._reroot(sub_root, depth + 1)
+
+    def _sub_nodes(self) -> Iterable[Self]:
+        """
+        Return the objects having this one as parent.
+        Must be overwritten by containers.
+
+        :meta private:
+        """
+        return ()
+
+    def _notify_indexes(self) -> None:
+        """
+        The value changed : update the indexes of the lists above
+        (see :py:meth:`List.create_index`)
+
+        :meta private:
+        """
+        child = self
+        parent = self._parent
+        while parent is not None:
+            parent._index_child(child)
+            child = parent
+            parent = child._parent
+
+    def _index_child(self, child: Self) -> None:
+        """
+        A value of a child changed (see :py:meth:`_notify_indexes`).
+        Must be overwritten by indexed containers.
+
+        :meta private:
+        """
+
+    def _json_children(self) -> dict | list | None:
+        """
+        Return the children for JSONPath queries : a dict of objects,
+        a list of objects or None. Must be overwritten by containers.
+
+        :meta private:
+        """
+        return None
 
     def am_i_root(self) -> bool:
         """
@@ -522,6 +1154,17 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
             return True
         return False
 
+    def _readable_in(self, alive: bool) -> bool:
+        """
+        Same as :py:meth:`exists_or_can_read`, ``alive`` being
+        the result of :py:meth:`exists` for the parent (for a walk from the parent).
+
+        :meta private:
+        """
+        if self._exists is not True or self._permissions._enabled:
+            return self.exists_or_can_read()
+        return alive
+
     def exists_or_can_read(self) -> bool:
         """
         check first if the object exists.
@@ -550,10 +1193,28 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
         :rtype: bool
 
         """
+        decisions = _decisions.cache
+        if decisions is None or value is not None:
+            return self._exists_with(value)
 
-        response = self._get_args_or_execute_them(self._exists, value)
-        if response is False:
-            return False
+        key = (id(self), "$exists")
+        response = decisions.get(key)
+        if response is None:
+            response = self._exists_with(value)
+            decisions[key] = response
+        return response
+
+    def _exists_with(self, value: Any) -> bool:
+        """
+        Compute :py:meth:`exists`
+
+        :meta private:
+        """
+        exists = self._exists
+        if exists is not True:
+            response = self._get_args_or_execute_them(exists, value)
+            if response is False:
+                return False
 
         if self._parent is None:
             return True
@@ -576,9 +1237,10 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
 
         parent = self._parent
         while parent is not None:
-            p.insert(0, parent._json_path_separator)
-            p.insert(0, parent._attribute_name)
+            p.append(parent._json_path_separator)
+            p.append(parent._attribute_name)
             parent = parent._parent
+        p.reverse()
         return "".join(p)
 
     def get_selectors(self, index_or_slice: str, sel: Selector) -> Self | None:
@@ -609,23 +1271,36 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
 
         return None
 
-    def select(self, selector_as_string: str) -> Self | None:
+    def select(self, selector_as_string: str | JsonPath) -> Self | list | None:
         """
         Get values with selector acording to rfc 9535
         (https://datatracker.ietf.org/doc/rfc9535/)
 
+        Queries with filters, descendants, unions or quoted names are
+        compiled once (see :py:func:`compile_path`) and return the list of
+        objects matched, or the object (or None) for singular queries.
+
         :param self: Description
-        :param selector_as_string: the rfc 9535
-        :type selector_as_string: str
+        :param selector_as_string: the rfc 9535 query, or a compiled one
+        :type selector_as_string: str | JsonPath
         :return: The object matched.
-        :rtype: Self | None
+        :rtype: Self | list | None
+        :raises SSyntaxError: if the query is invalid
 
         :example:
             - ``$.address.street``
             - ``$.surname[0]``
+            - ``$.users[?@.age > 30 && length(@.name) < 10].name``
+            - ``$..street``
+            - ``$.address['street','town']``
 
 
         """
+        if is_jsonpath(selector_as_string):
+            selector_as_string = compile_path(selector_as_string)
+        if isinstance(selector_as_string, JsonPath):
+            return selector_as_string.select(self)
+
         sel = Selector(selector_as_string)
         if sel.empty():
             return self
@@ -835,13 +1510,53 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
         """
         return self.get_value() >= self._get_other_value(other)
 
-    def __copy__(self) -> Self:
+    def _clone(self) -> Self:
+        """
+        Return a new object of the same class sharing all attributes
+        (no copy of any of them)
+
+        :meta private:
+        """
         cls = self.__class__
         result = cls.__new__(cls)
-        result.__dict__.update(self.__dict__)
-        result.__dict__["_permissions"] = copy.copy(self._permissions)
+        for name in slots_of(cls):
+            try:
+                object.__setattr__(result, name, object.__getattribute__(self, name))
+            except AttributeError:
+                pass
+        if cls.__dictoffset__:
+            # not result.__dict__ : __getattr__ would compute the value
+            object.__getattribute__(result, "__dict__").update(
+                object.__getattribute__(self, "__dict__")
+            )
+        object.__setattr__(result, "_digest", None)
+        object.__setattr__(result, "_undo_log", None)
+        object.__getattribute__(self, "_spec")._shared = True
+        return result
+
+    def __copy__(self) -> Self:
+        result = self._copy_node()
+        result._reroot(None, 0)
+        return result
+
+    def _copy_node(self) -> Self:
+        """
+        Copy this object and its sub objects, without parent.
+        The cached root and depth are set by :py:meth:`__copy__` at the end.
+        Containers overwrite it to copy their sub objects.
+
+        :meta private:
+        """
+        result = self._clone()
+        if self._permissions._enabled:
+            # Only disabled permissions are shared (see enable_permissions())
+            result._permissions = copy.copy(self._permissions)
+        result._pushed_events = None
+        result._trigging_events = False
         result._parent = None
         result._attribute_name = "$"
+        # same value (sub objects are copied by containers)
+        result._digest = self._digest
         return result
 
     def copy(self) -> Self:
@@ -855,6 +1570,7 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
         """
         return copy.copy(self)
 
+    @with_decisions
     def set(self, value: Any) -> None:
         """
         Fill with a value or raise an Error if not valid
@@ -867,7 +1583,7 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
         """
 
         if self.exists_or_can_read() is False:
-            raise SAttributeError("{0}: Locked", self.path_name())
+            raise SAttributeError("{0}: Locked", NodePath(self))
 
         root = self.get_root()
 
@@ -887,6 +1603,98 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
         if self.am_i_root():
             self._release_events()
 
+    def validate(self, value: Any) -> StrictoError | None:
+        """
+        Check a value against this schema, with the same rules as :py:meth:`set`,
+        but without modifying this object.
+
+        :param self: Description
+        :param value: the value to check (a plain python value)
+        :type value: Any
+        :return: None if the value is valid, otherwise the error :py:meth:`set` would raise
+        :rtype: StrictoError | None
+
+        """
+        return next(self.validate_many([value]))
+
+    def validate_many(
+        self, values: Iterable[Any]
+    ) -> Iterator[StrictoError | None]:
+        """
+        Check many values against this schema (see :py:meth:`validate`).
+        Results are yielded lazily, one per value, in the same order.
+
+        Values are checked with the compiled plan (see :py:meth:`compile`),
+        nothing is set and no event is triggered. Rules reading other values
+        (constraints, exists, rights...) get as root a read-only view of the object
+        with the candidate value in it (a :py:class:`CandidateView`), as if set.
+        As in :py:meth:`set`, keys missing in a dict keep their current value.
+
+        :param self: Description
+        :param values: the values to check
+        :type values: Iterable[Any]
+        :return: an iterator on None (valid) or errors
+        :rtype: Iterator[StrictoError | None]
+
+        :example:
+            - ``errors = [ (i, e) for i, e in enumerate(schema.validate_many(records)) if e ]``
+
+        """
+        locked = self.exists_or_can_read() is False
+        root = self.get_root()
+        plan = self._plan()
+        cls = type(self)
+        transform = self._transform if callable(self._transform) else None
+        ids = []
+        parent = self._parent
+        while parent is not None:
+            ids.append(id(parent))
+            parent = parent._parent
+        parents = frozenset(ids)
+
+        for value in values:
+            try:
+                if locked:
+                    raise SAttributeError("{0}: Locked", NodePath(self))
+                corrected_value = (
+                    value.get_value()
+                    if type(value) == cls  # pylint: disable=unidiomatic-typecheck
+                    else value
+                )
+                if transform is not None:
+                    corrected_value = transform(corrected_value, root)
+                candidate = self._candidate_value(corrected_value)
+                self._check_candidate(plan, candidate, parents)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # StrictoError is not an exception by itself
+                if not isinstance(e, StrictoError):
+                    raise
+                yield e
+                continue
+            yield None
+
+    def _check_candidate(
+        self, plan: Callable, candidate: Any, parents: frozenset[int]
+    ) -> None:
+        """
+        Check a candidate value with the compiled plan of this object, rules seeing
+        the view of the root with this candidate in it (see :py:meth:`validate_many`)
+
+        :meta private:
+        """
+        target = (self, candidate, parents)
+        root = self.get_root()
+        view = CandidateView(root, candidate if root is self else READ, target)
+        saved = (_candidates.view, _decisions.cache)
+        # decisions depend on the candidate : not kept
+        _candidates.view, _decisions.cache = view, None
+        try:
+            parent = self._parent
+            alive = parent is None or parent.exists(None) is not False
+            plan(self, candidate, view, alive)
+        finally:
+            _candidates.view, _decisions.cache = saved
+
     def patch_internal(self, op: str, value) -> None:
         """
         Patch this object himself. calld by self.patch method after selection with select.
@@ -906,7 +1714,7 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
             self.check(value)
             return
 
-        raise STypeError('{0}: invalid operator "{op}"', self.path_name(), op=op)
+        raise STypeError('{0}: invalid operator "{op}"', NodePath(self), op=op)
 
     def patch(self, op: str, selector: str, value=None) -> None:
         """
@@ -935,12 +1743,264 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
         if obj is None:
             raise SAttributeError(
                 '{0}: Attribut does not exists "{selector}"',
-                self.path_name(),
+                NodePath(self),
                 selector=selector,
             )
 
         return obj.patch_internal(op, value)
 
+    @with_decisions
+    def patch_many(self, operations: list[dict]) -> None:
+        """Apply a list of operations (https://datatracker.ietf.org/doc/html/rfc6902)
+        all at once ::
+
+            a.patch_many( [
+                { "op" : "replace", "path" : "$.name", "value" : "John" },
+                { "op" : "move", "from" : "$.l[0]", "path" : "$.l[-]" },
+            ] )
+
+        Paths are selectors of one object like ``$.l[1].name``
+        or JSON pointers like ``/l/1/name``, ``[-]`` (or ``/-``) is the end of a list.
+        Operations are :
+
+            - *add* -- insert in a list or set a key
+              (append for the path of the list itself)
+            - *remove* -- remove from a list
+            - *replace* -- set the value
+            - *move*, *copy* -- from the path in "from"
+            - *test* -- check the value (see :py:meth:`check`)
+
+        All paths are resolved and the resulting value is checked once,
+        then changes are done in a transaction and events are released once.
+        Nothing is modified if an operation fails.
+
+        :param operations: the operations, like
+            ``{ "op" : "add", "path" : ..., "value" : ... }``
+        :type operations: list[dict]
+        :raises STypeError: in case of invalid operator
+        :raises SAttributeError: if a path is not found
+        :raises SSyntaxError: if an operation is incomplete or a path invalid
+        """
+        document = self.get_value()
+        steps = []
+        for operation in operations:
+            op, path, source, value = read_operation(operation)
+            if op not in OPERATIONS:
+                raise STypeError('{0}: invalid operator "{op}"', NodePath(self), op=op)
+            if op in ("move", "copy"):
+                source_step = PatchStep("remove", source, None)
+                try:
+                    value = value_at(document, source_step.tokens)
+                except KeyError as e:
+                    raise SAttributeError(
+                        '{0}: Attribut does not exists "{selector}"',
+                        NodePath(self),
+                        selector=source,
+                    ) from e
+                if op == "move":
+                    step = PatchStep("add", path, value)
+                    if (
+                        len(step.tokens) > len(source_step.tokens)
+                        and step.tokens[: len(source_step.tokens)] == source_step.tokens
+                    ):
+                        raise SSyntaxError(
+                            'Cannot move "{0}" into itself "{1}"', source, path
+                        )
+                    steps.append(source_step)
+                    document = self._patch_value(document, source_step, 0)
+                op = "add"
+            step = PatchStep(op, path, value)
+            steps.append(step)
+            document = self._patch_value(document, step, 0)
+
+        if not steps:
+            return
+        self.check(document)
+
+        with self.transaction():
+            for step in steps:
+                self._patch_node(step, 0)
+            if self.am_i_root():
+                self._release_events()
+
+    def _patch_value(self, value: Any, step: PatchStep, position: int) -> Any:
+        """
+        Return the plain value of this object after a step of :py:meth:`patch_many`,
+        ``step.tokens[position:]`` being the path from this object.
+        Overwritten by containers.
+
+        :meta private:
+        """
+        if position < len(step.tokens):
+            raise self._not_found(step)
+        if step.op == "test":
+            return value
+        if step.op == "remove":
+            raise STypeError('{0}: invalid operator "{op}"', NodePath(self), op=step.op)
+        return self._merged_value(value, copy.deepcopy(step.value))
+
+    def _not_found(self, step: PatchStep) -> SAttributeError:
+        """
+        The error for a path of :py:meth:`patch_many` not found from this object
+
+        :meta private:
+        """
+        return SAttributeError(
+            '{0}: Attribut does not exists "{selector}"',
+            NodePath(self),
+            selector=step.path,
+        )
+
+    def _merged_value(self, _value: Any, new_value: Any) -> Any:
+        """
+        Return the plain value after :py:meth:`set_value_without_checks` of new_value
+
+        :meta private:
+        """
+        return new_value
+
+    def _patch_node(self, step: PatchStep, _position: int) -> None:
+        """
+        Do a step of :py:meth:`patch_many` (already checked).
+        Overwritten by containers.
+
+        :meta private:
+        """
+        if step.op == "test":
+            self.check(step.value)
+            return
+        self.set_value_without_checks(step.value)
+
+    @with_decisions
+    def diff(self, other: Self) -> list[dict]:
+        """Return the operations (https://datatracker.ietf.org/doc/html/rfc6902)
+        which change the value of this object into the value of other ::
+
+            a.diff( b )
+            # [ { "op" : "replace", "path" : "/name", "value" : "John" }, ... ]
+
+        Paths are JSON pointers from this object, values are like
+        :py:meth:`get_value`, so ``a.patch_many( a.diff( b ) )`` gives b values to a.
+        Both objects are walked once, elements of lists are matched
+        by content (longest common subsequence).
+        Fields which can be read only in one object are added or removed.
+
+        :param other: the object to compare with
+        :type other: GenericType
+        :return: the list of operations, empty if values are equal
+        :rtype: list[dict]
+        :raises STypeError: if other is not a stricto object
+        """
+        if not isinstance(other, GenericType):
+            raise STypeError("{0}: Must be a stricto object", NodePath(self))
+        operations = []
+        if other is not self:
+            self._diff(other, "", operations)
+        return operations
+
+    def _diff(self, other: Self, path: str, operations: list) -> None:
+        """
+        Add to operations what changes this object into other (see :py:meth:`diff`).
+        Overwritten by containers.
+
+        :meta private:
+        """
+        value = other.get_value()
+        if type(other) is not type(self) or self.get_value() != value:
+            operations.append({"op": "replace", "path": path, "value": value})
+
+    def _content_key(self) -> Any:
+        """
+        Return a hashable key of the value, to compare list elements in :py:meth:`diff`
+
+        :meta private:
+        """
+        digest = self._digest_of(False)
+        if digest is not None:
+            return digest
+        return content_key(self.get_value())
+
+    @with_decisions
+    def digest(self) -> str:
+        """Return a digest (a hash) of the value of this object, as an hex string.
+        Objects with equal values have the same digest, so it can be used
+        to compare large objects or as a key of a cache ::
+
+            d = a.digest()
+            a.name = "John"
+            d == a.digest() # False, something changed
+
+        The digest is kept and computed again only for modified objects
+        and their parents (a Merkle tree). It is computed each time if
+        fields have ``exists`` or rights (their value depends on other fields).
+
+        :return: the digest
+        :rtype: str
+        """
+        return self._digest_of().hex()
+
+    def _digest_of(self, full: bool = True) -> bytes | None:
+        """
+        Return the digest of this object (see :py:meth:`digest`).
+        If not full, return None instead of computing a digest which
+        cannot be kept (it depends on other fields).
+
+        :meta private:
+        """
+        digest = self._digest
+        if digest:
+            return digest
+        if digest is False and not full:
+            return None
+        return self._compute_digest(full)
+
+    def _compute_digest(self, full: bool) -> bytes | None:
+        """
+        Compute the digest, keep it in ``_digest`` (or False if it cannot be kept)
+        Overwritten by containers.
+
+        :meta private:
+        """
+        dynamic = self._value is None and callable(self._default_value)
+        encoded, canonical = encode_value(self.get_value())
+        if dynamic or not canonical:
+            self._digest = False
+            if not full:
+                return None
+            return new_hash(b"V" + encoded).digest()
+        self._digest = new_hash(b"V" + encoded).digest()
+        return self._digest
+
+    def _forget_digest(self) -> None:
+        """
+        The value changed : forget the digest of this object and its parents.
+        Digests of parents are computed after those of sub objects,
+        so there is nothing to forget above an object without digest.
+
+        :meta private:
+        """
+        node = self
+        while node is not None and node._digest is not None:
+            node._digest = None
+            node = node._parent
+
+    def _same_content(self, other: Any) -> bool | None:
+        """
+        Compare digests with other (see :py:meth:`digest`).
+        Return None if one of them cannot be kept.
+
+        :meta private:
+        """
+        if not isinstance(other, GenericType):
+            return None
+        digest = self._digest_of(False)
+        if digest is None:
+            return None
+        other_digest = other._digest_of(False)
+        if other_digest is None:
+            return None
+        return digest == other_digest
+
     def set_value_without_checks(self, value: Any) -> None:
         """
         Set the value without any check.
@@ -955,7 +2015,7 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
 
         """
         if self.exists_or_can_read() is False:
-            raise SAttributeError("{0}: Locked", self.path_name())
+            raise SAttributeError("{0}: Locked", NodePath(self))
 
         root = self.get_root()
 
@@ -970,17 +2030,26 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
             try:
                 corrected_value = self.__json_decode__(corrected_value)
             except Exception as e:  # pylint: disable=broad-exception-caught
-                raise SError(e, self.path_name(), json=corrected_value) from e
+                raise SError(e, NodePath(self), json=corrected_value) from e
 
         if callable(self._transform):
             corrected_value = self._transform(corrected_value, root)
 
+        forget_decisions()
         self._old_value = self._value
         self._value = self._default if corrected_value is None else corrected_value
 
         if self._old_value == self._value:
             return False
 
+        if Transaction.count:
+            log_change(self, self._old_value)
+
+        self._forget_digest()
+
+        if ListIndex.live:
+            self._notify_indexes()
+
         if callable(self._on_change):
             self._on_change(self._old_value, self.get_value(), root)
 
@@ -991,6 +2060,7 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
 
         return True
 
+    @with_decisions
     def get_value(self) -> Any:
         """
         return the value in this object
@@ -1008,6 +2078,7 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
 
         return self._value
 
+    @with_decisions
     def get_encoded(self) -> str:
         """Return the encoded value
 
@@ -1016,6 +2087,46 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
         """
         return self.__json_encode__()
 
+    @with_decisions
+    def to_json(self) -> str:
+        """Return this object encoded in JSON, walking the object once.
+        The result is the same as ``json.dumps( self, cls=StrictoEncoder )``
+
+        :return: the JSON string
+        :rtype: str
+        """
+        parts = []
+        self._write_json(parts)
+        return "".join(parts)
+
+    def _write_json(self, parts: list[str]) -> None:
+        """
+        Append this object encoded in JSON to parts,
+        as the encoder does with :py:meth:`__json_encode__`.
+        Overwritten by containers.
+
+        :meta private:
+        """
+        if encoded_as_value(type(self)):
+            value = self._value
+            if value is None and self._default_value is not None:
+                value = self.get_value()
+            write_value(value, parts)
+        else:
+            write_value(self.__json_encode__(), parts)
+
+    def _write_encoded(self, parts: list[str]) -> None:
+        """
+        Append :py:meth:`get_encoded` encoded in JSON to parts.
+        Overwritten by containers.
+
+        :meta private:
+        """
+        if type(self).get_encoded is GenericType.get_encoded:
+            self._write_json(parts)
+        else:
+            write_value(self.get_encoded(), parts)
+
     def rollback(self) -> None:
         """
         reset to the old value
@@ -1023,7 +2134,39 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
         :param self: Description
 
         """
-        self.__dict__["_value"] = self._old_value
+        forget_decisions()
+        if Transaction.count:
+            log_change(self, self._value)
+        self._value = self._old_value
+        self._forget_digest()
+        if ListIndex.live:
+            self._notify_indexes()
+
+    def _undone(self) -> None:
+        """
+        Changes of this object are undone by a transaction
+        (see :py:meth:`transaction`), there is nothing to roll back any more
+
+        :meta private:
+        """
+        forget_decisions()
+        self._old_value = self._value
+        self._forget_digest()
+        if ListIndex.live:
+            self._notify_indexes()
+
+    def transaction(self) -> Transaction:
+        """Return a transaction on the whole tree of this object
+        (see :py:class:`Transaction`) ::
+
+            with a.transaction():
+                a.set( ... )
+                a.b.append( ... )
+
+        :return: the transaction, started by ``with``
+        :rtype: Transaction
+        """
+        return Transaction(self.get_root())
 
     def __repr__(self):
         return self.get_value().__repr__()
@@ -1045,10 +2188,10 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
 
         """
 
-        root = self.get_root()
+        root = self._rules_root()
 
         if self.can_read() is False:
-            raise SRightError("{0}: Cannot read value", self.path_name())
+            raise SRightError("{0}: Cannot read value", NodePath(self))
 
         # transform the value before the check
         corrected_value = value
@@ -1059,7 +2202,7 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
         if corrected_value is None:
             if self._not_none is True:
                 raise SConstraintError(
-                    '{0}: Cannot be empty "{value}"', self.path_name(), value=value
+                    '{0}: Cannot be empty "{value}"', NodePath(self), value=value
                 )
             return
 
@@ -1068,15 +2211,164 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
 
         if self.can_modify() is False:
             if corrected_value != self.get_value():
-                raise SRightError("{0}: cannot modify value", self.path_name())
+                raise SRightError("{0}: cannot modify value", NodePath(self))
 
         # check constraints or raise an Error
         self.check_constraints(corrected_value)
 
+    def compile(self) -> Callable[[Any], None]:
+        """
+        Return a validator specialised to this schema.
+
+        The schema is walked once and flattened into closures (a plan), so the validator
+        does the same job as :py:meth:`check` without the method dispatch on each node.
+        The plan is cached, shared by copies of this object,
+        and rebuilt when the model change (see :py:meth:`Dict.add_to_model`).
+
+        :param self: Description
+        :return: a function ``validator( value )`` raising the same errors as :py:meth:`check`
+        :rtype: Callable[[Any], None]
+
+        """
+        self._plan()
+        return self._check_compiled
+
+    def _check_compiled(self, value: Any) -> None:
+        """
+        Check the value with the compiled plan of this object
+
+        :meta private:
+        """
+        parent = self._parent
+        alive = parent is None or parent.exists(None) is not False
+        self._plan()(self, value, self.get_root(), alive)
+
+    def _plan(self) -> Callable:
+        """
+        Return the cached plan ``validate( node, value, root, alive )``
+        of this object, build it if needed.
+
+        :meta private:
+        """
+        spec = self._rule_caches()
+        plan = spec._compiled
+        if plan is None:
+            # the plan depends on rules only : cached in the shared spec
+            plan = self._compile()
+            spec._compiled = plan
+        return plan
+
+    def _rule_caches(self) -> FieldSpec:
+        """
+        Return the :py:class:`FieldSpec` keeping the caches built from rules
+        (see ``_rule_cache_names``), shared by copies. Caches are emptied
+        if a model changed since they were built : the type of elements
+        of a List or a Tuple has no parent to forget them.
+
+        :meta private:
+        """
+        spec = self._spec
+        if spec._model_changes != _Models.changes:
+            for name in self._rule_cache_names:
+                setattr(spec, name, None)
+            spec._model_changes = _Models.changes
+        return spec
+
+    def _invalidate_compiled(self) -> None:
+        """
+        Forget the plan built by :py:meth:`compile` for this object
+        and all its parents (the model has changed).
+
+        :meta private:
+        """
+        _Models.changes += 1
+        node = self
+        while node is not None:
+            if node._compiled is not None:
+                node._compiled = None
+            node = node._parent
+
+    def _compile(self) -> Callable:
+        """
+        Build the plan ``validate( node, value, root, alive )``
+        used by :py:meth:`compile`. ``node`` is the object checked (this one or a copy),
+        ``alive`` is False if the parent does not exist.
+        Must be overwritten by containers.
+
+        :meta private:
+        """
+        if type(self).check is not GenericType.check:
+            return self._compile_fallback()
+        return self._compile_generic()
+
+    def _compile_fallback(self) -> Callable:
+        """
+        Plan for classes with their own :py:meth:`check`
+
+        :meta private:
+        """
+
+        def validate(node, value, root, alive):  # pylint: disable=unused-argument
+            node.check(value)
+
+        return validate
+
+    def _compile_generic(self) -> Callable:
+        """
+        Build ``prelude( node, value, root )`` doing the job of :py:meth:`GenericType.check`
+        with everything known at compile time folded.
+
+        :meta private:
+        """
+        transform = self._transform if callable(self._transform) else None
+        not_none = self._not_none is True
+        check_type = type(self).check_type
+        check_constraints = type(self).check_constraints
+
+        def prelude(node, value, root, alive=True):  # pylint: disable=unused-argument
+            # can_read() is always True when permissions are off
+            enabled = node._permissions._enabled
+            if enabled and node.can_read() is False:
+                raise SRightError("{0}: Cannot read value", NodePath(node))
+
+            corrected_value = value if transform is None else transform(value, root)
+
+            if corrected_value is None:
+                if not_none:
+                    raise SConstraintError(
+                        '{0}: Cannot be empty "{value}"', NodePath(node), value=value
+                    )
+                return
+
+            check_type(node, corrected_value)
+
+            if enabled and node.can_modify() is False:
+                if corrected_value != node.get_value():
+                    raise SRightError("{0}: cannot modify value", NodePath(node))
+
+            check_constraints(node, corrected_value)
+
+        return prelude
+
+    def _compile_exists(self) -> Callable | bool:
+        """
+        Return the "exists" option of this object ready for a compiled validator :
+        a boolean if known at compile time, or a function ``f( root )``
+
+        :meta private:
+        """
+        exists = self._exists
+        if not callable(exists):
+            return exists is not False
+        return lambda root: exists(None, root) is not False
+
     def __getattr__(self, k):
         """
         replicate all atributes from value, but prefere self attribute first.
         """
+        # An attribute not set yet (during a copy)
+        if k in attributes_of(type(self)):
+            raise AttributeError(k)
         return getattr(self.get_value(), k, None)
         # return None
 
@@ -1115,7 +2407,7 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
             return self.get_value() != other
         if operator in {"$and", "$or"}:
             if not isinstance(other, list):
-                raise SSyntaxError("{0}: $and need a list", self.path_name())
+                raise SSyntaxError("{0}: $and need a list", NodePath(self))
             for sub in other:
                 if (
                     isinstance(sub, tuple)
@@ -1134,9 +2426,9 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
                 else:
                     raise SSyntaxError(
                         "{0}: $and/$or list item not a tuple of conditions",
-                        self.path_name(),
+                        NodePath(self),
                     )
-            return True
+            return operator == "$and"
 
         if operator == "$not":
             if (  # pylint: disable=no-else-return
@@ -1152,11 +2444,11 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
                 return not resp
             else:
                 raise SSyntaxError(
-                    "{0}: $not condition must be a tuple", self.path_name()
+                    "{0}: $not condition must be a tuple", NodePath(self)
                 )
 
         raise SSyntaxError(
-            '{0}: $not condition must be a tuple "{op}"', self.path_name(), op=operator
+            '{0}: $not condition must be a tuple "{op}"', NodePath(self), op=operator
         )
 
     def match(self, other):
@@ -1166,6 +2458,9 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
 
         """
 
+        if isinstance(other, Query):
+            return other.match(self)
+
         # the value is a tuble with an operator ( '$gt', '$lt', etc... )
         if isinstance(other, tuple) and len(other) == 2 and re.match(r"^\$", other[0]):
             try:
@@ -1188,10 +2483,10 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
         if self._union:
             l = self._get_args_or_execute_them(self._union, value)
             if not isinstance(l, list):
-                raise SSyntaxError("{0}: Union constraint not list", self.path_name())
+                raise SSyntaxError("{0}: Union constraint not list", NodePath(self))
             if value not in l:
                 raise SConstraintError(
-                    "{0}: Not in union list", self.path_name(), value=value, list=l
+                    "{0}: Not in union list", NodePath(self), value=value, list=l
                 )
 
         # ---- constraints as functions
@@ -1199,15 +2494,14 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
             if callable(constraint) is not True:
                 raise SSyntaxError(
                     "{0}: Constraint not callable",
-                    self.path_name(),
+                    NodePath(self),
                     constraint=constraint,
                 )
-            root = self.get_root()
-            r = constraint(value, root)
+            r = constraint(value, self._rules_root())
             if r is False:
                 raise SConstraintError(
                     '{0}: Constraint not validated for value="{value}"',
-                    self.path_name(),
+                    NodePath(self),
                     value=value,
                 )
         return True
@@ -1224,5 +2518,29 @@ class GenericType:  # pylint: disable=too-many-instance-attributes, too-many-pub
         :meta private:
         """
         if callable(arg):
-            return arg(value, self.get_root())
+            return arg(value, self._rules_root())
         return arg
+
+    def _rules_root(self) -> Any:
+        """
+        Return the root given to rules (functions for constraints, exists, rights...) :
+        the root of this object, or the view of the candidate value being checked
+        (see :py:meth:`validate_many`)
+
+        :meta private:
+        """
+        view = _candidates.view
+        return self.get_root() if view is None else view
+
+
+def cached_digest(node: GenericType) -> bytes | bool | None:
+    """
+    Return the digest kept by an object (see :py:meth:`GenericType.digest`),
+    without the attribute lookup of Dict
+
+    :meta private:
+    """
+    return _digest_slot(node)
+
+
+_digest_slot = GenericType.__dict__["_digest"].__get__
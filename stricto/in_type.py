@@ -1,7 +1,7 @@
 """Module providing the In() sur-Class"""
 
-from .generic import GenericType
-from .error import STypeError
+from .generic import GenericType, SpecAttribute
+from .error import STypeError, NodePath
 from .toolbox import validation_parameters
 
 
@@ -10,6 +10,10 @@ class In(GenericType):
     A kind of "one of"
     """
 
+    __slots__ = ()
+
+    _models = SpecAttribute("_models")
+
     @validation_parameters
     def __init__(self, models: list[GenericType | None], **kwargs):
         """
@@ -19,14 +23,14 @@ class In(GenericType):
         self._models = models
         GenericType.__init__(self, **kwargs)
 
-    def get_schema(self):
+    def _build_schema(self):
         """
         Return a schema for this object
         """
-        a = GenericType.get_schema(self)
+        a = GenericType._build_schema(self)
         a["sub_scheme"] = []
         for schema in self._models:
-            a["sub_scheme"].append(schema.get_schema())
+            a["sub_scheme"].append(schema._schema_of())
         return a
 
     def check(self, value) -> None:
@@ -50,7 +54,7 @@ class In(GenericType):
 
         raise STypeError(
             '{0}: Match no model (value="{value}", models="{models}")',
-            self.path_name(),
+            NodePath(self),
             value=value,
             models=self._models,
         )
@@ -0,0 +1,184 @@
+"""
+Module providing the indexes of a List (see :py:meth:`List.create_index`)
+"""
+
+# pylint: disable=protected-access
+from .generic import GenericType, with_decisions
+from .list_and_tuple import ListAndTuple
+from .error import SSyntaxError, SAttributeError, NodePath
+from .list_index import ListIndex, DigestIndex, INDEX_KINDS, conditions, intersect
+from .query import Query, compile_query
+from .selector import Selector
+
+
+class IndexedList(ListAndTuple):
+    """
+    The part of a List with indexes on fields of its elements
+    (used by :py:meth:`find`)
+    """
+
+    __slots__ = ("_indexes",)
+    _not_rules = ("_indexes",)
+
+    def __init__(self, **kwargs):
+        """
+        initialisation, without indexes
+        """
+        # indexes of elements by path of field (see create_index()),
+        # and by digest at None (see _digest_index())
+        self._indexes = None
+        ListAndTuple.__init__(self, **kwargs)
+
+    def _copy_node(self):
+        result = super()._copy_node()
+        result._indexes = None
+        return result
+
+    def create_index(self, selector: str, kind: str = "hash") -> None:
+        """Create an index of the elements on one of their fields,
+        used by :py:meth:`find`. The index is kept up to date
+        when the list or its elements are modified.
+        On a List field, the items are indexed (for ``$contains``).
+
+        :param selector: the field in elements, like ``$.address.city``
+        :type selector: str
+        :param kind: "hash" for equality, "sorted" for equality and ``$gt``, ``$lt``...
+        :type kind: str
+        :raises SSyntaxError: unknown kind or not a selector of a field
+        :raises SAttributeError: the field does not exist
+        """
+        if kind not in INDEX_KINDS:
+            raise SSyntaxError('{0}: Unknown index kind "{1}"', NodePath(self), kind)
+
+        sel = Selector(selector)
+        if sel.empty() or sel.pop() != ("$", None) or sel.empty():
+            raise SSyntaxError(
+                '{0}: Invalid index selector "{1}"', NodePath(self), selector
+            )
+        names = []
+        node = self._type
+        while not sel.empty():
+            name, index_or_slice = sel.pop()
+            if index_or_slice is not None:
+                raise SSyntaxError(
+                    '{0}: Invalid index selector "{1}"', NodePath(self), selector
+                )
+            children = node._json_children()
+            if not isinstance(children, dict) or name not in children:
+                raise SAttributeError(
+                    '{0}: Attribut does not exists "{1}"', NodePath(self), selector
+                )
+            node = children[name]
+            names.append(name)
+
+        index = ListIndex(tuple(names), kind, isinstance(node, IndexedList))
+        index.rebuild(GenericType.get_value(self))
+        if self._indexes is None:
+            self._indexes = {}
+        self._indexes[index.names] = index
+        ListIndex.live.add(index)
+
+    def drop_index(self, selector: str) -> None:
+        """Remove an index created by :py:meth:`create_index`
+
+        :param selector: the field in elements, like ``$.address.city``
+        :type selector: str
+        """
+        sel = Selector(selector)
+        sel.pop()
+        names = []
+        while not sel.empty():
+            names.append(sel.pop()[0])
+        index = self._indexes.pop(tuple(names), None) if self._indexes else None
+        if index is not None:
+            ListIndex.live.discard(index)
+
+    @with_decisions
+    def find(self, query: dict | tuple | Query) -> list:
+        """Return the elements matching the query (see :py:meth:`Dict.match`), in order.
+        Same as ``[ e for e in self if e.match( query ) ]``, but the query is
+        compiled once (see :py:func:`compile_query`) and indexes on fields
+        of the query (see :py:meth:`create_index`) select the elements to match.
+
+        :param query: the query, like ``{ "age" : ( "$gt", 12 ) }``
+        :type query: dict | tuple | Query
+        :return: the list of elements
+        :rtype: list
+        """
+        v = GenericType.get_value(self)
+        if not isinstance(v, list):
+            return []
+
+        query = compile_query(query)
+        candidates = None
+        if self._indexes:
+            for names, condition in conditions(query.query):
+                index = self._indexes.get(names)
+                if index is None:
+                    continue
+                found = index.lookup(condition)
+                if found is not None:
+                    candidates = (
+                        found if candidates is None else intersect(candidates, found)
+                    )
+
+        if candidates is None:
+            return [element for element in v if query.match(element)]
+        result = [element for element in candidates.values() if query.match(element)]
+        result.sort(key=lambda element: int(element._attribute_name[1:-1]))
+        return result
+
+    def _digest_index(self) -> DigestIndex:
+        """
+        Return the index of elements by digest (for ``uniq``),
+        built on the first use and kept up to date as other indexes
+
+        :meta private:
+        """
+        if self._indexes is None:
+            self._indexes = {}
+        index = self._indexes.get(None)
+        if index is None:
+            index = DigestIndex()
+            index.rebuild(GenericType.get_value(self))
+            # not a field of elements : never used by find()
+            self._indexes[None] = index
+            ListIndex.live.add(index)
+        return index
+
+    def _reindex(self) -> None:
+        """
+        Index all elements again (see :py:meth:`create_index`)
+
+        :meta private:
+        """
+        if self._indexes:
+            for index in self._indexes.values():
+                index.rebuild(GenericType.get_value(self))
+
+    def _index_add(self, elements: list) -> None:
+        """
+        Add new elements to the indexes
+
+        :meta private:
+        """
+        if self._indexes:
+            for index in self._indexes.values():
+                for element in elements:
+                    index.add(element)
+
+    def _index_remove(self, elements: list) -> None:
+        """
+        Remove elements from the indexes
+
+        :meta private:
+        """
+        if self._indexes:
+            for index in self._indexes.values():
+                for element in elements:
+                    index.remove(element)
+
+    def _index_child(self, child) -> None:
+        if self._indexes:
+            for index in self._indexes.values():
+                index.update(child)
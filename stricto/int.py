@@ -3,8 +3,8 @@
 Module providing the Int() Class
 """
 
-from .generic import GenericType
-from .error import STypeError, SConstraintError
+from .generic import GenericType, SpecAttribute
+from .error import STypeError, SConstraintError, NodePath
 from .kparse import Kparse
 
 KPARSE_MODEL = {
@@ -18,6 +18,11 @@ class Int(GenericType):
     A Int type
     """
 
+    __slots__ = ()
+
+    _min = SpecAttribute("_min")
+    _max = SpecAttribute("_max")
+
     def __init__(self, **kwargs):
         """
         available arguments
@@ -33,7 +38,7 @@ class Int(GenericType):
         self._min = options.get("min")
         self._max = options.get("max")
 
-    def get_schema(self):
+    def _build_schema(self):
         """Return meta information for a float
 
         :param self: Description
@@ -43,7 +48,7 @@ class Int(GenericType):
 
         :meta private:
         """
-        a = GenericType.get_schema(self)
+        a = GenericType._build_schema(self)
         a["min"] = self.get_as_string(self._min)
         a["max"] = self.get_as_string(self._max)
         return a
@@ -56,7 +61,7 @@ class Int(GenericType):
             return True
 
         raise STypeError(
-            '{0}: Must be a int ("{value}")', self.path_name(), value=value
+            '{0}: Must be a int ("{value}")', NodePath(self), value=value
         )
 
     def check_constraints(self, value):
@@ -65,10 +70,10 @@ class Int(GenericType):
 
         if self._min is not None and value < self._min:
             raise SConstraintError(
-                '{0}: Must be above Minimal ("{value}")', self.path_name(), value=value
+                '{0}: Must be above Minimal ("{value}")', NodePath(self), value=value
             )
         if self._max is not None and value > self._max:
             raise SConstraintError(
-                '{0}: Must be below Maximal ("{value}")', self.path_name(), value=value
+                '{0}: Must be below Maximal ("{value}")', NodePath(self), value=value
             )
         return True
@@ -2,7 +2,10 @@
 JSON Encoder for complex object
 """
 
+import json
 from json import JSONEncoder
+from typing import Any
+from .generic import GenericType, _decisions
 
 
 class StrictoEncoder(JSONEncoder):
@@ -11,6 +14,30 @@ class StrictoEncoder(JSONEncoder):
     to pick up the __json_encode__ for a complex objects if needed.
     """
 
+    def iterencode(self, o, _one_shot=False):
+        """
+        Encode a stricto object as one operation (see :py:func:`with_decisions`)
+        """
+        if not isinstance(o, GenericType):
+            return super().iterencode(o, _one_shot)
+        return self._iterencode_object(o, _one_shot)
+
+    def _iterencode_object(self, o, _one_shot):
+        """
+        Keep the decisions until the end of the encoding,
+        chunks are still given one by one
+
+        :meta private:
+        """
+        if _decisions.cache is not None:
+            yield from super().iterencode(o, _one_shot)
+            return
+        _decisions.cache = {}
+        try:
+            yield from super().iterencode(o, _one_shot)
+        finally:
+            _decisions.cache = None
+
     def default(self, o):
         """
         Overwrite the default encoder function default, to use the
@@ -22,3 +49,17 @@ class StrictoEncoder(JSONEncoder):
             return super().default(o)
 
         return encoder()
+
+
+def dumps(o: Any) -> str:
+    """Encode in JSON, the same as ``json.dumps( o, cls=StrictoEncoder )``.
+    A stricto object is written directly (see :py:meth:`GenericType.to_json`)
+
+    :param o: a stricto object or a python value
+    :type o: Any
+    :return: the JSON string
+    :rtype: str
+    """
+    if isinstance(o, GenericType):
+        return o.to_json()
+    return json.dumps(o, cls=StrictoEncoder)
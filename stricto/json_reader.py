@@ -0,0 +1,172 @@
+"""
+Module providing an incremental reader of a JSON array
+(see :py:meth:`List.load_stream`)
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Iterator
+from .error import SSyntaxError, NodePath
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# what can go on a number, or is the start of a number
+NUMBER_TAIL = re.compile(r"[0-9.eE+-]*")
+
+# the other values which may be cut at the end of a chunk
+LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+
+
+# the reading steps share the buffer and the position, iterating is the only API
+class JsonArrayReader:  # pylint: disable=too-few-public-methods
+    """Read the elements of a JSON array one by one from a stream
+
+    Only the current element and one chunk are kept in memory.
+
+    :param stream: a text or binary (utf-8) file object
+    :param chunk_size: number of characters (or bytes) read at once
+    :type chunk_size: int
+    """
+
+    def __init__(self, stream, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Constructor method"""
+        self._stream = stream
+        self._chunk_size = max(chunk_size, 1)
+        self._decoder = json.JSONDecoder()
+        self._bytes_decoder = None
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> bool:
+        """
+        Read at least size characters more (unless the end of the stream)
+        and drop what is already read. Return False at the end of the stream.
+
+        :meta private:
+        """
+        if self._eof:
+            return False
+        chunk = self._stream.read(size)
+        if isinstance(chunk, bytes):
+            if self._bytes_decoder is None:
+                self._bytes_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+            text = self._bytes_decoder.decode(chunk, final=not chunk)
+        else:
+            text = chunk
+        if not chunk:
+            self._eof = True
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        return bool(text) or not self._eof
+
+    def _next_char(self) -> str | None:
+        """
+        Skip whitespaces and return the next character (None at the end)
+
+        :meta private:
+        """
+        while True:
+            self._pos = WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill(self._chunk_size):
+                return None
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        """
+        :meta private:
+        """
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def _decode(self) -> Any:
+        """
+        Decode the value starting at the current position
+
+        :meta private:
+        """
+        while True:
+            # reading more than what is pending keeps the reading linear
+            size = max(self._chunk_size, len(self._buffer) - self._pos)
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if _truncated(e) and self._fill(size):
+                    continue
+                raise
+            if NUMBER_TAIL.fullmatch(self._buffer, end) and self._fill(size):
+                # a number may go on in the next chunk
+                continue
+            self._pos = end
+            return value
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Yield each element of the array
+
+        :raises json.JSONDecodeError: if the stream is not a JSON array
+        """
+        if self._next_char() != "[":
+            raise self._error("Expecting '['")
+        self._pos += 1
+
+        if self._next_char() == "]":
+            self._pos += 1
+        else:
+            while True:
+                if self._next_char() in ("]", None):
+                    raise self._error("Expecting value")
+                yield self._decode()
+                c = self._next_char()
+                self._pos += 1
+                if c == "]":
+                    break
+                if c != ",":
+                    raise self._error("Expecting ',' delimiter")
+
+        if self._next_char() is not None:
+            raise self._error("Extra data")
+
+
+def _truncated(error: json.JSONDecodeError) -> bool:
+    """
+    Return True if the error comes from a value cut at the end of the buffer
+    (more characters may fix it), False for a syntax error
+
+    :meta private:
+    """
+    rest = error.doc[error.pos :]
+    if error.msg.startswith("Unterminated string"):
+        return True
+    if error.msg.startswith("Invalid \\uXXXX escape"):
+        return len(rest) < 5
+    return bool(NUMBER_TAIL.fullmatch(rest)) or any(
+        literal.startswith(rest) for literal in LITERALS
+    )
+
+
+def read_elements(node, stream, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list:
+    """
+    Return the new elements of a List for a JSON array read in a stream,
+    each one checked when created (see :py:meth:`List.load_stream`)
+
+    :param node: the List
+    :param stream: a text or binary (utf-8) file object
+    :param chunk_size: number of characters (or bytes) read at once
+    :type chunk_size: int
+    :raises SSyntaxError: if the stream is not a JSON array
+
+    :meta private:
+    """
+    models = []
+    try:
+        for value in JsonArrayReader(stream, chunk_size):
+            models.append(node._new_element(f"[{len(models)}]", value))
+    except json.JSONDecodeError as e:
+        raise SSyntaxError(
+            "{0}[{1}]: Invalid JSON ({2})", NodePath(node), len(models), e.msg
+        ) from e
+    return models
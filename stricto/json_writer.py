@@ -0,0 +1,70 @@
+"""
+Module providing helpers to write JSON directly (see :py:meth:`GenericType.to_json`).
+The output is the same as ``json.dumps( o, cls=StrictoEncoder )``
+"""
+
+from functools import cache
+from json import JSONEncoder
+from json.encoder import encode_basestring_ascii
+from typing import Any
+
+INFINITY = float("inf")
+
+
+def json_default(o: Any) -> Any:
+    """
+    Same as :py:meth:`StrictoEncoder.default`
+
+    :meta private:
+    """
+    try:
+        encoder = getattr(o, "__json_encode__")
+    except AttributeError as e:
+        raise TypeError(
+            f"Object of type {o.__class__.__name__} is not JSON serializable"
+        ) from e
+    return encoder()
+
+
+# For values other than str, int, float, bool and None
+_encoder = JSONEncoder(default=json_default)
+
+
+@cache
+def encode_key(key: str) -> str:
+    """
+    Return the beginning of a member of a JSON object : ``"key": ``
+
+    :meta private:
+    """
+    return encode_basestring_ascii(key) + ": "
+
+
+def write_value(value: Any, parts: list[str]) -> None:
+    """
+    Append a python value encoded in JSON to parts
+
+    :meta private:
+    """
+    t = type(value)
+    if t is str:
+        parts.append(encode_basestring_ascii(value))
+    elif value is None:
+        parts.append("null")
+    elif value is True:
+        parts.append("true")
+    elif value is False:
+        parts.append("false")
+    elif t is int:
+        parts.append(int.__repr__(value))
+    elif t is float:
+        if value != value:  # pylint: disable=comparison-with-itself
+            parts.append("NaN")
+        elif value == INFINITY:
+            parts.append("Infinity")
+        elif value == -INFINITY:
+            parts.append("-Infinity")
+        else:
+            parts.append(float.__repr__(value))
+    else:
+        parts.append(_encoder.encode(value))
@@ -0,0 +1,211 @@
+"""
+Module providing validation of JSON Lines files against a schema,
+split by byte ranges on many processes
+"""
+
+import importlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+from .generic import GenericType
+from .error import SSyntaxError
+
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+# The schema of a worker, loaded once by _init_worker()
+_worker_schema = None  # pylint: disable=invalid-name
+
+
+def load_schema(schema_path: str) -> GenericType:
+    """Import a schema given as ``module:attribute``
+
+    :param schema_path: the schema, like ``"my_app.models:user"``
+    :type schema_path: str
+    :raises SSyntaxError: if the schema cannot be found
+    :return: the schema
+    :rtype: GenericType
+    """
+    module_name, _, attribute = schema_path.partition(":")
+    if not module_name or not attribute:
+        raise SSyntaxError('Schema "{0}" must be "module:attribute"', schema_path)
+
+    try:
+        schema = importlib.import_module(module_name)
+        for name in attribute.split("."):
+            schema = getattr(schema, name)
+    except (ImportError, AttributeError) as e:
+        raise SSyntaxError('Cannot load schema "{0}" ({1})', schema_path, e) from e
+
+    if not isinstance(schema, GenericType):
+        raise SSyntaxError('"{0}" is not a stricto schema', schema_path)
+    return schema
+
+
+def split_file(filename: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list[tuple]:
+    """Split a file in byte ranges ``( filename, start, end )``
+
+    A line belongs to the range where it starts.
+
+    :param filename: the file
+    :type filename: str
+    :param chunk_size: the size of each range in bytes
+    :type chunk_size: int
+    :return: the list of ranges
+    :rtype: list[tuple]
+    """
+    size = os.path.getsize(filename)
+    chunk_size = max(chunk_size, 1)
+    return [
+        (filename, start, min(start + chunk_size, size))
+        for start in range(0, size, chunk_size)
+    ]
+
+
+def _init_worker(schema_path: str) -> None:
+    """
+    Load the schema once for this worker process
+    """
+    global _worker_schema  # pylint: disable=global-statement
+    _worker_schema = load_schema(schema_path)
+
+
+def _validate_range(byte_range: tuple, schema: GenericType = None) -> tuple:
+    """
+    Validate all lines starting in the byte range
+
+    :return: ( number of lines, number of records, [ ( line index in the range, message ) ] )
+    """
+    (filename, start, end) = byte_range
+    if schema is None:
+        schema = _worker_schema
+
+    lines = 0
+    records = []
+    errors = []
+    with open(filename, "rb") as f:
+        if start > 0:
+            # skip the end of a line started in the previous range
+            f.seek(start - 1)
+            if f.read(1) != b"\n":
+                f.readline()
+
+        position = f.tell()
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            if line.strip():
+                try:
+                    records.append((lines, json.loads(line)))
+                except ValueError as e:
+                    errors.append((lines, f'JSONDecodeError("{e}")'))
+            lines += 1
+
+    values = (value for _, value in records)
+    for (index, _), error in zip(records, schema.validate_many(values)):
+        if error is not None:
+            errors.append((index, repr(error)))
+    errors.sort(key=lambda e: e[0])
+
+    return (lines, len(records), errors)
+
+
+# errors() is the only method, the object keeps the settings and the stats
+class JsonlValidator:  # pylint: disable=too-few-public-methods
+    """Validate a JSON Lines file against a schema
+
+    :param schema: the schema, or ``"module:attribute"`` to import it
+        (mandatory with more than one worker)
+    :type schema: str | GenericType
+    :param filename: the JSON Lines file
+    :type filename: str
+    :param workers: the number of processes
+    :type workers: int
+    :param chunk_size: the size in bytes of each part of the file given to a worker
+    :type chunk_size: int
+
+    :example:
+        .. code-block:: python
+
+            v = JsonlValidator("my_app.models:user", "users.jsonl", workers=8)
+            for line, message in v.errors():
+                print(line, message)
+            print(v.stats)
+    """
+
+    def __init__(
+        self,
+        schema: str | GenericType,
+        filename: str,
+        workers: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """Constructor method"""
+        if workers > 1 and not isinstance(schema, str):
+            raise SSyntaxError(
+                'With workers, the schema must be given as "module:attribute"'
+            )
+        self.schema = schema
+        self.filename = filename
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.stats = {}
+
+    def _results(self, ranges: list[tuple]) -> Iterator[tuple]:
+        """
+        Results of each range, in the order of the file
+        """
+        if self.workers <= 1:
+            schema = (
+                load_schema(self.schema)
+                if isinstance(self.schema, str)
+                else self.schema
+            )
+            for byte_range in ranges:
+                yield _validate_range(byte_range, schema)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.schema,),
+        ) as executor:
+            yield from executor.map(_validate_range, ranges)
+
+    def errors(self) -> Iterator[tuple[int, str]]:
+        """
+        Validate the file, and stream errors as ``( line_number, message )``.
+        Line numbers start at 1. :py:attr:`stats` is filled at the end.
+
+        :return: errors in the order of the file
+        :rtype: Iterator[tuple[int, str]]
+        """
+        start_time = time.perf_counter()
+        ranges = split_file(self.filename, self.chunk_size)
+
+        first_line = 1
+        records = 0
+        nb_errors = 0
+        for lines, nb_records, errors in self._results(ranges):
+            for index, message in errors:
+                yield (first_line + index, message)
+            first_line += lines
+            records += nb_records
+            nb_errors += len(errors)
+
+        seconds = time.perf_counter() - start_time
+        size = os.path.getsize(self.filename)
+        self.stats = {
+            "lines": first_line - 1,
+            "records": records,
+            "errors": nb_errors,
+            "bytes": size,
+            "workers": self.workers,
+            "seconds": seconds,
+            "records_per_second": records / seconds if seconds else 0.0,
+            "megabytes_per_second": size / 1048576 / seconds if seconds else 0.0,
+        }
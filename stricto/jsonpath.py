@@ -0,0 +1,848 @@
+"""
+Module providing JSONPath queries according to rfc 9535
+(https://datatracker.ietf.org/doc/rfc9535/)
+
+A query is parsed once into a :py:class:`JsonPath` (see :py:func:`compile_path`),
+a chain of segments, each one a list of selectors (names, indexes, slices,
+wildcards and filters), executed on the objects.
+"""
+
+# pylint: disable=protected-access
+import re
+from functools import lru_cache
+from typing import Any, Callable
+
+from .error import SSyntaxError
+
+# Number of JSONPath kept compiled
+PATH_CACHE_SIZE = 1024
+
+# Queries using more than dotted names, indexes and slices with all bounds
+# (others are the selectors of :py:class:`Selector`)
+RFC_SYNTAX = re.compile(r"\.\.|[?'\"(,]|\]\s*\[|\[\s*[*:]|:\s*[:\]]")
+
+BLANK = re.compile(r"[ \t\n\r]*")
+NAME = re.compile(r"[A-Za-z_\u0080-\U0010ffff][A-Za-z0-9_\u0080-\U0010ffff]*")
+INTEGER = re.compile(r"-?(?:0|[1-9][0-9]*)")
+NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?")
+HEX4 = re.compile(r"[0-9a-fA-F]{4}")
+FUNCTION = re.compile(r"([a-z][a-z0-9_]*)\(")
+COMPARISON = re.compile(r"==|!=|<=|>=|<|>")
+LITERALS = {"true": True, "false": False, "null": None}
+ESCAPES = {"b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "/": "/", "\\": "\\"}
+
+# Integers allowed as index (I-JSON)
+MAX_INTEGER = 2**53 - 1
+
+# Types of expressions in filters
+LOGICAL = "logical"
+VALUE = "value"
+NODES = "nodes"
+
+
+class _Nothing:  # pylint: disable=too-few-public-methods
+    """
+    The absence of value (a query matching no object, in a comparison)
+
+    :meta private:
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return "Nothing"
+
+
+NOTHING = _Nothing()
+
+
+def is_jsonpath(selector_as_string: Any) -> bool:
+    """
+    Return True if the selector needs the rfc 9535 engine
+    (filters, descendants, unions, quoted names)
+
+    :meta private:
+    """
+    return isinstance(selector_as_string, str) and bool(
+        RFC_SYNTAX.search(selector_as_string)
+    )
+
+
+def _readable_children(node) -> list:
+    """
+    Children of an object which can be read, in order
+    (the object exists, being reached by the query)
+
+    :meta private:
+    """
+    children = node._json_children()
+    if children is None:
+        return []
+    if isinstance(children, dict):
+        children = children.values()
+    return [v for v in children if v._readable_in(True)]
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _equal(a: Any, b: Any) -> bool:
+    """
+    == according to rfc 9535 (true is not 1)
+
+    :meta private:
+    """
+    if a is NOTHING or b is NOTHING:
+        return a is b
+    if isinstance(a, bool) or isinstance(b, bool):
+        return a is b
+    return a == b
+
+
+def _less(left: Any, right: Any) -> bool:
+    """
+    < according to rfc 9535 : only numbers or strings are ordered
+
+    :meta private:
+    """
+    if _is_number(left) and _is_number(right):
+        return left < right
+    if isinstance(left, str) and isinstance(right, str):
+        return left < right
+    return False
+
+
+COMPARATORS = {
+    "==": _equal,
+    "!=": lambda a, b: not _equal(a, b),
+    "<": _less,
+    ">": lambda a, b: _less(left=b, right=a),
+    "<=": lambda a, b: _less(a, b) or _equal(a, b),
+    ">=": lambda a, b: _less(left=b, right=a) or _equal(a, b),
+}
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _regexp(pattern: str) -> re.Pattern | None:
+    """
+    :meta private:
+    """
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return None
+
+
+def _length(value: Any) -> Any:
+    if isinstance(value, (str, list, tuple, dict)):
+        return len(value)
+    return NOTHING
+
+
+def _count(nodes: list) -> int:
+    return len(nodes)
+
+
+def _value(nodes: list) -> Any:
+    if len(nodes) == 1:
+        return nodes[0].get_value()
+    return NOTHING
+
+
+def _match(value: Any, pattern: Any) -> bool:
+    if not isinstance(value, str) or not isinstance(pattern, str):
+        return False
+    r = _regexp(pattern)
+    return r is not None and r.fullmatch(value) is not None
+
+
+def _search(value: Any, pattern: Any) -> bool:
+    if not isinstance(value, str) or not isinstance(pattern, str):
+        return False
+    r = _regexp(pattern)
+    return r is not None and r.search(value) is not None
+
+
+# name -> ( types of parameters, type of the result, function )
+FUNCTIONS = {
+    "length": ((VALUE,), VALUE, _length),
+    "count": ((NODES,), VALUE, _count),
+    "match": ((VALUE, VALUE), LOGICAL, _match),
+    "search": ((VALUE, VALUE), LOGICAL, _search),
+    "value": ((NODES,), VALUE, _value),
+}
+
+
+def _constant(value: Any) -> tuple[str, Callable, bool]:
+    """
+    A literal operand in a filter : ( type, function, singular )
+
+    :meta private:
+    """
+    return VALUE, lambda node, root: value, True
+
+
+def _name_selector(name: str) -> Callable:
+    def select(node, root, out):  # pylint: disable=unused-argument
+        children = node._json_children()
+        if isinstance(children, dict):
+            v = children.get(name)
+            if v is not None and v._readable_in(True):
+                out.append(v)
+
+    return select
+
+
+def _index_selector(index: int) -> Callable:
+    def select(node, root, out):  # pylint: disable=unused-argument
+        children = node._json_children()
+        if children is None or isinstance(children, dict):
+            return
+        if -len(children) <= index < len(children):
+            v = children[index]
+            if v._readable_in(True):
+                out.append(v)
+
+    return select
+
+
+def _slice_selector(start: int | None, end: int | None, step: int | None) -> Callable:
+    sli = slice(start, end, step)
+
+    def select(node, root, out):  # pylint: disable=unused-argument
+        children = node._json_children()
+        if children is None or isinstance(children, dict) or step == 0:
+            return
+        for v in children[sli]:
+            if v._readable_in(True):
+                out.append(v)
+
+    return select
+
+
+def _wildcard_selector(node, root, out):  # pylint: disable=unused-argument
+    out.extend(_readable_children(node))
+
+
+def _filter_selector(test: Callable) -> Callable:
+    def select(node, root, out):
+        for v in _readable_children(node):
+            if test(v, root):
+                out.append(v)
+
+    return select
+
+
+def _child_segment(selectors: list[Callable]) -> Callable:
+    def segment(nodes, root):
+        out = []
+        for node in nodes:
+            for selector in selectors:
+                selector(node, root, out)
+        return out
+
+    return segment
+
+
+def _descendant_segment(selectors: list[Callable]) -> Callable:
+    def segment(nodes, root):
+        out = []
+        for node in nodes:
+            # the node and its descendants, in document order
+            stack = [node]
+            while stack:
+                d = stack.pop()
+                for selector in selectors:
+                    selector(d, root, out)
+                stack.extend(reversed(_readable_children(d)))
+        return out
+
+    return segment
+
+
+def _query(segments: tuple[Callable, ...], absolute: bool) -> Callable:
+    def query(node, root):
+        nodes = [root if absolute else node]
+        for segment in segments:
+            if not nodes:
+                break
+            nodes = segment(nodes, root)
+        return nodes
+
+    return query
+
+
+def _names_query(names: tuple[str, ...], absolute: bool) -> Callable:
+    """
+    Same as :py:func:`_query` for ``@.a.b`` (names only, frequent in filters)
+
+    :meta private:
+    """
+
+    def query(node, root):
+        if absolute:
+            node = root
+        for name in names:
+            children = node._json_children()
+            if not isinstance(children, dict):
+                return []
+            node = children.get(name)
+            if node is None or node._readable_in(True) is False:
+                return []
+        return [node]
+
+    return query
+
+
+class JsonPath:
+    """A compiled rfc 9535 query
+
+    :param path: the query, like ``$.users[?@.age > 30].name``
+    :type path: str
+    :raises SSyntaxError: if the query is invalid
+    """
+
+    __slots__ = ("path", "singular", "_query")
+
+    def __init__(self, path: str):
+        """Constructor method"""
+        self.path = path
+        self._query, self.singular = _Parser(path).parse()
+
+    def __repr__(self):
+        return f"JsonPath({self.path!r})"
+
+    def nodes(self, obj) -> list:
+        """Return the list of objects matched by the query.
+        ``$`` is the root of obj and ``@`` is obj
+
+        :param obj: the object to query
+        :type obj: GenericType
+        :rtype: list[GenericType]
+        """
+        if obj.exists(None) is False:
+            return []
+        return self._query(obj, obj.get_root())
+
+    def select(self, obj) -> Any:
+        """Same as :py:meth:`nodes` but a singular query
+        (names and indexes only) returns the object or None
+
+        :param obj: the object to query
+        :type obj: GenericType
+        """
+        nodes = self.nodes(obj)
+        if self.singular:
+            return nodes[0] if nodes else None
+        return nodes
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def compile_path(path: str) -> JsonPath:
+    """Compile a rfc 9535 query. Compiled queries are kept in cache.
+
+    :param path: the query, like ``$..book[?@.price < 10].title``
+    :type path: str
+    :return: the compiled query
+    :rtype: JsonPath
+    :raises SSyntaxError: if the query is invalid
+    """
+    return JsonPath(path)
+
+
+class _Scanner:
+    """
+    Reading of the tokens of a rfc 9535 query (names, numbers, strings, ...)
+
+    :meta private:
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def error(self, message: str) -> SSyntaxError:
+        """
+        Return the error to raise at the current position
+
+        :param message: what is wrong
+        :type message: str
+        :return: the error
+        :rtype: SSyntaxError
+        """
+        return SSyntaxError(
+            'Invalid JSONPath "{0}": {1} at {2}', self.text, message, self.pos
+        )
+
+    def blank(self) -> None:
+        """
+        Skip blank characters
+        """
+        self.pos = BLANK.match(self.text, self.pos).end()
+
+    def peek(self) -> str:
+        """
+        Return the current character, without reading it
+
+        :return: the character ("" at the end)
+        :rtype: str
+        """
+        return self.text[self.pos : self.pos + 1]
+
+    def accept(self, s: str) -> bool:
+        """
+        Read s if it is at the current position
+
+        :param s: the expected text
+        :type s: str
+        :return: True if read
+        :rtype: bool
+        """
+        if self.text.startswith(s, self.pos):
+            self.pos += len(s)
+            return True
+        return False
+
+    def expect(self, s: str) -> None:
+        """
+        Read s, which must be at the current position
+
+        :param s: the expected text
+        :type s: str
+        :raises SSyntaxError: if s is not there
+        """
+        if not self.accept(s):
+            raise self.error(f"Expecting '{s}'")
+
+    def match(self, regexp: re.Pattern) -> re.Match | None:
+        """
+        Read a token matching regexp at the current position
+
+        :param regexp: the token
+        :type regexp: re.Pattern
+        :return: the match, or None if not there
+        :rtype: re.Match | None
+        """
+        m = regexp.match(self.text, self.pos)
+        if m is not None:
+            self.pos = m.end()
+        return m
+
+    def name(self) -> str:
+        """
+        Read a member name (shorthand)
+
+        :return: the name
+        :rtype: str
+        :raises SSyntaxError: if not a name
+        """
+        m = self.match(NAME)
+        if m is None:
+            raise self.error("Expecting a name")
+        return m.group()
+
+    def integer(self) -> int | None:
+        """
+        Read an integer (I-JSON)
+
+        :return: the integer, or None if not there
+        :rtype: int | None
+        :raises SSyntaxError: if -0 or out of range
+        """
+        m = self.match(INTEGER)
+        if m is None:
+            return None
+        value = int(m.group())
+        if m.group() == "-0" or abs(value) > MAX_INTEGER:
+            raise self.error("Invalid integer")
+        return value
+
+    def string(self) -> str:
+        """
+        Read a string literal, between ' or "
+
+        :return: the string, escapes replaced
+        :rtype: str
+        :raises SSyntaxError: if unterminated or with invalid characters
+        """
+        quote = self.text[self.pos]
+        self.pos += 1
+        chars = []
+        while True:
+            if self.pos >= len(self.text):
+                raise self.error("Unterminated string")
+            c = self.text[self.pos]
+            self.pos += 1
+            if c == quote:
+                return "".join(chars)
+            if c == "\\":
+                e = self.text[self.pos : self.pos + 1]
+                self.pos += 1
+                if e in ESCAPES:
+                    chars.append(ESCAPES[e])
+                elif e == quote:
+                    chars.append(quote)
+                elif e == "u":
+                    chars.append(self.unicode())
+                else:
+                    raise self.error("Invalid escape")
+            elif c < " ":
+                raise self.error("Invalid character in a string")
+            else:
+                chars.append(c)
+
+    def unicode(self) -> str:
+        """
+        Read the XXXX of \\uXXXX (and a low surrogate if any)
+
+        :return: the character
+        :rtype: str
+        :raises SSyntaxError: if not 4 hexadecimal digits
+        """
+        m = self.match(HEX4)
+        if m is None:
+            raise self.error("Invalid unicode escape")
+        code = int(m.group(), 16)
+        if 0xD800 <= code < 0xDC00 and self.text.startswith("\\u", self.pos):
+            low = HEX4.match(self.text, self.pos + 2)
+            if low is not None and 0xDC00 <= int(low.group(), 16) < 0xE000:
+                self.pos = low.end()
+                code = 0x10000 + ((code - 0xD800) << 10) + int(low.group(), 16) - 0xDC00
+        return chr(code)
+
+
+class _Parser(_Scanner):
+    """
+    Recursive descent parser of rfc 9535 queries
+
+    :meta private:
+    """
+
+    def parse(self) -> tuple[Callable, bool]:
+        """
+        Read the whole query
+
+        :return: ( the query, True if singular )
+        :rtype: tuple[Callable, bool]
+        :raises SSyntaxError: if the query is invalid
+        """
+        query, singular = self.query()
+        if self.pos != len(self.text):
+            raise self.error("Unexpected character")
+        return query, singular
+
+    def query(self) -> tuple[Callable, bool]:
+        """
+        ``$`` or ``@`` followed by segments.
+
+        :return: ( the query, True if singular )
+        :rtype: tuple[Callable, bool]
+        """
+        if self.accept("$"):
+            absolute = True
+        elif self.accept("@"):
+            absolute = False
+        else:
+            raise self.error("Expecting '$' or '@'")
+
+        segments = []
+        names = []
+        singular = True
+        while True:
+            start = self.pos
+            self.blank()
+            found = self.segment()
+            if found is None:
+                self.pos = start
+                break
+            segment, name, is_singular = found
+            segments.append(segment)
+            if name is not None:
+                names.append(name)
+            singular = singular and is_singular
+        if len(names) == len(segments):
+            return _names_query(tuple(names), absolute), singular
+        return _query(tuple(segments), absolute), singular
+
+    def segment(self) -> tuple[Callable, str | None, bool] | None:
+        """
+        ``..selector``, ``.name``, ``.*`` or ``[ ... ]``
+
+        :return: ( the segment, the name for ``.name``, True if singular ),
+            or None if no segment
+        :rtype: tuple[Callable, str | None, bool] | None
+        """
+        if self.accept(".."):
+            if self.accept("*"):
+                selectors = [_wildcard_selector]
+            elif self.peek() == "[":
+                selectors, _ = self.bracketed()
+            else:
+                selectors = [_name_selector(self.name())]
+            return _descendant_segment(selectors), None, False
+        if self.accept("."):
+            if self.accept("*"):
+                return _child_segment([_wildcard_selector]), None, False
+            name = self.name()
+            return _child_segment([_name_selector(name)]), name, True
+        if self.peek() == "[":
+            selectors, singular = self.bracketed()
+            return _child_segment(selectors), None, singular
+        return None
+
+    def bracketed(self) -> tuple[list[Callable], bool]:
+        """
+        ``[ selector, selector... ]``
+
+        :return: ( the selectors, True if singular )
+        :rtype: tuple[list[Callable], bool]
+        """
+        self.expect("[")
+        selectors = []
+        singular = True
+        while True:
+            self.blank()
+            selector, is_singular = self.selector()
+            selectors.append(selector)
+            singular = singular and is_singular
+            self.blank()
+            if self.accept("]"):
+                break
+            self.expect(",")
+        return selectors, singular and len(selectors) == 1
+
+    def selector(self) -> tuple[Callable, bool]:
+        """
+        A name, ``*``, a filter, an index or a slice
+
+        :return: ( the selector, True if singular )
+        :rtype: tuple[Callable, bool]
+        """
+        c = self.peek()
+        if c in ("'", '"'):
+            return _name_selector(self.string()), True
+        if self.accept("*"):
+            return _wildcard_selector, False
+        if self.accept("?"):
+            self.blank()
+            return _filter_selector(_FilterParser(self).logical_or()), False
+
+        start = self.integer()
+        self.blank()
+        if not self.accept(":"):
+            if start is None:
+                raise self.error("Expecting a selector")
+            return _index_selector(start), True
+        self.blank()
+        end = self.integer()
+        self.blank()
+        step = None
+        if self.accept(":"):
+            self.blank()
+            step = self.integer()
+        return _slice_selector(start, end, step), False
+
+
+class _FilterParser:
+    """
+    Parser of the logical expression of a filter ``?...``,
+    reading the text of a :py:class:`_Parser`
+
+    :param parser: the parser of the query
+    :type parser: _Parser
+
+    :meta private:
+    """
+
+    def __init__(self, parser: _Parser):
+        self.parser = parser
+
+    def logical_or(self) -> Callable:
+        """
+        ``test || test ...``
+
+        :return: the test ``f( node, root )``
+        :rtype: Callable
+        """
+        p = self.parser
+        tests = [self.logical_and()]
+        while True:
+            p.blank()
+            if not p.accept("||"):
+                break
+            p.blank()
+            tests.append(self.logical_and())
+        if len(tests) == 1:
+            return tests[0]
+        return lambda node, root: any(t(node, root) for t in tests)
+
+    def logical_and(self) -> Callable:
+        """
+        ``test && test ...``
+
+        :return: the test ``f( node, root )``
+        :rtype: Callable
+        """
+        p = self.parser
+        tests = [self.basic()]
+        while True:
+            p.blank()
+            if not p.accept("&&"):
+                break
+            p.blank()
+            tests.append(self.basic())
+        if len(tests) == 1:
+            return tests[0]
+        return lambda node, root: all(t(node, root) for t in tests)
+
+    def basic(self) -> Callable:
+        """
+        ``( ... )``, ``!test``, a test or a comparison
+
+        :return: the test ``f( node, root )``
+        :rtype: Callable
+        """
+        p = self.parser
+        if p.accept("!"):
+            p.blank()
+            if p.accept("("):
+                test = self.parenthesized()
+            else:
+                test = self.as_test(*self.operand())
+            return lambda node, root: not test(node, root)
+        if p.accept("("):
+            return self.parenthesized()
+
+        left = self.operand()
+        p.blank()
+        m = p.match(COMPARISON)
+        if m is None:
+            return self.as_test(*left)
+        p.blank()
+        right = self.operand()
+        compare = COMPARATORS[m.group()]
+        a = self.as_value(*left)
+        b = self.as_value(*right)
+        return lambda node, root: compare(a(node, root), b(node, root))
+
+    def parenthesized(self) -> Callable:
+        """
+        The end of ``( ... )``, after the (
+
+        :return: the test ``f( node, root )``
+        :rtype: Callable
+        """
+        p = self.parser
+        p.blank()
+        test = self.logical_or()
+        p.blank()
+        p.expect(")")
+        return test
+
+    def operand(self) -> tuple[str, Callable, bool]:
+        """
+        A query, a literal or a function.
+
+        :return: ( type, function, singular )
+        :rtype: tuple[str, Callable, bool]
+        """
+        p = self.parser
+        c = p.peek()
+        if c in ("$", "@"):
+            query, singular = p.query()
+            return NODES, query, singular
+        if c in ("'", '"'):
+            return _constant(p.string())
+        m = p.match(NUMBER)
+        if m is not None:
+            if m.group(1) or m.group(2):
+                return _constant(float(m.group()))
+            return _constant(int(m.group()))
+        m = p.match(FUNCTION)
+        if m is not None:
+            return self.function(m.group(1))
+        for literal, value in LITERALS.items():
+            if p.accept(literal):
+                return _constant(value)
+        raise p.error("Expecting a value")
+
+    def function(self, name: str) -> tuple[str, Callable, bool]:
+        """
+        The arguments of a function, after ``name(``
+
+        :param name: the name of the function
+        :type name: str
+        :return: ( type of the result, function, False )
+        :rtype: tuple[str, Callable, bool]
+        :raises SSyntaxError: if unknown or with bad arguments
+        """
+        p = self.parser
+        if name not in FUNCTIONS:
+            raise p.error(f"Unknown function {name}()")
+        parameters, result, function = FUNCTIONS[name]
+        arguments = []
+        p.blank()
+        if not p.accept(")"):
+            while True:
+                p.blank()
+                arguments.append(self.operand())
+                p.blank()
+                if p.accept(")"):
+                    break
+                p.expect(",")
+        if len(arguments) != len(parameters):
+            raise p.error(f"{name}() takes {len(parameters)} arguments")
+
+        args = []
+        for parameter, argument in zip(parameters, arguments):
+            if parameter == VALUE:
+                args.append(self.as_value(*argument))
+            elif argument[0] == NODES:
+                args.append(argument[1])
+            else:
+                raise p.error(f"{name}() expects a query")
+
+        if len(args) == 1:
+            a = args[0]
+            return result, lambda node, root: function(a(node, root)), False
+        a, b = args[0], args[1]
+        return (
+            result,
+            lambda node, root: function(a(node, root), b(node, root)),
+            False,
+        )
+
+    def as_value(self, kind: str, function: Callable, singular: bool) -> Callable:
+        """
+        A comparable : a literal, a singular query or a function returning a value
+
+        :param kind: the type of the operand
+        :param function: the operand
+        :param singular: True if a singular query
+        :return: the value ``f( node, root )``
+        :rtype: Callable
+        """
+        if kind == VALUE:
+            return function
+        if kind == NODES and singular:
+            return lambda node, root: _value(function(node, root))
+        raise self.parser.error("Expecting a value or a singular query")
+
+    def as_test(  # pylint: disable=unused-argument
+        self, kind: str, function: Callable, singular: bool
+    ) -> Callable:
+        """
+        A test : a query (existence) or a logical function
+
+        :param kind: the type of the operand
+        :param function: the operand
+        :param singular: not used
+        :return: the test ``f( node, root )``
+        :rtype: Callable
+        """
+        if kind == LOGICAL:
+            return function
+        if kind == NODES:
+            return lambda node, root: len(function(node, root)) > 0
+        raise self.parser.error("Expecting a test")
@@ -1,9 +1,22 @@
 """Module providing the List() Class"""
 
-from .generic import GenericType
+import copy
+from .generic import (
+    GenericType,
+    SpecAttribute,
+    with_decisions,
+    forget_decisions,
+    cached_digest,
+)
 from .list_and_tuple import ListAndTuple
-from .error import STypeError, SConstraintError
-from .selector import Selector
+from .undoable_list import UndoableList
+from .error import STypeError, SConstraintError, NodePath
+from .json_reader import read_elements, DEFAULT_CHUNK_SIZE
+from .list_index import ListIndex
+from .query import Query
+from .diff import diff_elements
+from .transaction import Transaction, log_change
+from .selector import Selector, parse_slice
 from .toolbox import validation_parameters
 from .kparse import Kparse
 
@@ -15,12 +28,24 @@ KPARSE_MODEL = {
 
 
 class List(
-    ListAndTuple
+    UndoableList
 ):  # pylint: disable=too-many-instance-attributes, too-many-public-methods
     """
     A Dict Type
     """
 
+    __slots__ = ()
+
+    _digest_tag = b"L"
+    _value_type = list
+
+    _type = SpecAttribute("_type")
+    _min = SpecAttribute("_min")
+    _max = SpecAttribute("_max")
+    _uniq = SpecAttribute("_uniq")
+
+    _match_kind = "list"
+
     @validation_parameters
     def __init__(self, class_type: GenericType, **kwargs):
         """
@@ -34,10 +59,10 @@ class List(
         self._max = options.get("max")
         self._uniq = options.get("uniq")
 
-        ListAndTuple.__init__(self, **kwargs)
+        UndoableList.__init__(self, **kwargs)
         self._json_path_separator = ""
 
-    def get_schema(self):
+    def _build_schema(self):
         """Return meta information for a float
 
         :param self: Description
@@ -47,11 +72,11 @@ class List(
 
         :meta private:
         """
-        a = GenericType.get_schema(self)
+        a = GenericType._build_schema(self)
         a["min"] = self.get_as_string(self._min)
         a["max"] = self.get_as_string(self._max)
         a["uniq"] = self.get_as_string(self._uniq)
-        a["sub_type"] = self._type.get_schema()
+        a["sub_type"] = self._type._schema_of()
         return a
 
     def get_current_meta(self, parent: dict = None):
@@ -88,6 +113,11 @@ class List(
         if isinstance(other, List) is False:
             return False
 
+        # same digests (see digest())
+        same = self._same_content(other)
+        if same is not None:
+            return same
+
         if v != GenericType.get_value(other):
             return False
 
@@ -142,6 +172,9 @@ class List(
         if other is None:
             return v is None
 
+        if isinstance(other, Query):
+            return other.match(self)
+
         # A list. Do a patch on each element
         if isinstance(other, list):
             if self._value is None:
@@ -174,6 +207,10 @@ class List(
         if isinstance(other, List) is False:
             return True
 
+        same = self._same_content(other)
+        if same is not None:
+            return not same
+
         if v == GenericType.get_value(other):
             return False
         return True
@@ -224,20 +261,7 @@ class List(
         """
         Parses a `slice()` from string, like `start:stop:step`.
         """
-        parts = slice_as_string.split(":")
-        try:
-            if len(parts) == 1:
-                # slice(stop)
-                return int(slice_as_string)
-            if len(parts) == 2:
-                # slice(start,stop)
-                return slice(int(parts[0]), int(parts[1]))
-            if len(parts) == 3:
-                # slice(start,stop,step)
-                return slice(int(parts[0]), int(parts[1]), int(parts[2]))
-        except ValueError:
-            pass
-        return None
+        return parse_slice(slice_as_string)
 
     def get_selectors(
         self, index_or_slice: str, sel: Selector
@@ -282,13 +306,16 @@ class List(
         """
         Do List.clear() as list.clear() (with checks)
         """
-        self.check([])
-        self._value.clear()
+        self._check_change(0, [], list)
+
+        previous = self._value
+        self._value = []
+        self._reindex()
+        self._set_undo(lambda: self._restore(previous))
 
     def duplicate_in_list(self):
         """
         Copy the list self._value to another list
-        used to check() on this list before modification
         """
         a = []
         v = GenericType.get_value(self)
@@ -300,210 +327,509 @@ class List(
             a.append(i.copy())
         return a
 
-    def insert(self, key, value):
+    def _current(self) -> list:
         """
-        Do a list.insert()
+        Return the list of elements, without creating it (empty if None).
+        Checks use it, so a rejected modification does not change the value.
+
+        :meta private:
         """
-        # Duplicate and check
-        a = self.duplicate_in_list()
-        model = self._type.copy()
-        model._parent = self
-        model._attribute_name = f"[{key}]"
-        model.set(value)
-        a.insert(key, model)
-        self.check(a)
+        v = GenericType.get_value(self)
+        return v if isinstance(v, list) else []
+
+    def _elements(self) -> list:
+        """
+        Return the list of elements to modify (create it if needed)
 
-        self._old_value = self.duplicate_in_list()
+        :meta private:
+        """
         v = GenericType.get_value(self)
         if not isinstance(v, list):
+            if Transaction.count:
+                log_change(self, self._value)
             self._value = []
+        return self._value
 
-        self._value.insert(key, model)
+    def _new_element(self, attribute_name: str, value):
+        """
+        Create and check a new element for this list
 
-    def __setitem__(self, key, value):
+        :meta private:
         """
-        Do a list[key] = value
+        # build the compiled plan once, so all copies share it
+        self._type._plan()
+        model = self._type._copy_node()
+        model._attach(self, attribute_name)
+        model.set(value)
+        return model
+
+    def _needs_full_check(self) -> bool:
+        """
+        True if the list level checks cannot be done only on the modification
+        (transform, union, constraints or rights may look at the whole list)
+
+        :meta private:
+        """
+        return (
+            self._permissions._enabled
+            or callable(self._transform)
+            or bool(self._union)
+            or bool(self._constraints)
+        )
+
+    def _check_change(
+        self, length: int, added: list, candidate, removed: list = ()
+    ) -> None:
+        """
+        Check a modification before doing it. Elements in ``added``
+        are already checked, so only the list level checks are done,
+        on the new length and the added elements (replacing ``removed`` ones).
+        ``candidate()`` builds the list after the modification,
+        only when the whole list must be checked.
+
+        :meta private:
+        """
+        if self._needs_full_check():
+            GenericType.check(self, candidate())
+            return
+
+        if self._min is not None and length < self._min:
+            raise SConstraintError(
+                '{0}: Must be above Minimal (value="{value}")',
+                NodePath(self),
+                value=candidate(),
+            )
+        if self._max is not None and length > self._max:
+            raise SConstraintError(
+                '{0}: Must be below Maximal (value="{value}")',
+                NodePath(self),
+                value=candidate(),
+            )
+        if self._uniq is True and added:
+            duplicates = self._digest_index().has_duplicates(added, removed)
+            if duplicates is False:
+                return
+            a = candidate()
+            digests = [cached_digest(e) or e._digest_of(False) for e in a]
+            for x in added:
+                if None in digests:
+                    count = a.count(x)
+                else:
+                    count = digests.count(x._digest_of(False))
+                if count > 1:
+                    raise SConstraintError(
+                        '{0}: duplicate value in list (value="{value}")',
+                        NodePath(self),
+                        value=a,
+                    )
+
+    def insert(self, key, value):
         """
+        Do a list.insert()
+        """
+        model = self._new_element(f"[{key}]", value)
+        v = GenericType.get_value(self)
+        length = len(v) if isinstance(v, list) else 0
+
+        def candidate():
+            a = self._current().copy()
+            a.insert(key, model)
+            return a
+
+        self._check_change(length + 1, [model], candidate)
+        self._insert_element(key, model)
 
-        # Duplicate and check
-        a = self.duplicate_in_list()
+    def _insert_element(self, key: int, model) -> None:
+        """
+        Insert an element (without checks) where list.insert() would
+
+        :meta private:
+        """
+        v = self._elements()
+        length = len(v)
+        # the position where list.insert() put it
+        index = key if key >= 0 else max(length + key, 0)
+        index = min(index, length)
+        v.insert(index, model)
+        self._index_add([model])
+        if index < length:
+            self.reset_attribute_name()
+        else:
+            model._attribute_name = f"[{index}]"
 
+        def undo():
+            del v[index]
+            self.reset_attribute_name()
+
+        self._set_undo(undo)
+
+    def __setitem__(self, key, value):
+        """
+        Do a list[key] = value
+        """
         if isinstance(key, slice):
             models = []
             for v in value:
-                model = self._type.copy()
-                model._parent = self
-                model._attribute_name = "[slice]"
-                model.set(v)
-                models.append(model)
+                models.append(self._new_element("[slice]", v))
+
+            previous = self._value
+            a = self._current().copy()
             a.__setitem__(key, models)
-            self.check(a)
+            self._check_change(len(a), models, lambda: a, self._current()[key])
 
-            self._old_value = self.duplicate_in_list()
-            self._value.__setitem__(key, models)
-        else:
-            model = self._type.copy()
-            model._parent = self
-            model._attribute_name = f"[{key}]"
-            model.set(value)
-            a[key].set(value)
-            self.check(a)
+            self._value = a
+            self.reset_attribute_name()
+            self._reindex()
+            self._set_undo(lambda: self._restore(previous))
+            return
+
+        model = self._new_element(f"[{key}]", value)
+        v = self._current()
+        old = v[key]
+        index = key if key >= 0 else len(v) + key
 
-            self._old_value = self.duplicate_in_list()
-            self._value.__setitem__(key, model)
+        def candidate():
+            a = v.copy()
+            a[index] = model
+            return a
+
+        self._check_change(len(v), [model], candidate, [old])
+
+        v[index] = model
+        model._attribute_name = f"[{index}]"
+        self._index_remove([old])
+        self._index_add([model])
+
+        def undo():
+            v[index] = old
+
+        self._set_undo(undo)
 
     def __delitem__(self, key):
         """
         Do a del (list[key])
         """
+        v = self._current()
+        if isinstance(key, slice):
+            previous = self._value
+            a = v.copy()
+            a.__delitem__(key)
+            self._check_change(len(a), [], lambda: a)
+
+            self._value = a
+            self.reset_attribute_name()
+            self._reindex()
+            self._set_undo(lambda: self._restore(previous))
+            return
 
-        # Duplicate and check
-        a = self.duplicate_in_list()
-        a.__delitem__(key)
-        self.check(a)
+        removed = v[key]
+        index = key if key >= 0 else len(v) + key
+        self._remove_at(index, removed)
 
-        self._old_value = self.duplicate_in_list()
-        self._value.__delitem__(key)
-        self.reset_attribute_name()
+    def _remove_at(self, index: int, removed) -> None:
+        """
+        Remove (with checks) the element at the index
+
+        :meta private:
+        """
+        v = self._value
+
+        def candidate():
+            a = v.copy()
+            del a[index]
+            return a
+
+        self._check_change(len(v) - 1, [], candidate)
+        self._delete_element(index, removed)
+
+    def _delete_element(self, index: int, removed) -> None:
+        """
+        Remove (without checks) the element at the index
+
+        :meta private:
+        """
+        v = self._value
+        del v[index]
+        self._index_remove([removed])
+        if index < len(v):
+            self.reset_attribute_name()
+
+        def undo():
+            v.insert(index, removed)
+            self.reset_attribute_name()
+
+        self._set_undo(undo)
 
     def sort(self, **kwarg):
         """
         Do a sort(List) like sort(list)
         """
-
-        # Duplicate and check
-        a = self.duplicate_in_list()
+        previous = self._value
+        a = self._current().copy()
         a.sort(**kwarg)
-        self.check(a)
-
-        v = GenericType.get_value(self)
-        if not isinstance(v, list):
-            self._value = []
+        # the length and the elements do not change
+        if self._needs_full_check():
+            GenericType.check(self, a)
 
-        return self._value.sort(**kwarg)
+        self._value = a
+        self.reset_attribute_name()
+        self._set_undo(lambda: self._restore(previous))
 
     def pop(self, key=-1):
         """
         Do a List.pop() like list.pop()
         """
-
-        # Build a list to modify and check if ok before
-        # doing the pop
-        a = self.duplicate_in_list()
-        a.pop(key)
-        self.check(a)
-
-        self._old_value = self.duplicate_in_list()
-
-        v = GenericType.get_value(self)
-        popped = v.pop(key)
-        self.reset_attribute_name()
+        v = self._current()
+        if not v:
+            raise IndexError("pop from empty list")
+        try:
+            popped = v[key]
+        except IndexError as e:
+            raise IndexError("pop index out of range") from e
+        index = key if key >= 0 else len(v) + key
+        self._remove_at(index, popped)
         return popped
 
     def remove(self, value):
         """
         Do a List.remove(value) like list.remove(value)
         """
-
-        # Duplicate and check
-        a = self.duplicate_in_list()
-        a.remove(value)
-        self.check(a)
-
-        self._old_value = self.duplicate_in_list()
-        removed = self._value.remove(value)
-        self.reset_attribute_name()
-        return removed
+        v = self._current()
+        for index, item in enumerate(v):
+            if item == value:
+                self._remove_at(index, item)
+                return
+        raise ValueError("list.remove(x): x not in list")
 
     def append(self, value):
         """
         Do a List.append(value) like list.append(value)
         """
+        length = len(self)
+        model = self._new_element(f"[{length}]", value)
 
-        model = self._type.copy()
-        model._parent = self
-        model._attribute_name = f"[{len(self)}]"
-        model.set(value)
-
-        # Duplicate and check
-        a = self.duplicate_in_list()
-        a.append(model)
-        self.check(a)
-
-        self._old_value = self.duplicate_in_list()
-        v = GenericType.get_value(self)
-        if not isinstance(v, list):
-            self._value = []
+        self._check_change(length + 1, [model], lambda: self._current() + [model])
 
-        self._value.append(model)
+        v = self._elements()
+        v.append(model)
+        self._index_add([model])
+        self._set_undo(v.pop)
 
     def extend(self, second_list):
         """
         Do a List.extend(second_list) like list.extend(second_list)
         """
-        # Duplicate and check
-        a = self.duplicate_in_list()
+        length = len(self)
         models = []
-        i = len(self)
         for value in second_list:
-            model = self._type.copy()
-            model._parent = self
-            model._attribute_name = f"[{i}]"
-            model.set(value)
-            a.append(model)
-            models.append(model)
-            i = i + 1
-        self.check(a)
-
-        self._old_value = self.duplicate_in_list()
+            models.append(self._new_element(f"[{length + len(models)}]", value))
+
+        self._check_change(
+            length + len(models), models, lambda: self._current() + models
+        )
+
+        v = self._elements()
+        v.extend(models)
+        self._index_add(models)
+
+        def undo():
+            del v[length:]
+
+        self._set_undo(undo)
+
+    def load_stream(self, stream, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Set the value from a JSON array read in a stream (text or binary),
+        element by element : each element is checked and added without loading
+        the whole array in memory. The list is modified only if all elements are valid.
+
+        :param stream: a file object with a JSON array
+        :param chunk_size: number of characters (or bytes) read at once
+        :type chunk_size: int
+        :raises SSyntaxError: if the stream is not a JSON array
+        :raises StrictoError: if an element is not valid (its path is ``$[index]...``)
+        """
+        models = read_elements(self, stream, chunk_size)
+        self._check_change(len(models), models, lambda: models, self._current())
+
+        previous = self._value
+        self._value = models
+        self._reindex()
+        self._set_undo(lambda: self._restore(previous))
+
+    def _patch_index(self, elements: list, step, position: int) -> int:
+        """
+        Return the index in elements given by the path of a step
+        of :py:meth:`patch_many` ("-" is the end of the list for "add")
+
+        :meta private:
+        """
+        token = step.tokens[position]
+        size = len(elements)
+        adding = step.op == "add" and position + 1 == len(step.tokens)
+        if token == "-" and adding:
+            return size
+        if not token.lstrip("-").isdigit():
+            raise self._not_found(step)
+        index = int(token)
+        if index < 0:
+            index += size
+        if not 0 <= index < size + adding:
+            raise self._not_found(step)
+        return index
+
+    def _removed_index(self, elements: list, step) -> int:
+        """
+        Return the index to remove given as value (see :py:meth:`patch_internal`)
+
+        :meta private:
+        """
+        index = step.value
+        if not isinstance(index, int) or not -len(elements) <= index < len(elements):
+            raise self._not_found(step)
+        return index if index >= 0 else index + len(elements)
+
+    def _patch_value(self, value, step, position):
+        if position == len(step.tokens):
+            if step.op == "add":
+                value = value if isinstance(value, list) else []
+                value.append(copy.deepcopy(step.value))
+                return value
+            if step.op == "remove":
+                del value[self._removed_index(value or [], step)]
+                return value
+            return GenericType._patch_value(self, value, step, position)
+
+        if not isinstance(value, list):
+            raise self._not_found(step)
+        index = self._patch_index(value, step, position)
+        if position + 1 == len(step.tokens):
+            if step.op == "add":
+                value.insert(index, copy.deepcopy(step.value))
+                return value
+            if step.op == "remove":
+                del value[index]
+                return value
+        value[index] = self._type._patch_value(value[index], step, position + 1)
+        return value
+
+    def _patch_node(self, step, position):
+        if position == len(step.tokens):
+            if step.op == "add":
+                v = self._elements()
+                self._insert_element(len(v), self._patch_element(len(v), step.value))
+            elif step.op == "remove":
+                v = self._value
+                index = self._removed_index(v, step)
+                self._delete_element(index, v[index])
+            else:
+                GenericType._patch_node(self, step, position)
+            return
+
+        v = self._value
+        index = self._patch_index(v, step, position)
+        if position + 1 == len(step.tokens):
+            if step.op == "add":
+                self._insert_element(index, self._patch_element(index, step.value))
+                return
+            if step.op == "remove":
+                self._delete_element(index, v[index])
+                return
+        v[index]._patch_node(step, position + 1)
+
+    def _diff(self, other, path, operations):
         v = GenericType.get_value(self)
-        if not isinstance(v, list):
-            self._value = []
+        o = GenericType.get_value(other) if isinstance(other, List) else None
+        if not isinstance(v, list) or not isinstance(o, list):
+            GenericType._diff(self, other, path, operations)
+            return
+        if self._same_content(other) is True:
+            return
+        diff_elements(v, o, path, operations)
 
-        self._value.extend(models)
+    def _patch_element(self, index: int, value):
+        """
+        Create a new element (without checks) for :py:meth:`patch_many`
+
+        :meta private:
+        """
+        model = self._type._copy_node()
+        model._attach(self, f"[{index}]")
+        model.set_value_without_checks(value)
+        return model
 
     def set_value_without_checks(self, value):
         """
         @overwrite GenericType.setWithoutcheck
         """
+        forget_decisions()
+        if Transaction.count:
+            log_change(self, self._value)
+        self._forget_digest()
+        self._old_value = self._value
+        self._undo = None
         if value is None:
             self._value = None
-            return
-
-        if not isinstance(self._value, list):
+        else:
             self._value = []
 
-        self._value.clear()
-
-        if not isinstance(value, (List, list)):
-            return
+        if isinstance(value, (List, list)):
+            i = 0
+            for v in value:
+                model = self._type._copy_node()
+                model._attach(self, f"[{i}]")
+                model.set_value_without_checks(v)
+                self._value.append(model)
+                i = i + 1
 
-        i = 0
-        for v in value:
-            model = self._type.copy()
-            model._parent = self
-            model._attribute_name = f"[{i}]"
-            model.set_value_without_checks(v)
-            self._value.append(model)
-            i = i + 1
+        self._reindex()
+        if ListIndex.live:
+            self._notify_indexes()
 
     def check(self, value) -> None:
-        GenericType.check(self, value)
+        self._check_compiled(value)
 
-        # check all values
-        if isinstance(value, list):
-            i = 0
-            for v in value:
-                self._type.check(v)
-                i = i + 1
-            return
+    def _element_types(self):
+        return (self._type,)
 
-        if isinstance(value, List):
-            i = 0
-            for v in value:
-                self._type.check(v.get_value())
-                i = i + 1
+    def _candidate_child(self, value, key):
+        if not isinstance(value, list) or not isinstance(key, int):
+            return None
+        if not -len(value) <= key < len(value):
+            return None
+        return self._type, value[key]
+
+    def _compile(self):
+        """
+        Build the inner validator for this List and its elements
+        (see :py:meth:`GenericType.compile`)
 
+        :meta private:
+        """
+        if type(self).check is not List.check:
+            return self._compile_fallback()
+
+        prelude = self._compile_generic()
+        sub_validate = self._type._plan()
+
+        def validate(node, value, root, alive):  # pylint: disable=unused-argument
+            prelude(node, value, root)
+
+            # check all values
+            if isinstance(value, list):
+                model = node._type
+                for v in value:
+                    sub_validate(model, v, root, True)
+                return
+
+            if isinstance(value, List):
+                model = node._type
+                for v in value:
+                    sub_validate(model, v.get_value(), root, True)
+
+        return validate
+
+    @with_decisions
     def get_value(self):
         """
         @overwrite GenericType.get_value()
@@ -517,6 +843,7 @@ class List(
             a.append(element.get_value())
         return a
 
+    @with_decisions
     def get_encoded(self) -> list:
         """Return the encoded value
 
@@ -533,6 +860,12 @@ class List(
             a.append(element.get_encoded())
         return a
 
+    def _write_encoded(self, parts):
+        if type(self).get_encoded is not List.get_encoded:
+            GenericType._write_encoded(self, parts)
+            return
+        self._write_elements(parts, False)
+
     def check_type(self, value):
         """
         check if conplain to model or return a error string
@@ -544,7 +877,7 @@ class List(
             return True
 
         raise STypeError(
-            '{0}: Must be a list (value="{value}")', self.path_name(), value=value
+            '{0}: Must be a list (value="{value}")', NodePath(self), value=value
         )
 
     def check_constraints(self, value):
@@ -555,14 +888,14 @@ class List(
             if len(value) < self._min:
                 raise SConstraintError(
                     '{0}: Must be above Minimal (value="{value}")',
-                    self.path_name(),
+                    NodePath(self),
                     value=value,
                 )
         if self._max is not None:
             if len(value) > self._max:
                 raise SConstraintError(
                     '{0}: Must be below Maximal (value="{value}")',
-                    self.path_name(),
+                    NodePath(self),
                     value=value,
                 )
 
@@ -571,7 +904,7 @@ class List(
                 if value.count(x) > 1:
                     raise SConstraintError(
                         '{0}: duplicate value in list (value="{value}")',
-                        self.path_name(),
+                        NodePath(self),
                         value=value,
                     )
 
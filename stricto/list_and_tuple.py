@@ -1,7 +1,8 @@
 """Module providing the List() Class"""
 
 import copy
-from .generic import GenericType, ViewType
+from .generic import GenericType, ViewType, with_decisions, cached_digest
+from .digest import new_hash
 
 
 class ListAndTuple(GenericType):  # pylint: disable=too-many-instance-attributes
@@ -9,6 +10,8 @@ class ListAndTuple(GenericType):  # pylint: disable=too-many-instance-attributes
     A Mutualisation for List and Tuples
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         """
         initialisation, set class_type and some parameters
@@ -16,17 +19,65 @@ class ListAndTuple(GenericType):  # pylint: disable=too-many-instance-attributes
 
         GenericType.__init__(self, **kwargs)
 
-    def __copy__(self):
-        result = GenericType.__copy__(self)
+    def _copy_node(self):
+        result = GenericType._copy_node(self)
         # result.__dict__.update(self.__dict__)
         result._value = None
         v = GenericType.get_value(self)
         if isinstance(v, list):
             result._value = []
             for i in v:
-                result._value.append(copy.copy(i))
+                if not isinstance(i, GenericType):
+                    # a default value not set yet
+                    result._value.append(copy.copy(i))
+                    continue
+                sub = i._copy_node()
+                sub._parent = result
+                sub._attribute_name = i._attribute_name
+                result._value.append(sub)
+        # nothing to roll back (elements of the previous value are not copied)
+        result._old_value = result._value
         return result
 
+    def _sub_nodes(self):
+        v = GenericType.get_value(self)
+        if not isinstance(v, list):
+            return ()
+        return [i for i in v if isinstance(i, GenericType) and i._parent is self]
+
+    def _json_children(self):
+        return self._value
+
+    def _compute_digest(self, full):
+        v = GenericType.get_value(self)
+        if v is None and not callable(self._default_value):
+            self._digest = new_hash(self._digest_tag + b"n").digest()
+            return self._digest
+        if not isinstance(v, list):
+            return GenericType._compute_digest(self, full)
+        h = new_hash(self._digest_tag)
+        kept = True
+        for element in v:
+            if not isinstance(element, GenericType):
+                # a default value not set yet
+                kept = False
+                if not full:
+                    break
+                h.update(repr(element).encode())
+                continue
+            digest = cached_digest(element)
+            if not digest:
+                digest = element._digest_of(full)
+                if digest is None:
+                    kept = False
+                    break
+                kept = kept and cached_digest(element) is not False
+            h.update(digest)
+        self._digest = h.digest() if kept else False
+        if not kept and not full:
+            return None
+        return h.digest()
+
     def enable_permissions(self):
         """
         set permissions to on
@@ -72,6 +123,35 @@ class ListAndTuple(GenericType):  # pylint: disable=too-many-instance-attributes
             a.append(i.get_encoded())
         return a
 
+    def _write_json(self, parts):
+        if type(self).__json_encode__ is not ListAndTuple.__json_encode__:
+            GenericType._write_json(self, parts)
+            return
+        self._write_elements(parts, True)
+
+    def _write_elements(self, parts: list[str], readable_only: bool) -> None:
+        """
+        Append elements as :py:meth:`get_encoded` in a JSON array to parts
+
+        :meta private:
+        """
+        v = GenericType.get_value(self)
+        if v is None:
+            parts.append("null")
+            return
+        parts.append("[")
+        first = True
+        alive = self.exists(None) is not False
+        for i in v:
+            if readable_only and i._readable_in(alive) is False:
+                continue
+            if first is False:
+                parts.append(", ")
+            first = False
+            i._write_encoded(parts)
+        parts.append("]")
+
+    @with_decisions
     def get_view(self, view_name, final=True):  # pylint: disable=protected-access
         """
         Return all elements belonging to view_name
@@ -90,9 +170,7 @@ class ListAndTuple(GenericType):  # pylint: disable=too-many-instance-attributes
         if v is None:
             return (ViewType.NO, None) if final is False else None
 
-        cls = self.__class__
-        result = cls.__new__(cls)
-        result.__dict__.update(self.__dict__)
+        result = self._clone()
         result._value = []  # pylint: disable=protected-access
         for i in v:
             if i.exists_or_can_read() is False:
@@ -110,3 +188,96 @@ class ListAndTuple(GenericType):  # pylint: disable=too-many-instance-attributes
         #     if len(result) == 0:
         #        return (ViewType.NO, None) if final is False else None
         return (ViewType.YES, result) if final is False else result
+
+    @with_decisions
+    def _in_view(self, view_name):
+        my_view = self._belongs_to_view(view_name)
+        if my_view is ViewType.NO:
+            return False
+        if my_view is ViewType.YES:
+            return True
+        return GenericType.get_value(self) is not None
+
+    def _always_in_view(self, view_name):
+        return (
+            self._exists is True
+            and self._belongs_to_view(view_name) is ViewType.YES
+        )
+
+    def _element_types(self) -> tuple[GenericType, ...]:
+        """
+        Return the types of elements (see :py:meth:`_all_in_view`).
+        Overwritten by List and Tuple.
+
+        :meta private:
+        """
+        return ()
+
+    def _all_in_view(self, view_name) -> bool:
+        """
+        Return True if all elements are in a view (see :py:meth:`_view_items`),
+        known from rules only
+
+        :meta private:
+        """
+        my_view = self._belongs_to_view(view_name)
+        if my_view in (ViewType.YES, ViewType.NO):
+            return my_view is ViewType.YES
+        if self._permissions._enabled or self.exists(None) is False:
+            return False
+        return all(model._always_in_view(view_name) for model in self._element_types())
+
+    def _project(self, view_name, encoded):
+        my_view = self._belongs_to_view(view_name)
+        if my_view is ViewType.YES:
+            return True, self.get_encoded() if encoded else self.get_value()
+        elements = GenericType.get_value(self)
+        if my_view is ViewType.NO or elements is None:
+            return False, None
+        a = []
+        for element in elements:
+            if element.exists_or_can_read() is False:
+                continue
+            inside, value = element._project(view_name, encoded)
+            if inside:
+                a.append(value)
+        return True, self._value_type(a)
+
+    def _view_items(self, view_name):
+        my_view = self._belongs_to_view(view_name)
+        elements = GenericType.get_value(self)
+        if my_view is ViewType.NO or elements is None:
+            return
+        if my_view is ViewType.YES:
+            # all elements, as get_value()
+            for index, element in enumerate(elements):
+                yield index, element, None
+            return
+        index = 0
+        for element in elements:
+            if element.exists_or_can_read() is False:
+                continue
+            if element._in_view(view_name):
+                yield index, element, view_name
+                index += 1
+
+    def _view_child(self, view_name, key):
+        if not isinstance(key, int):
+            return None
+        elements = GenericType.get_value(self)
+        if elements is not None and self._all_in_view(view_name):
+            # no element to skip : found by its index
+            if not -len(elements) <= key < len(elements):
+                return None
+            if self._belongs_to_view(view_name) is ViewType.YES:
+                return elements[key], None
+            return elements[key], view_name
+        if key < 0:
+            key += sum(1 for _ in self._view_items(view_name))
+        for index, element, sub_view in self._view_items(view_name):
+            if index == key:
+                return element, sub_view
+        return None
+
+    def _candidate_keys(self, value):
+        return iter(range(len(value))) if isinstance(value, (list, tuple)) else None
@@ -0,0 +1,340 @@
+"""
+Module providing indexes on the elements of a List (see :py:meth:`List.create_index`)
+"""
+
+# pylint: disable=protected-access
+import weakref
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterator
+
+INDEX_KINDS = ("hash", "sorted")
+COMPARISONS = ("$gt", "$gte", "$lt", "$lte")
+INFINITY = float("inf")
+
+
+def operator_of(condition: Any) -> str | None:
+    """
+    Return the operator of a match condition like ``( "$gt", 12 )``
+    or None for a value
+
+    :meta private:
+    """
+    if (
+        isinstance(condition, tuple)
+        and len(condition) == 2
+        and isinstance(condition[0], str)
+        and condition[0].startswith("$")
+    ):
+        return condition[0]
+    return None
+
+
+def conditions(query: Any, names: tuple[str, ...] = ()) -> Iterator[tuple]:
+    """
+    Yield ( names, condition ) for each condition on a field
+    which must be true for a :py:meth:`Dict.match` query to match
+
+    :meta private:
+    """
+    if isinstance(query, dict):
+        for key, value in query.items():
+            yield from conditions(value, names + (key,))
+        return
+    if (
+        operator_of(query) == "$and"
+        and isinstance(query[1], list)
+        and query[1]
+        and all(isinstance(sub, dict) for sub in query[1])
+    ):
+        for sub in query[1]:
+            yield from conditions(sub, names)
+        return
+    if names:
+        yield names, query
+
+
+class ListIndex:
+    """An index of the elements of a List on one of their fields.
+    A "hash" index finds values, a "sorted" index finds values and ranges.
+    An index on a List field indexes its items (for ``$contains``).
+
+    Indexes give candidates : elements which may match.
+    Elements with a field which cannot be read are always candidates.
+
+    :param names: the path of the field in elements
+    :type names: tuple[str]
+    :param kind: "hash" or "sorted"
+    :type kind: str
+    :param multi: True if the field is a List
+    :type multi: bool
+
+    :meta private:
+    """
+
+    # Indexes of lists (dropped or collected ones leave it),
+    # nothing is done for them on modifications if empty
+    live = weakref.WeakSet()
+
+    __slots__ = (
+        "names",
+        "kind",
+        "multi",
+        "_entries",
+        "_buckets",
+        "_sorted",
+        "_others",
+        "__weakref__",
+    )
+
+    def __init__(self, names: tuple[str, ...], kind: str, multi: bool):
+        """Constructor method"""
+        self.names = names
+        self.kind = kind
+        self.multi = multi
+        # id( element ) -> keys of the element
+        self._entries = {}
+        # key -> { id( element ) : element } (hash)
+        self._buckets = {}
+        # sorted ( key, id( element ) ) (sorted)
+        self._sorted = []
+        # not indexed elements : { id( element ) : element }
+        self._others = {}
+
+    def keys_of(self, element) -> tuple | None:
+        """
+        Return the keys of an element (None if not indexed)
+        """
+        node = element
+        for name in self.names:
+            children = node._json_children()
+            if not isinstance(children, dict):
+                return None
+            node = children.get(name)
+            if node is None or node._exists is not True or node._permissions._enabled:
+                return None
+        value = node.get_value()
+        if self.multi:
+            if not isinstance(value, list):
+                return ()
+            keys = tuple(dict.fromkeys(value))
+        else:
+            keys = (value,)
+        try:
+            hash(keys)
+        except TypeError:
+            return None
+        if self.kind == "sorted" and None in keys:
+            return None
+        return keys
+
+    def add(self, element) -> None:
+        """
+        Index an element
+        """
+        i = id(element)
+        keys = self.keys_of(element)
+        self._entries[i] = keys
+        if keys is None:
+            self._others[i] = element
+            return
+        if self.kind == "hash":
+            for key in keys:
+                self._buckets.setdefault(key, {})[i] = element
+            return
+        added = []
+        try:
+            for key in keys:
+                entry = (key, i, element)
+                self._sorted.insert(bisect_left(self._sorted, entry[:2]), entry)
+                added.append(key)
+        except TypeError:
+            # keys not comparable with the others
+            self._remove_sorted(added, i)
+            self._entries[i] = None
+            self._others[i] = element
+
+    def _remove_sorted(self, keys, i: int) -> None:
+        """
+        :meta private:
+        """
+        for key in keys:
+            position = bisect_left(self._sorted, (key, i))
+            del self._sorted[position]
+
+    def remove(self, element) -> None:
+        """
+        Remove an element from the index
+        """
+        i = id(element)
+        keys = self._entries.pop(i, None)
+        if keys is None:
+            self._others.pop(i, None)
+            return
+        if self.kind == "sorted":
+            self._remove_sorted(keys, i)
+            return
+        for key in keys:
+            bucket = self._buckets[key]
+            del bucket[i]
+            if not bucket:
+                del self._buckets[key]
+
+    def update(self, element) -> None:
+        """
+        A value of an element changed
+        """
+        i = id(element)
+        if i not in self._entries:
+            return
+        if self.keys_of(element) == self._entries[i]:
+            return
+        self.remove(element)
+        self.add(element)
+
+    def rebuild(self, elements: list | None) -> None:
+        """
+        Index all elements again
+        """
+        self._entries = {}
+        self._buckets = {}
+        self._sorted = []
+        self._others = {}
+        for element in elements or ():
+            self.add(element)
+
+    def lookup(self, condition: Any) -> dict | None:
+        """
+        Return the candidates { id( element ) : element } for a condition
+        on the field, or None if the index cannot be used
+        """
+        operator = operator_of(condition)
+        if self.multi:
+            if operator != "$contains":
+                return None
+            return self._lookup_keys(condition[1])
+        if operator == "$contains":
+            return None
+        return self._lookup_keys(condition)
+
+    def _lookup_keys(self, condition: Any) -> dict | None:
+        """
+        :meta private:
+        """
+        operator = operator_of(condition)
+        if operator == "$and":
+            return self._lookup_all(condition[1])
+        if operator is None:
+            return self._lookup_value(condition)
+        if operator == "$eq":
+            return self._lookup_value(condition[1])
+        if operator in COMPARISONS and self.kind == "sorted":
+            value = condition[1]
+            if operator.startswith("$gt"):
+                return self._range(value, operator == "$gte", None, False)
+            return self._range(None, False, value, operator == "$lte")
+        return None
+
+    def _lookup_all(self, subs: Any) -> dict | None:
+        """
+        Candidates for all conditions of a ``$and``
+
+        :meta private:
+        """
+        if not isinstance(subs, list):
+            return None
+        result = None
+        for sub in subs:
+            found = self._lookup_keys(sub)
+            if found is not None:
+                result = found if result is None else intersect(result, found)
+        return result
+
+    def _lookup_value(self, value: Any) -> dict | None:
+        """
+        Candidates for elements equal to a value
+
+        :meta private:
+        """
+        if self.kind == "sorted":
+            return self._range(value, True, value, True)
+        try:
+            found = self._buckets.get(value, {})
+        except TypeError:
+            return None
+        return {**found, **self._others}
+
+    def _range(self, low: Any, low_included: bool, high: Any, high_included: bool):
+        """
+        :meta private:
+        """
+        s = self._sorted
+        try:
+            start = 0
+            if low is not None:
+                start = (
+                    bisect_left(s, (low,))
+                    if low_included
+                    else bisect_right(s, (low, INFINITY))
+                )
+            end = len(s)
+            if high is not None:
+                end = (
+                    bisect_right(s, (high, INFINITY))
+                    if high_included
+                    else bisect_left(s, (high,))
+                )
+        except TypeError:
+            return None
+        found = {entry[1]: entry[2] for entry in s[start:end]}
+        found.update(self._others)
+        return found
+
+
+class DigestIndex(ListIndex):
+    """A hash index of the elements of a List on the digest of their value
+    (see :py:meth:`GenericType.digest`), to check ``uniq`` without reading
+    the whole list. Elements without a kept digest are not indexed.
+
+    :meta private:
+    """
+
+    __slots__ = ()
+
+    def __init__(self):
+        """Constructor method"""
+        super().__init__((), "hash", False)
+
+    def keys_of(self, element) -> tuple | None:
+        digest = element._digest_of(False)
+        return None if digest is None else (digest,)
+
+    def has_duplicates(self, added: list, removed: list) -> bool | None:
+        """
+        Return True if the list would have a value twice once elements added
+        and elements removed (from the list), None if digests cannot tell
+        """
+        if self._others:
+            return None
+        changes = {}
+        for element in added:
+            digest = element._digest_of(False)
+            if digest is None:
+                return None
+            changes[digest] = changes.get(digest, 0) + 1
+        for element in removed:
+            keys = self._entries.get(id(element))
+            if keys and keys[0] in changes:
+                changes[keys[0]] -= 1
+        return any(
+            len(self._buckets.get(digest, ())) + count > 1
+            for digest, count in changes.items()
+        )
+
+
+def intersect(a: dict, b: dict) -> dict:
+    """
+    :meta private:
+    """
+    if len(b) < len(a):
+        a, b = b, a
+    return {k: v for k, v in a.items() if k in b}
@@ -0,0 +1,443 @@
+"""
+Module providing mappers : conversion of an object from a schema to another one
+"""
+
+import re
+from typing import Any
+from .generic import GenericType, attributes_of, not_rules_of, with_decisions
+from .dict import Dict
+from .list import List
+from .tuple import Tuple
+from .error import SSyntaxError, NodePath
+
+
+class Constant:  # pylint: disable=too-few-public-methods
+    """A constant value in a mapping
+
+    :param value: the value
+    :type value: Any
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        """Constructor method"""
+        self.value = value
+
+
+def same_rules(a: Any, b: Any) -> bool:
+    """
+    Return True if two schemas check values exactly the same way
+    (same classes, same options, same sub schemas)
+
+    :param a: a schema
+    :param b: another schema
+    :return: True if any value valid for one is valid for the other
+    :rtype: bool
+    """
+    if isinstance(a, GenericType):
+        return same_node_rules(a, b)
+    if isinstance(a, (list, tuple)):
+        return (
+            type(a) is type(b)
+            and len(a) == len(b)
+            and all(same_rules(x, y) for x, y in zip(a, b))
+        )
+    if isinstance(a, dict):
+        return (
+            isinstance(b, dict)
+            and list(a.keys()) == list(b.keys())
+            and all(same_rules(a[k], b[k]) for k in a)
+        )
+    return same_option(a, b)
+
+
+def same_node_rules(a: GenericType, b: Any) -> bool:
+    """
+    :py:func:`same_rules` for two objects : same class and same rules
+    (attributes not declared in ``_not_rules`` of their class)
+
+    :meta private:
+    """
+    if type(a) is not type(b):
+        return False
+    if a is b:
+        return True
+    not_rules = not_rules_of(type(a))
+    for name in attributes_of(type(a)):
+        if name in not_rules:
+            continue
+        if not same_rules(getattr(a, name, None), getattr(b, name, None)):
+            return False
+    return a._permissions._enabled is False and b._permissions._enabled is False
+
+
+def same_option(a: Any, b: Any) -> bool:
+    """
+    :py:func:`same_rules` for two options (functions, numbers, ...)
+
+    :meta private:
+    """
+    if a is b:
+        return True
+    try:
+        return bool(a == b)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return False
+
+
+def has_own_rules(node: GenericType) -> bool:
+    """
+    Return True if a container checks something more than its sub objects
+
+    :meta private:
+    """
+    if (
+        node._permissions._enabled
+        or callable(node._transform)
+        or node._union
+        or node._constraints
+        or node._not_none
+    ):
+        return True
+    if isinstance(node, List):
+        return node._min is not None or node._max is not None or node._uniq is True
+    return False
+
+
+def check_value(node: GenericType) -> None:
+    """
+    Check the value of a node once set, as a "change" event does
+
+    :meta private:
+    """
+    node.check(node.get_value())
+
+
+def check_unmapped(node: GenericType) -> None:
+    """
+    Check the value of a node not set by the mapping (its default),
+    if it exists and can be read
+
+    :meta private:
+    """
+    if node.exists_or_can_read() is not False:
+        node.check(node.get_value())
+
+
+def check_own_rules(node: GenericType) -> None:
+    """
+    Check the rules of a container, without its sub objects
+
+    :meta private:
+    """
+    GenericType.check(node, node.get_value())
+
+
+def has_events(node: GenericType) -> bool:
+    """
+    Return True if a schema has computed values or functions on events
+
+    :meta private:
+    """
+    if node._on_change is not None:
+        return True
+    for name, functions in node._events.items():
+        # the first "change" function is the check of the value
+        if len(functions) > (1 if name == "change" else 0):
+            return True
+    if isinstance(node, Dict):
+        return any(has_events(child) for child in node._children.values())
+    if isinstance(node, List):
+        return has_events(node._type)
+    if isinstance(node, Tuple):
+        return any(has_events(child) for child in node._schema)
+    return False
+
+
+def parse_path(path: str) -> list[str | int]:
+    """
+    Split a simple selector like ``$.a.b[0].c`` into ``[ "a", "b", 0, "c" ]``
+
+    :raises SSyntaxError: not a simple selector
+
+    :meta private:
+    """
+    if not isinstance(path, str) or not path.startswith("$"):
+        raise SSyntaxError('Mapper: "{0}" is not a selector', path)
+    steps = []
+    for part in re.findall(r"\.([^.\[\]]+)|\[(-?\d+)\]|(.)", path[1:]):
+        key, index, other = part
+        if other:
+            raise SSyntaxError('Mapper: "{0}" is not a simple selector', path)
+        steps.append(key if key else int(index))
+    if "*" in steps:
+        raise SSyntaxError('Mapper: "{0}" is not a simple selector', path)
+    return steps
+
+
+class Mapper:  # pylint: disable=too-few-public-methods
+    """Convert objects of a source schema to a target schema
+
+    Built by :py:func:`mapper`. The mapping is compiled once.
+    A field is checked only if the target rules are not the same as the source ones
+    (all fields are checked if the target has computed values or events, as in ``set()``).
+    Fields of the target not in the mapping get their default, which is always checked.
+
+    :param source: the source schema
+    :type source: GenericType
+    :param target: the target schema
+    :type target: GenericType
+    :param mapping: the description of the target from the source
+    :type mapping: dict
+    """
+
+    def __init__(self, source: GenericType, target: GenericType, mapping: dict):
+        """Constructor method"""
+        self._source = source
+        self._target = target
+        (self._build, self._verify) = self._compile_mapping(source, target, mapping)
+        self._events = has_events(target)
+
+    @with_decisions
+    def __call__(self, source: Any) -> GenericType:
+        """
+        Convert a source object (or a value valid for the source schema)
+        to a new target object
+
+        :param source: the source object, or a value to set in a source object
+        :type source: Any
+        :return: a new target object
+        :rtype: GenericType
+        """
+        if not isinstance(source, GenericType):
+            value = source
+            source = self._source.copy()
+            source.set(value)
+
+        result = self._target.copy()
+        result.set_value_without_checks(self._build(source))
+        if self._events:
+            # as set() : computed values, and all values checked again
+            result._release_events()
+            return result
+
+        # A new object : values are checked once set, with the whole object
+        result._pushed_events = None
+        if self._verify is not None:
+            self._verify(result)
+        return result
+
+    def _resolve(self, schema: GenericType, path: str) -> tuple:
+        """
+        Find the schema of a selector, and return ( source schema, getter( context ) )
+
+        :meta private:
+        """
+        steps = parse_path(path)
+        for step in steps:
+            if isinstance(step, str):
+                if not isinstance(schema, Dict) or step not in schema._children:
+                    raise SSyntaxError('Mapper: "{0}" not in the source', path)
+                schema = schema._children[step]
+            elif isinstance(schema, List):
+                schema = schema._type
+            elif isinstance(schema, Tuple) and -len(schema._schema) <= step < len(
+                schema._schema
+            ):
+                schema = schema._schema[step]
+            else:
+                raise SSyntaxError('Mapper: "{0}" not in the source', path)
+
+        def get_node(context):
+            node = context
+            for step in steps:
+                if isinstance(step, str):
+                    node = node._children[step]
+                    if node.exists_or_can_read() is False:
+                        return None
+                    continue
+                v = GenericType.get_value(node)
+                if v is None or not -len(v) <= step < len(v):
+                    return None
+                node = v[step]
+            return node
+
+        return (schema, get_node)
+
+    def _compile_mapping(
+        self, source: GenericType, target: GenericType, mapping: dict
+    ) -> tuple:
+        """
+        Compile a mapping ( a dict ) for target, from the context source.
+        Return ( build( context ) -> value, verify( node ) or None )
+
+        :meta private:
+        """
+        if not isinstance(mapping, dict):
+            raise SSyntaxError("Mapper: the mapping must be a dict")
+
+        if isinstance(target, List):
+            return self._compile_records(source, target, mapping)
+
+        if not isinstance(target, Dict):
+            raise SSyntaxError(
+                "{0}: Mapper: a mapping needs a Dict or a List", NodePath(target)
+            )
+
+        builds = []
+        verifies = []
+        for key, rule in mapping.items():
+            if key not in target._children:
+                raise SSyntaxError(
+                    '{0}: Mapper: Unknown key "{1}"', NodePath(target), key
+                )
+            build, verify = self._compile_rule(source, target._children[key], rule)
+            builds.append((key, build))
+            if verify is not None:
+                verifies.append((key, verify))
+        for key in target._keys:
+            if key not in mapping:
+                # no source to compare rules with : the default is always checked
+                verifies.append((key, check_unmapped))
+        own_rules = has_own_rules(target)
+
+        def build_dict(context):
+            return {key: build(context) for key, build in builds}
+
+        if not verifies and not own_rules:
+            return (build_dict, None)
+
+        def verify_dict(node):
+            if own_rules:
+                check_own_rules(node)
+            children = node._children
+            for key, verify in verifies:
+                verify(children[key])
+
+        return (build_dict, verify_dict)
+
+    def _compile_records(
+        self, source: GenericType, target: List, mapping: dict
+    ) -> tuple:
+        """
+        Compile a mapping applied to each element of a list
+
+        :meta private:
+        """
+        if not isinstance(source, List):
+            raise SSyntaxError(
+                "{0}: Mapper: a list of records needs a List as source",
+                NodePath(target),
+            )
+        build, verify = self._compile_mapping(source._type, target._type, mapping)
+        own_rules = has_own_rules(target)
+
+        def build_list(context):
+            if context is None:
+                return None
+            elements = GenericType.get_value(context)
+            if elements is None:
+                return None
+            return [build(element) for element in elements]
+
+        if verify is None and not own_rules:
+            return (build_list, None)
+
+        def verify_list(node):
+            if own_rules:
+                check_own_rules(node)
+            elements = GenericType.get_value(node)
+            if verify is not None and elements is not None:
+                for element in elements:
+                    verify(element)
+
+        return (build_list, verify_list)
+
+    def _compile_rule(  # pylint: disable=too-many-return-statements
+        self, source: GenericType, target: GenericType, rule: Any
+    ) -> tuple:
+        """
+        Compile the rule for one key of the target
+
+        :meta private:
+        """
+        if isinstance(rule, dict):
+            # a change of nesting, with the same context
+            return self._compile_mapping(source, target, rule)
+
+        if isinstance(rule, str):
+            schema, get_node = self._resolve(source, rule)
+
+            def copy_value(context):
+                n = get_node(context)
+                return None if n is None else n.get_value()
+
+            if same_rules(schema, target):
+                return (copy_value, None)
+            return (copy_value, check_value)
+
+        if isinstance(rule, tuple) and len(rule) == 2 and isinstance(rule[0], str):
+            schema, get_node = self._resolve(source, rule[0])
+            if isinstance(rule[1], dict):
+                build, verify = self._compile_mapping(schema, target, rule[1])
+
+                def sub_value(context):
+                    n = get_node(context)
+                    return None if n is None else build(n)
+
+                return (sub_value, verify)
+
+            if callable(rule[1]):
+                func = rule[1]
+
+                def transform_value(context):
+                    n = get_node(context)
+                    return func(None if n is None else n.get_value(), context)
+
+                return (transform_value, check_value)
+
+        if isinstance(rule, Constant):
+            constant = rule.value
+            return (lambda context: constant, check_value)
+
+        if callable(rule):
+            return (rule, check_value)
+
+        raise SSyntaxError("{0}: Mapper: invalid rule {1}", NodePath(target), rule)
+
+
+def mapper(source: GenericType, target: GenericType, mapping: dict) -> Mapper:
+    """Build a converter from a source schema to a target schema
+
+    The mapping is a dict with the keys of the target. Each rule can be :
+
+    - ``"$.a.b"`` : a selector in the source (renames and nesting changes)
+    - ``{ ... }`` : a mapping for a sub Dict of the target
+    - ``( "$.l", { ... } )`` : a List of records, each element mapped with the sub mapping
+      (selectors in the sub mapping start from the element)
+    - ``( "$.a", func )`` : the value of the selector transformed by ``func( value, source )``
+    - ``func`` : a value computed by ``func( source )``
+    - ``Constant( value )`` : a constant
+
+    :param source: the source schema
+    :type source: GenericType
+    :param target: the target schema
+    :type target: GenericType
+    :param mapping: the mapping
+    :type mapping: dict
+    :raises SSyntaxError: if the mapping does not match schemas
+    :return: a function ``convert( source_object ) -> target_object``
+    :rtype: Mapper
+
+    :example:
+        .. code-block:: python
+
+            to_api = mapper( user, public_user, {
+                "full_name" : ( "$.name", lambda v, o: v.title() ),
+                "address" : { "city" : "$.city" },
+                "version" : Constant(2),
+            })
+            u = to_api( my_user )
+    """
+    return Mapper(source, target, mapping)
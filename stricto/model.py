@@ -0,0 +1,152 @@
+"""
+Module providing models : factories of objects of a schema
+"""
+
+import copy
+from functools import cache
+from typing import Any, Callable
+from .generic import GenericType, slots_of
+from .dict import Dict
+from .list_and_tuple import ListAndTuple
+
+
+# Attributes set for each new object (the others are shared with the prototype)
+OWN_ATTRIBUTES = frozenset(
+    (
+        "_parent",
+        "_root",
+        "_depth",
+        "_attribute_name",
+        "_keys",
+        "_children",
+    )
+)
+
+
+@cache
+def slot_setter(cls: type, name: str) -> Callable[[Any, Any], None]:
+    """
+    Return the setter of a slot of a class
+
+    :meta private:
+    """
+    for klass in cls.__mro__:
+        if name in klass.__dict__.get("__slots__", ()):
+            return klass.__dict__[name].__set__
+    raise AttributeError(name)
+
+
+class Model:
+    """A factory of objects of a schema
+
+    The schema is copied once as a prototype, and its layout (all objects
+    in order, with their attributes) is computed once.
+    A new object is made of new nodes filled with the attributes of the prototype :
+    no parsing of options and no copy of rules (the :py:class:`FieldSpec` is shared).
+
+    :param schema: the schema (with its default values)
+    :type schema: GenericType
+    """
+
+    def __init__(self, schema: GenericType):
+        """Constructor method"""
+        self._prototype = schema.copy()
+        self._layout = []
+        self._add_layout(self._prototype, None, "$")
+
+    def _add_layout(
+        self, node: GenericType, parent_index: int | None, attribute_name: str
+    ) -> None:
+        """
+        Add an object and its sub objects to the layout. Each entry is
+        ( class, ( (setter, value), ... ), setters of own attributes,
+        prototype, parent index, attribute name ).
+        Enabled permissions are copied for each object (disabled ones are shared).
+        A List or a Tuple with elements is copied (the class is None).
+
+        :meta private:
+        """
+        index = len(self._layout)
+        if isinstance(node, ListAndTuple) and isinstance(
+            GenericType.get_value(node), list
+        ):
+            self._layout.append((None, (), None, node, parent_index, attribute_name))
+            return
+
+        cls = type(node)
+        attributes = []
+        for name in slots_of(cls):
+            if name in OWN_ATTRIBUTES:
+                continue
+            try:
+                value = object.__getattribute__(node, name)
+            except AttributeError:
+                continue
+            attributes.append((slot_setter(cls, name), value))
+        own = tuple(
+            slot_setter(cls, name)
+            for name in ("_parent", "_root", "_depth", "_attribute_name")
+        )
+        if isinstance(node, Dict):
+            own += (slot_setter(cls, "_keys"), slot_setter(cls, "_children"))
+        self._layout.append(
+            (cls, tuple(attributes), own, node, parent_index, attribute_name)
+        )
+
+        if isinstance(node, Dict):
+            for key in node._keys:
+                self._add_layout(node._children[key], index, key)
+
+    def new(self, value: Any = None) -> GenericType:
+        """
+        Return a new object, with the default values of the schema
+        or filled with a value
+
+        :param value: the value to set (None for default values)
+        :type value: Any
+        :raises StrictoError: if the value is not valid (see :py:meth:`GenericType.set`)
+        :return: a new object
+        :rtype: GenericType
+        """
+        nodes = []
+        root = None
+        for cls, attributes, own, prototype, parent_index, name in self._layout:
+            parent = None if parent_index is None else nodes[parent_index]
+            depth = 0 if parent is None else parent._depth + 1
+
+            if cls is None:
+                node = prototype._copy_node()
+                node._parent = parent
+                node._attribute_name = name
+                node._reroot(root, depth)
+            else:
+                node = cls.__new__(cls)
+                for setter, v in attributes:
+                    setter(node, v)
+                if cls.__dictoffset__:
+                    node.__dict__.update(object.__getattribute__(prototype, "__dict__"))
+                own[0](node, parent)
+                own[1](node, root)
+                own[2](node, depth)
+                own[3](node, name)
+                if len(own) > 4:
+                    own[4](node, prototype._keys.copy())
+                    own[5](node, {})
+                if prototype._permissions._enabled:
+                    node._permissions = copy.copy(prototype._permissions)
+
+            if parent is None:
+                root = node
+            else:
+                parent._children[name] = node
+            nodes.append(node)
+
+        if value is not None:
+            root.set(value)
+        return root
+
+    def __call__(self, value: Any = None) -> GenericType:
+        """
+        Same as :py:meth:`new`
+        """
+        return self.new(value)
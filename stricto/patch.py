@@ -0,0 +1,81 @@
+"""
+Module providing the operations of a patch (see :py:meth:`GenericType.patch_many`)
+"""
+
+import copy
+from typing import Any
+from .error import SSyntaxError
+from .selector import parse_path
+
+OPERATIONS = ("add", "remove", "replace", "move", "copy", "test")
+
+# Operations which need a "value" or a "from"
+WITH_VALUE = ("add", "replace", "test")
+WITH_FROM = ("move", "copy")
+
+
+class PatchStep:  # pylint: disable=too-few-public-methods
+    """One change of a patch, on one object.
+
+    :param op: "add", "remove", "replace" or "test"
+    :type op: str
+    :param path: the path as given
+    :type path: str
+    :param value: the value of the operation
+    :type value: Any
+
+    :meta private:
+    """
+
+    __slots__ = ("op", "path", "tokens", "value")
+
+    def __init__(self, op: str, path: str, value: Any):
+        """Constructor method"""
+        self.op = op
+        self.path = path
+        self.tokens = parse_path(path)
+        self.value = value
+
+
+def read_operation(operation: Any) -> tuple[str, str, str | None, Any]:
+    """
+    Return ( op, path, from, value ) of an rfc 6902 operation like
+    ``{ "op" : "add", "path" : "$.a", "value" : 12 }``
+
+    :raises SSyntaxError: if the operation is not complete
+    :meta private:
+    """
+    if not isinstance(operation, dict) or "op" not in operation:
+        raise SSyntaxError('Invalid patch operation "{0}"', operation)
+    op = operation["op"]
+    needed = ["path"]
+    if op in WITH_VALUE:
+        needed.append("value")
+    if op in WITH_FROM:
+        needed.append("from")
+    for key in needed:
+        if key not in operation:
+            raise SSyntaxError('Missing "{0}" in patch operation "{1}"', key, operation)
+    return op, operation["path"], operation.get("from"), operation.get("value")
+
+
+def value_at(document: Any, tokens: tuple[str, ...]) -> Any:
+    """
+    Return a copy of the value at the path in a document
+
+    :raises KeyError: if the path does not exist
+    :meta private:
+    """
+    value = document
+    for token in tokens:
+        if isinstance(value, dict):
+            value = value[token]
+            continue
+        if isinstance(value, (list, tuple)) and token.lstrip("-").isdigit():
+            try:
+                value = value[int(token)]
+            except IndexError as e:
+                raise KeyError(token) from e
+            continue
+        raise KeyError(token)
+    return copy.deepcopy(value)
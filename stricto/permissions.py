@@ -1,13 +1,13 @@
 """Module providing the Permission( Class)"""
 
-import copy
-
 
 class Permissions:
     """
     To manage permissions
     """
 
+    __slots__ = ("_enabled", "_permissions")
+
     def __init__(self, **kwargs):
         """
         available arguments
@@ -24,9 +24,8 @@ class Permissions:
         cls = self.__class__
         result = cls.__new__(cls)
         result._enabled = self._enabled
-        result._permissions = {}
-        for right_name, r in self._permissions.items():
-            result._permissions[right_name] = copy.copy(r)
+        # rights are booleans or functions, shared by copies
+        result._permissions = self._permissions.copy()
         return result
 
     def enable(self) -> None:
@@ -0,0 +1,323 @@
+"""
+Module providing compiled match queries (see :py:func:`compile_query`)
+"""
+
+# pylint: disable=protected-access
+import operator
+import re
+from functools import cache, partial
+from typing import Any, Callable
+
+COMPARATORS = {
+    "$eq": operator.eq,
+    "$ne": operator.ne,
+    "$gt": operator.gt,
+    "$gte": operator.ge,
+    "$lt": operator.lt,
+    "$lte": operator.le,
+}
+
+
+def is_operator(query: Any) -> bool:
+    """
+    Return True for an operator condition like ``( "$gt", 12 )``
+
+    :meta private:
+    """
+    return (
+        isinstance(query, tuple)
+        and len(query) == 2
+        and isinstance(query[0], str)
+        and query[0].startswith("$")
+    )
+
+
+@cache
+def kind_of(cls: type) -> str | None:
+    """
+    Return how objects of a class match : "value", "string", "dict" or "list"
+    (see ``_match_kind``), None if the class has its own match()
+
+    :meta private:
+    """
+    for klass in cls.__mro__:
+        if "_match_kind" in klass.__dict__:
+            return klass._match_kind
+        if "match" in klass.__dict__ or "_match_operator" in klass.__dict__:
+            return None
+    return None
+
+
+class Query:
+    """A compiled match query, see :py:func:`compile_query`
+
+    :param query: the query, like ``{ "age" : ( "$gt", 12 ) }``
+    """
+
+    __slots__ = ("query", "_term")
+
+    def __init__(self, query: Any):
+        """Constructor method"""
+        self.query = query
+        self._term = _compile(query)
+
+    def __repr__(self) -> str:
+        return f"Query({self.query!r})"
+
+    def match(self, obj) -> bool:
+        """Same as ``obj.match( query )``
+
+        :param obj: the object to match
+        :type obj: GenericType
+        :rtype: bool
+        """
+        return self._term(obj, obj.exists(None))
+
+
+def compile_query(query: Any) -> Query:
+    """Compile a match query (see :py:meth:`Dict.match`) once,
+    to match it against many objects.
+    Operators are parsed and regular expressions are compiled here.
+
+    :param query: the query, like ``{ "age" : ( "$gt", 12 ) }``
+    :return: the compiled query, to give to ``match()`` or ``find()``
+    :rtype: Query
+    """
+    if isinstance(query, Query):
+        return query
+    return Query(query)
+
+
+# A term is a function ( node, alive ) -> bool, alive being the result of
+# exists() for the parent of the node. An operator is a function
+# ( node, kind, alive ) -> bool which may raise, like _match_operator()
+
+
+def _compile(query: Any) -> Callable:
+    """
+    :meta private:
+    """
+    if isinstance(query, Query):
+        return query._term
+    if isinstance(query, dict):
+        return _fields_term(query)
+    if isinstance(query, list):
+        return _items_term(query)
+    if is_operator(query):
+        return _operator_term(query)
+    if query is None or isinstance(query, tuple):
+        return _default_term(query)
+    return _value_term(query)
+
+
+def _default_term(query: Any) -> Callable:
+    def term(node, alive):  # pylint: disable=unused-argument
+        return node.match(query)
+
+    return term
+
+
+def _value_term(value: Any) -> Callable:
+    def term(node, alive):  # pylint: disable=unused-argument
+        kind = kind_of(type(node))
+        if kind is None:
+            return node.match(value)
+        if kind == "dict":
+            return False
+        return node.get_value() == value
+
+    return term
+
+
+def _fields_term(query: dict) -> Callable:
+    fields = tuple((key, _compile(value)) for key, value in query.items())
+
+    def term(node, alive):
+        if kind_of(type(node)) != "dict":
+            return node.match(query)
+        children = node._json_children()
+        for key, sub in fields:
+            child = children.get(key)
+            if child is None or not child._readable_in(alive):
+                return False
+            if not sub(child, True):
+                return False
+        return True
+
+    return term
+
+
+def _items_term(query: list) -> Callable:
+    items = tuple(_compile(value) for value in query)
+
+    def term(node, alive):  # pylint: disable=unused-argument
+        if kind_of(type(node)) != "list":
+            return node.match(query)
+        v = node._json_children()
+        if v is None or len(v) != len(items):
+            return False
+        for child, sub in zip(v, items):
+            try:
+                if not sub(child, True):
+                    return False
+            except Exception:  # pylint: disable=broad-exception-caught
+                return False
+        return True
+
+    return term
+
+
+def _operator_term(query: tuple) -> Callable:
+    op = _operator(query[0], query[1])
+
+    def term(node, alive):
+        kind = kind_of(type(node))
+        if kind is None:
+            return node.match(query)
+        try:
+            return op(node, kind, alive)
+        except Exception:  # pylint: disable=broad-exception-caught
+            return False
+
+    return term
+
+
+def _operator(name: str, other: Any) -> Callable:
+    """
+    Compile an operator (see :py:data:`OPERATORS`), unknown ones never match
+
+    :meta private:
+    """
+    build = OPERATORS.get(name)
+    if build is None:
+        return _false
+    return build(other)
+
+
+def _comparison_operator(compare: Callable, other: Any) -> Callable:
+    """
+    $eq, $ne, $gt, $gte, $lt, $lte : compare the value
+
+    :meta private:
+    """
+
+    def comparison(node, kind, alive):  # pylint: disable=unused-argument
+        return compare(node.get_value(), other)
+
+    return comparison
+
+
+def _not_operator(other: Any) -> Callable:
+    """
+    $not : the negation of an operator
+
+    :meta private:
+    """
+    if not is_operator(other):
+        return _false
+    sub = _operator(other[0], other[1])
+
+    def negation(node, kind, alive):
+        try:
+            return not sub(node, kind, alive)
+        except Exception:  # pylint: disable=broad-exception-caught
+            return True
+
+    return negation
+
+
+def _contains_operator(other: Any) -> Callable:
+    """
+    $contains : one element of a list matches
+
+    :meta private:
+    """
+    sub = _compile(other)
+
+    def contains(node, kind, alive):  # pylint: disable=unused-argument
+        if kind != "list":
+            return False
+        for item in node._json_children() or ():
+            try:
+                if sub(item, True):
+                    return True
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+        return False
+
+    return contains
+
+
+def _false(node, kind, alive):  # pylint: disable=unused-argument
+    return False
+
+
+def _logical_operator(conjunction: bool, other: Any) -> Callable:
+    """
+    $and / $or : a list of dicts for a Dict, a list of operators otherwise
+
+    :meta private:
+    """
+    if not isinstance(other, list):
+        return _false
+    subs = tuple(
+        (
+            isinstance(sub, dict),
+            _compile(sub),
+            _operator(sub[0], sub[1]) if is_operator(sub) else None,
+        )
+        for sub in other
+    )
+
+    def logical(node, kind, alive):
+        for is_dict, term, op in subs:
+            if kind == "dict":
+                if not is_dict:
+                    return False
+                response = term(node, alive)
+            else:
+                if op is None:
+                    return False
+                try:
+                    response = op(node, kind, alive)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    response = False
+            if conjunction and not response:
+                return False
+            if not conjunction and response:
+                return True
+        return conjunction
+
+    return logical
+
+
+def _regexp_operator(other: Any) -> Callable:
+    """
+    $reg : the string matches a regular expression
+
+    :meta private:
+    """
+    try:
+        pattern = re.compile(other)
+    except (TypeError, re.error):
+        return _false
+
+    def regexp(node, kind, alive):  # pylint: disable=unused-argument
+        if kind != "string":
+            return False
+        return pattern.match(node.get_value()) is not None
+
+    return regexp
+
+
+OPERATORS = {
+    **{
+        name: partial(_comparison_operator, compare)
+        for name, compare in COMPARATORS.items()
+    },
+    "$and": partial(_logical_operator, True),
+    "$or": partial(_logical_operator, False),
+    "$not": _not_operator,
+    "$reg": _regexp_operator,
+    "$contains": _contains_operator,
+}
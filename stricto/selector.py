@@ -3,15 +3,99 @@ Module providing to manage selectors
 according to rfc 9535
 """
 
+import copy
 import re
-from copy import deepcopy
+from functools import lru_cache
+from .error import SSyntaxError
+
+# Number of selectors kept parsed
+SELECTOR_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=SELECTOR_CACHE_SIZE)
+def parse_selector(selector_as_string: str) -> tuple[tuple[str, str | None], ...]:
+    """
+    Split a selector like "$.address_list[1].street" in
+    ``( ("$", None), ("address_list", "1"), ("street", None) )``.
+    Results are cached.
+
+    :meta private:
+    """
+    selector = []
+    for sel in selector_as_string.split("."):
+        # selector like blabla[...] or blabla or [...]
+        match = re.search(r"(.*)\[(.*)\]", sel)
+        if not match:
+            selector.append((sel, None))
+            continue
+        selector.append((match.group(1), match.group(2)))
+    return tuple(selector)
+
+
+@lru_cache(maxsize=SELECTOR_CACHE_SIZE)
+def parse_slice(slice_as_string: str) -> int | slice | None:
+    """
+    Parses an index or a `slice()` from string, like `start:stop:step`.
+    Results are cached.
+
+    :meta private:
+    """
+    parts = slice_as_string.split(":")
+    try:
+        if len(parts) == 1:
+            # slice(stop)
+            return int(slice_as_string)
+        if len(parts) == 2:
+            # slice(start,stop)
+            return slice(int(parts[0]), int(parts[1]))
+        if len(parts) == 3:
+            # slice(start,stop,step)
+            return slice(int(parts[0]), int(parts[1]), int(parts[2]))
+    except ValueError:
+        pass
+    return None
+
+
+@lru_cache(maxsize=SELECTOR_CACHE_SIZE)
+def parse_path(path: str) -> tuple[str, ...]:
+    """
+    Split the path of one object, a selector like "$.address_list[1].street"
+    or a JSON pointer (rfc 6901) like "/address_list/1/street",
+    in ``( "address_list", "1", "street" )``. Results are cached.
+
+    :raises SSyntaxError: if the path is not the path of one object
+    :meta private:
+    """
+    if path == "" or path.startswith("/"):
+        return tuple(
+            part.replace("~1", "/").replace("~0", "~") for part in path.split("/")[1:]
+        )
+
+    tokens = []
+    for i, (name, index) in enumerate(parse_selector(path)):
+        if i == 0:
+            if name != "$":
+                raise SSyntaxError('Invalid path "{0}"', path)
+        elif name in ("", "*"):
+            raise SSyntaxError('Invalid path "{0}"', path)
+        else:
+            tokens.append(name)
+        if index is not None:
+            if not re.fullmatch(r"-?[0-9]+|-", index):
+                raise SSyntaxError('Invalid path "{0}"', path)
+            tokens.append(index)
+    return tuple(tokens)
 
 
 class Selector:
     """
-    A Selector object
+    A Selector object : a position in the parsed selector.
+    The parsed selector is shared (see :py:func:`parse_selector`),
+    pop() only moves the position and copy() does not copy the selector.
     """
 
+    __slots__ = ("selector", "position")
+
     def __init__(self, selector_as_string: str | None):
         """
 
@@ -19,50 +103,45 @@ class Selector:
         of "$.address_list[1].street" or "$.address_list.1
         """
 
-        # this is an array of tuple (selector_name, index or slices (in case of list))
-        self.selector = []
-
-        if selector_as_string is not None:
-            for sel in selector_as_string.split("."):
-                # selector like blabla[...] or blabla or [...]
-                match = re.search(r"(.*)\[(.*)\]", sel)
-                if not match:
-                    self.selector.append((sel, None))
-                    continue
-                self.selector.append((match.group(1), match.group(2)))
+        # this is a tuple of tuple (selector_name, index or slices (in case of list))
+        self.selector = (
+            () if selector_as_string is None else parse_selector(selector_as_string)
+        )
+        self.position = 0
 
     def empty(self):
         """
         return True if empty
         """
-        if len(self.selector) > 0:
-            return False
-        return True
+        return self.position >= len(self.selector)
 
     def __copy__(self):
         """
         copy the object
         """
-        n = Selector("")
-        n.selector = self.selector.copy()
+        n = Selector.__new__(Selector)
+        n.selector = self.selector
+        n.position = self.position
         return n
 
     def copy(self):
         """
         Wrapper for copy()
         """
-        return deepcopy(self)
+        return copy.copy(self)
 
     def pop(self):
         """
         return the first element and decrease the list of selectors
         """
-        return self.selector.pop(0)
+        first = self.selector[self.position]
+        self.position += 1
+        return first
 
     def first(self):
         """
         return the first element without poping it
         """
-        if len(self.selector) > 0:
-            return self.selector[0]
+        if self.position < len(self.selector):
+            return self.selector[self.position]
         return (None, None)
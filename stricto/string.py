@@ -2,8 +2,8 @@
 
 import re
 from typing import Callable
-from .generic import GenericType
-from .error import STypeError, SConstraintError
+from .generic import GenericType, SpecAttribute
+from .error import STypeError, SConstraintError, NodePath
 from .kparse import Kparse
 
 KPARSE_MODEL = {
@@ -16,6 +16,12 @@ class String(GenericType):
     A generic type (class for int, string, etc)
     """
 
+    __slots__ = ()
+
+    _regexps = SpecAttribute("_regexps")
+
+    _match_kind = "string"
+
     def __init__(self, **kwargs):
         """
         A string
@@ -34,7 +40,7 @@ class String(GenericType):
 
         GenericType.__init__(self, **kwargs)
 
-    def get_schema(self):
+    def _build_schema(self):
         """Return meta information for a float
 
         :param self: Description
@@ -44,7 +50,7 @@ class String(GenericType):
 
         :meta private:
         """
-        a = GenericType.get_schema(self)
+        a = GenericType._build_schema(self)
         a["regexp"] = self.get_as_string(self._regexps)
         return a
 
@@ -55,7 +61,7 @@ class String(GenericType):
         if isinstance(value, (str, String)):
             return True
         raise STypeError(
-            '{0}: Must be a string (value="{value}")', self.path_name(), value=value
+            '{0}: Must be a string (value="{value}")', NodePath(self), value=value
         )
 
     def check_constraints(self, value):
@@ -67,7 +73,7 @@ class String(GenericType):
             if not re.match(reg, value):
                 raise SConstraintError(
                     '{0}: Dont match regexp (value="{value}")',
-                    self.path_name(),
+                    NodePath(self),
                     value=value,
                 )
 
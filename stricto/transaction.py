@@ -0,0 +1,179 @@
+"""
+Module providing transactions (see :py:meth:`GenericType.transaction`)
+"""
+
+# pylint: disable=protected-access
+from typing import Any, Callable
+from .error import SSyntaxError
+
+
+class UndoLog:  # pylint: disable=too-few-public-methods
+    """The changes done in a tree during its open transactions,
+    and the stack of its open transactions. Kept by the root while
+    a transaction is open (see :py:meth:`GenericType.transaction`).
+
+    Each change is ( node, previous value, undo function or None ).
+
+    :meta private:
+    """
+
+    __slots__ = ("changes", "transactions")
+
+    def __init__(self):
+        """Constructor method"""
+        self.changes = []
+        self.transactions = []
+
+
+def log_change(node, previous: Any, undo_change: Callable | None = None) -> None:
+    """
+    Keep how to undo a change of the node, if its tree is in a transaction.
+    Without undo function, undoing sets the value back to previous.
+
+    :meta private:
+    """
+    log = node.get_root()._undo_log
+    if log is not None:
+        log.changes.append((node, previous, undo_change))
+
+
+class Transaction:
+    """A transaction on a tree, usually used as a context manager ::
+
+        with a.transaction() as t:
+            a.name = "John"
+            savepoint = t.savepoint()
+            a.age = 12
+            t.rollback( savepoint )  # a.age is back
+
+    The transaction is commited at the end of the block,
+    and rolled back if an exception is raised.
+    Transactions can be nested : rolling back a nested transaction
+    undoes only its changes, commiting it gives them to the outer transaction.
+
+    Changes are kept in an undo log (the previous values, without copies) :
+    commit is O(1) and rollback is O(number of changes).
+
+    :param root: the root of the tree
+    :type root: GenericType
+    """
+
+    # Number of open transactions, nothing is logged if 0
+    count = 0
+
+    __slots__ = ("root", "_log", "_start")
+
+    def __init__(self, root):
+        """Constructor method"""
+        self.root = root
+        self._log = None
+        self._start = None
+
+    def __enter__(self):
+        return self.begin()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if self._log is not None:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        return False
+
+    def is_open(self) -> bool:
+        """
+        Return True if the transaction is started and not ended
+        """
+        return self._log is not None
+
+    def begin(self):
+        """Start the transaction (done by ``with``)
+
+        :raises SSyntaxError: if already started
+        """
+        if self._log is not None:
+            raise SSyntaxError("Transaction already started")
+        log = self.root._undo_log
+        if log is None:
+            log = UndoLog()
+            self.root._undo_log = log
+        self._log = log
+        self._start = len(log.changes)
+        log.transactions.append(self)
+        Transaction.count += 1
+        return self
+
+    def savepoint(self) -> int:
+        """Return a savepoint, to roll back to it later
+
+        :raises SSyntaxError: if the transaction is not open
+        """
+        return len(self._open_log().changes)
+
+    def commit(self) -> None:
+        """End the transaction and keep its changes
+        (they belong to the outer transaction if nested)
+
+        :raises SSyntaxError: if the transaction is not open
+        """
+        self._open_log()
+        self._end()
+
+    def rollback(self, savepoint: int | None = None) -> None:
+        """Undo the changes done since the savepoint, the transaction stays open.
+        Without savepoint, undo all changes and end the transaction.
+
+        :param savepoint: a position given by :py:meth:`savepoint`
+        :type savepoint: int
+        :raises SSyntaxError: if the transaction is not open or the savepoint invalid
+        """
+        log = self._open_log()
+        if savepoint is None:
+            undo(log.changes, self._start)
+            self._end()
+            return
+        if not self._start <= savepoint <= len(log.changes):
+            raise SSyntaxError('Invalid savepoint "{0}"', savepoint)
+        undo(log.changes, savepoint)
+
+    def _open_log(self) -> UndoLog:
+        """
+        :meta private:
+        """
+        if self._log is None:
+            raise SSyntaxError("Transaction not started")
+        return self._log
+
+    def _end(self) -> None:
+        """
+        Close this transaction (and the nested ones still open)
+
+        :meta private:
+        """
+        log = self._log
+        while True:
+            transaction = log.transactions.pop()
+            transaction._log = None
+            Transaction.count -= 1
+            if transaction is self:
+                break
+        if not log.transactions:
+            self.root._undo_log = None
+
+
+def undo(changes: list, position: int) -> None:
+    """
+    Undo changes (the last first) down to the position
+
+    :meta private:
+    """
+    touched = {}
+    while len(changes) > position:
+        node, previous, undo_change = changes.pop()
+        if undo_change is None:
+            node._value = previous
+        else:
+            undo_change()
+        touched[id(node)] = node
+    for node in touched.values():
+        node._undone()
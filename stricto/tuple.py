@@ -2,19 +2,36 @@
 
 import copy
 import re
-from .generic import GenericType
+from .generic import GenericType, SpecAttribute, with_decisions, forget_decisions
 from .list import List
 from .list_and_tuple import ListAndTuple
-from .error import STypeError, SSyntaxError
+from .error import STypeError, SSyntaxError, NodePath
 from .selector import Selector
+from .list_index import ListIndex
+from .query import Query
+from .diff import pointer
+from .transaction import Transaction, log_change
 from .toolbox import validation_parameters
 
+INDEX = re.compile("^[0-9]+$")
+
 
 class Tuple(ListAndTuple):
     """
     A Tuple Type
     """
 
+    __slots__ = ("_locked",)
+    _not_rules = ("_locked",)
+
+    _digest_tag = b"T"
+    _value_type = tuple
+
+    _schema = SpecAttribute("_schema")
+
+    # has its own match()
+    _match_kind = None
+
     @validation_parameters
     def __init__(self, schema: tuple, **kwargs):
         """ """
@@ -29,14 +46,13 @@ class Tuple(ListAndTuple):
             if isinstance(element_schema, GenericType) is False:
                 raise SSyntaxError('Not a schema ("{schema}")', schema=element_schema)
             mm = copy.copy(element_schema)
-            mm._parent = self
-            mm._attribute_name = f"[{i}]"
+            mm._attach(self, f"[{i}]")
             self._schema.append(mm)
             i = i + 1
 
         self._locked = True
 
-    def get_schema(self):
+    def _build_schema(self):
         """Return meta information for a float
 
         :param self: Description
@@ -46,10 +62,10 @@ class Tuple(ListAndTuple):
 
         :meta private:
         """
-        a = GenericType.get_schema(self)
+        a = GenericType._build_schema(self)
         a["sub_types"] = []
         for schema in self._schema:
-            a["sub_types"].append(schema.get_schema())
+            a["sub_types"].append(schema._schema_of())
         return a
 
     def get_current_meta(self, parent: dict = None):
@@ -82,7 +98,7 @@ class Tuple(ListAndTuple):
                     list_of_result.append(result)
             return tuple(list_of_result)
 
-        if re.match("^[0-9]+$", index_or_slice):
+        if INDEX.match(index_or_slice):
             if v is None:
                 return None
             try:
@@ -106,6 +122,7 @@ class Tuple(ListAndTuple):
 
         GenericType.trigg(self, event_name, from_id, **kwargs)
 
+    @with_decisions
     def get_value(self):
         """
         get the value
@@ -119,6 +136,7 @@ class Tuple(ListAndTuple):
             a.append(sub_value.get_value())
         return tuple(a)
 
+    @with_decisions
     def get_encoded(self) -> list:
         """Return the encoded value
 
@@ -134,6 +152,12 @@ class Tuple(ListAndTuple):
             a.append(sub_value.get_encoded())
         return tuple(a)
 
+    def _write_encoded(self, parts):
+        if type(self).get_encoded is not Tuple.get_encoded:
+            GenericType._write_encoded(self, parts)
+            return
+        self._write_elements(parts, False)
+
     def __repr__(self):
         a = []
         v = GenericType.get_value(self)
@@ -154,6 +178,11 @@ class Tuple(ListAndTuple):
         """
         equality test tuple
         """
+        if isinstance(other, Tuple):
+            # same digests (see digest())
+            same = self._same_content(other)
+            if same is not None:
+                return same
         v = GenericType.get_value(self)
         t = None if v is None else tuple(v)
         return t == self._get_other_value(other)
@@ -166,6 +195,9 @@ class Tuple(ListAndTuple):
         if other is None:
             return v is None
 
+        if isinstance(other, Query):
+            return other.match(self)
+
         if isinstance(other, tuple) is False:
             return False
 
@@ -175,6 +207,10 @@ class Tuple(ListAndTuple):
         """
         equality test two objects
         """
+        if isinstance(other, Tuple):
+            same = self._same_content(other)
+            if same is not None:
+                return not same
         v = GenericType.get_value(self)
         t = None if v is None else tuple(v)
         return t != self._get_other_value(other)
@@ -217,12 +253,12 @@ class Tuple(ListAndTuple):
         """
         if not isinstance(other, Tuple):
             raise STypeError(
-                "{0}: Can only concatenate Tuple to Tuple", self.path_name()
+                "{0}: Can only concatenate Tuple to Tuple", NodePath(self)
             )
 
         if self._get_other_value(other) is None:
             raise STypeError(
-                "{0}: Can only concatenate Tuple to Tuple", self.path_name()
+                "{0}: Can only concatenate Tuple to Tuple", NodePath(self)
             )
 
         r = Tuple(tuple(self._schema) + tuple(other._schema))
@@ -236,46 +272,113 @@ class Tuple(ListAndTuple):
             return None
         return v[index]
 
-    def set_value_without_checks(self, value):
-
-        if self._value is None:
-            self._old_value = None
-        else:
-            self._old_value = self._value.copy()
-
-        if value is None:
-            self._value = None
+    def _patch_value(self, value, step, position):
+        if position == len(step.tokens):
+            return GenericType._patch_value(self, value, step, position)
+        token = step.tokens[position]
+        if (
+            not isinstance(value, (list, tuple))
+            or not INDEX.match(token)
+            or int(token) >= min(len(value), len(self._schema))
+        ):
+            raise self._not_found(step)
+        if position + 1 == len(step.tokens) and step.op in ("add", "remove"):
+            raise STypeError('{0}: invalid operator "{op}"', NodePath(self), op=step.op)
+        index = int(token)
+        value = list(value)
+        sub = self._schema[index]
+        value[index] = sub._patch_value(value[index], step, position + 1)
+        return value
+
+    def _patch_node(self, step, position):
+        if position == len(step.tokens):
+            GenericType._patch_node(self, step, position)
             return
+        self._value[int(step.tokens[position])]._patch_node(step, position + 1)
 
-        self._value = []
-
-        if not isinstance(value, (tuple, Tuple, list, List)):
+    def _diff(self, other, path, operations):
+        v = GenericType.get_value(self)
+        o = GenericType.get_value(other) if isinstance(other, Tuple) else None
+        if not isinstance(v, list) or not isinstance(o, list) or len(v) != len(o):
+            GenericType._diff(self, other, path, operations)
             return
+        if self._same_content(other) is True:
+            return
+        for index, sub in enumerate(v):
+            sub._diff(o[index], pointer(path, index), operations)
 
-        i = 0
-        for element in value:
-            mm = copy.copy(self._schema[i])
-            mm.set_value_without_checks(element)
-            mm._parent = self
-            mm._attribute_name = f"[{i}]"
-            self._value.append(mm)
-            i = i + 1
+    def set_value_without_checks(self, value):
+        forget_decisions()
+        if Transaction.count:
+            log_change(self, self._value)
+        # a new list of elements is built, the previous one is not modified
+        self._old_value = self._value
+        self._forget_digest()
 
-    def check(self, value) -> None:
-        GenericType.check(self, value)
+        if value is None:
+            self._value = None
+        else:
+            self._value = []
 
         if isinstance(value, (tuple, Tuple, list, List)):
-            if len(value) != len(self):
-                raise STypeError(
-                    '{0}: Tuple not same size ("{value}")',
-                    self.path_name(),
-                    value=value,
-                )
             i = 0
             for element in value:
-                self._schema[i].check(element)
+                mm = copy.copy(self._schema[i])
+                mm.set_value_without_checks(element)
+                mm._attach(self, f"[{i}]")
+                self._value.append(mm)
                 i = i + 1
 
+        if ListIndex.live:
+            self._notify_indexes()
+
+    def check(self, value) -> None:
+        self._check_compiled(value)
+
+    def _element_types(self):
+        return tuple(self._schema)
+
+    def _candidate_child(self, value, key):
+        if not isinstance(value, (tuple, list)) or not isinstance(key, int):
+            return None
+        if not -len(value) <= key < len(value) or key >= len(self._schema):
+            return None
+        return self._schema[key], value[key]
+
+    def _compile(self):
+        """
+        Build the inner validator for this Tuple and its elements
+        (see :py:meth:`GenericType.compile`)
+
+        :meta private:
+        """
+        if type(self).check is not Tuple.check:
+            return self._compile_fallback()
+
+        prelude = self._compile_generic()
+        own_exists = self._compile_exists()
+        size = len(self._schema)
+        sub_validates = [schema._plan() for schema in self._schema]
+
+        def validate(node, value, root, alive):
+            prelude(node, value, root)
+
+            if isinstance(value, (tuple, Tuple, list, List)):
+                if len(value) != size:
+                    raise STypeError(
+                        '{0}: Tuple not same size ("{value}")',
+                        NodePath(node),
+                        value=value,
+                    )
+                if alive and own_exists is not True:
+                    alive = own_exists is not False and own_exists(root)
+                i = 0
+                for element in value:
+                    sub_validates[i](node._schema[i], element, root, alive)
+                    i = i + 1
+
+        return validate
+
     def check_type(self, value):
         """
         check if conplain to model or raise an
@@ -294,7 +397,7 @@ class Tuple(ListAndTuple):
 
         raise STypeError(
             '{0}: Must be a tuple or a Tuple (value="{value})',
-            self.path_name(),
+            NodePath(self),
             value=value,
         )
 
@@ -0,0 +1,93 @@
+"""
+Module providing the undo of List modifications (see :py:meth:`List.rollback`)
+"""
+
+# pylint: disable=protected-access
+from .generic import GenericType, forget_decisions
+from .indexed_list import IndexedList
+from .list_index import ListIndex
+from .transaction import Transaction, log_change
+
+
+class UndoableList(IndexedList):
+    """
+    The part of a List keeping how to undo its last modification
+    """
+
+    __slots__ = ("_undo",)
+    _not_rules = ("_undo",)
+
+    def __init__(self, **kwargs):
+        """
+        initialisation, nothing to undo
+        """
+        # how to undo the last modification (see rollback())
+        self._undo = None
+        IndexedList.__init__(self, **kwargs)
+
+    def _copy_node(self):
+        result = super()._copy_node()
+        result._undo = None
+        return result
+
+    def _set_undo(self, undo) -> None:
+        """
+        Keep how to undo the last modification, for :py:meth:`rollback`
+
+        :meta private:
+        """
+        forget_decisions()
+        self._forget_digest()
+        self._undo = undo
+        if Transaction.count:
+            log_change(self, None, undo)
+        if ListIndex.live:
+            self._notify_indexes()
+
+    def _restore(self, previous: list | None) -> None:
+        """
+        Go back to a previous list of elements
+
+        :meta private:
+        """
+        self._value = previous
+        self.reset_attribute_name()
+
+    def rollback(self):
+        """
+        reset to the value before the last modification
+        """
+        undo = self._undo
+        if undo is None:
+            GenericType.rollback(self)
+            self._reindex()
+            return
+        if Transaction.count:
+            self._log_elements()
+        self._undo = None
+        undo()
+        self._old_value = self._value
+        self._forget_digest()
+        self._reindex()
+
+    def _log_elements(self) -> None:
+        """
+        Keep the current elements in the undo log of the transaction
+
+        :meta private:
+        """
+        v = self._value
+        previous = None if v is None else v.copy()
+
+        def undo():
+            if v is not None:
+                v[:] = previous
+            self._value = v
+            self.reset_attribute_name()
+
+        log_change(self, None, undo)
+
+    def _undone(self) -> None:
+        self._undo = None
+        self._reindex()
+        GenericType._undone(self)
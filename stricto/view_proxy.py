@@ -0,0 +1,172 @@
+"""
+Module providing read-only views without copy (see :py:meth:`GenericType.view_proxy`)
+"""
+
+# pylint: disable=protected-access
+from typing import Any, Iterator
+from .error import SAttributeError, SKeyError, STypeError, SRightError, NodePath
+from .json_writer import write_value
+
+
+class ViewProxy:
+    """A read-only view of an object, as :py:meth:`GenericType.get_view`
+    but without copy : values are read from the object when asked,
+    filtered by the view and the read rights.
+
+    Keys of a Dict are attributes (and items), elements of a List or a Tuple
+    are items. Sub objects are returned as ViewProxy too, other ones as values.
+
+    As for a dict, ``key in proxy`` looks for a key of a Dict in the view.
+    As for a list, ``value in proxy`` compares the value with the elements
+    of a List or a Tuple in the view (their values, see :py:meth:`get_value`).
+
+    :param node: the object
+    :type node: GenericType
+    :param view_name: the named view (None for all elements)
+    :type view_name: str | None
+    """
+
+    __slots__ = ("_node", "_view_name")
+
+    def __init__(self, node, view_name: str | None):
+        object.__setattr__(self, "_node", node)
+        object.__setattr__(self, "_view_name", view_name)
+
+    def get_value(self) -> Any:
+        """
+        Return the value, the same as ``get_view( view_name ).get_value()``
+        """
+        return self._node._view_value(self._view_name, False)
+
+    def get_encoded(self) -> Any:
+        """
+        Return the value encoded for json
+        """
+        return self._node._view_value(self._view_name, True)
+
+    def __json_encode__(self) -> Any:
+        """
+        Called by the specific Encoder
+        """
+        return self.get_encoded()
+
+    def to_json(self) -> str:
+        """Return the view encoded in JSON
+        (the same as ``json.dumps( self, cls=StrictoEncoder )``)
+
+        :return: the JSON string
+        :rtype: str
+        """
+        parts = []
+        write_value(self.get_encoded(), parts)
+        return "".join(parts)
+
+    def _proxy(self, node, view_name: str | None) -> Any:
+        """
+        Return a sub object as a proxy, or its value
+
+        :meta private:
+        """
+        if node._view_items(view_name) is None:
+            return node.get_value()
+        return ViewProxy(node, view_name)
+
+    def __getattr__(self, key: str) -> Any:
+        found = self._node._view_child(self._view_name, key)
+        if found is None:
+            raise SAttributeError(
+                '{0}: view has no attribute "{k}"', NodePath(self._node), k=key
+            )
+        return self._proxy(*found)
+
+    def __getitem__(self, key: str | int) -> Any:
+        found = self._node._view_child(self._view_name, key)
+        if found is None:
+            raise SKeyError('{0}: view has no item "{k}"', NodePath(self._node), k=key)
+        return self._proxy(*found)
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Keys of a Dict, elements of a List or a Tuple
+        """
+        items = self._items()
+        if self._node._match_kind == "dict":
+            for key, _, _ in items:
+                yield key
+            return
+        for _, node, view_name in items:
+            yield self._proxy(node, view_name)
+
+    def _items(self) -> Iterator[tuple]:
+        """
+        Return ( key, sub object, view name ) in the view
+
+        :meta private:
+        """
+        items = self._node._view_items(self._view_name)
+        if items is None:
+            raise STypeError("{0}: view is not iterable", NodePath(self._node))
+        return items
+
+    def __len__(self) -> int:
+        """
+        Number of keys or elements, counted without reading values
+        """
+        return sum(1 for _ in self._items())
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        A key of a Dict, or the value of an element of a List or a Tuple
+        """
+        items = self._items()
+        if self._node._match_kind == "dict":
+            return self._node._view_child(self._view_name, key) is not None
+        for _, node, view_name in items:
+            if node._view_items(view_name) is None:
+                if node.get_value() == key:
+                    return True
+            elif node._view_value(view_name, False) == key:
+                return True
+        return False
+
+    def keys(self) -> Iterator[str]:
+        """
+        Return keys in the view
+        """
+        return iter(self)
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        """
+        Return ( key, sub object ) in the view
+        """
+        for key, node, view_name in self._items():
+            yield key, self._proxy(node, view_name)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ViewProxy):
+            other = other.get_value()
+        return self.get_value() == other
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.get_value())
+
+    def _read_only(self, *args, **kwargs):
+        """
+        All modifications raise an error
+
+        :meta private:
+        """
+        raise SRightError(
+            '{0}: view "{1}" is read-only', NodePath(self._node), self._view_name
+        )
+
+    __setattr__ = _read_only
+    __delattr__ = _read_only
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    set = _read_only
@@ -3,6 +3,7 @@ all imports
 """
 
 from .test_dict import TestDict
+from .test_nodes import TestNodes
 from .test_bool import TestBool
 from .test_error import TestError
 from .test_float import TestFloat
@@ -22,3 +23,10 @@ from .test_meta import TestMeta
 from .test_selectors import TestSelectors
 from .test_toolbox import TestToolbox
 from .test_kparse import TestKparse
+from .test_compile import TestCompile
+from .test_jsonl import TestJsonl
+from .test_mapper import TestMapper
+from .test_model import TestModel
+from .test_json import TestJson
+from .test_benchmarks import TestBenchmarks
+from .test_transaction import TestTransaction
@@ -0,0 +1,55 @@
+# pylint: disable=duplicate-code
+"""
+test for stricto.benchmarks
+"""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+
+from stricto.benchmarks import run, compare, BENCHMARKS
+from stricto.benchmarks.__main__ import main
+
+
+class TestBenchmarks(unittest.TestCase):
+    """
+    test for the benchmark suite
+    """
+
+    def test_run(self):
+        """
+        a quick run gives a report for each case
+        """
+        report = run(["check", "list_append"], quick=True)
+        self.assertEqual(
+            list(report["results"].keys()),
+            ["check[width=10,depth=2]", "list_append[size=10]"],
+        )
+        result = report["results"]["list_append[size=10]"]
+        self.assertEqual(result["benchmark"], "list_append")
+        self.assertEqual(result["parameters"], {"size": 10})
+        self.assertGreater(result["best"], 0)
+        self.assertGreater(result["peak_bytes"], 0)
+        json.dumps(report)
+
+        ratios = compare(report, report)
+        self.assertEqual(set(ratios.values()), {1.0})
+
+    def test_command_line(self):
+        """
+        python -m stricto.benchmarks
+        """
+        self.assertIn("json_dumps", BENCHMARKS)
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "report.json")
+            with redirect_stderr(io.StringIO()) as err:
+                self.assertEqual(main(["--quick", "copy", "-o", filename]), 0)
+                self.assertEqual(
+                    main(["--quick", "copy", "-o", filename, "--compare", filename]), 0
+                )
+            self.assertIn("copy[width=10,depth=2]: x", err.getvalue())
+            with open(filename, encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["quick"], True)
@@ -0,0 +1,291 @@
+# pylint: disable=duplicate-code
+"""
+test for compile()
+"""
+
+# pylint: disable=no-member, protected-access
+import unittest
+
+from stricto import (
+    String,
+    Int,
+    Dict,
+    List,
+    Tuple,
+    STypeError,
+    SConstraintError,
+    SAttributeError,
+    SRightError,
+    compile_query,
+)
+
+
+class TestCompile(unittest.TestCase):
+    """
+    test for compiled validators
+    """
+
+    def test_compile_simple(self):
+        """
+        a compiled validator raise the same errors as check()
+        """
+        a = Dict(
+            {
+                "b": Int(max=10),
+                "c": String(require=True),
+                "d": Dict({"e": List(Int(), max=2)}),
+            }
+        )
+        validator = a.compile()
+        self.assertEqual(validator({"c": "hop", "d": {"e": [1, 2]}}), None)
+
+        with self.assertRaises(SConstraintError) as e:
+            validator({"b": 11, "c": "hop"})
+        self.assertEqual(e.exception.to_string(), '$.b: Must be below Maximal ("11")')
+
+        with self.assertRaises(SConstraintError) as e:
+            validator({"c": None})
+        self.assertEqual(e.exception.to_string(), '$.c: Cannot be empty "None"')
+
+        with self.assertRaises(STypeError) as e:
+            validator({"c": "hop", "d": {"e": [1, "two"]}})
+        self.assertEqual(e.exception.to_string(), '$: Must be a int ("two")')
+
+        with self.assertRaises(SConstraintError) as e:
+            validator({"c": "hop", "d": {"e": [1, 2, 3]}})
+        self.assertEqual(
+            e.exception.to_string(), '$.d.e: Must be below Maximal (value="[1, 2, 3]")'
+        )
+
+        with self.assertRaises(SAttributeError) as e:
+            validator({"c": "hop", "z": 1})
+        self.assertEqual(e.exception.to_string(), '$: Unknown key "z"')
+
+    def test_compile_cache(self):
+        """
+        the plan is cached, rebuilt when the model change, and shared by copies
+        """
+        a = Dict({"b": Int(), "d": Dict({"e": Int()})})
+        validator = a.compile()
+        plan = a._compiled
+        a.compile()
+        self.assertIs(a._compiled, plan)
+
+        with self.assertRaises(SAttributeError):
+            validator({"f": 1})
+
+        a.add_to_model("f", Int())
+        self.assertIsNone(a._compiled)
+        a.compile()({"f": 1})
+        self.assertIsNot(a._compiled, plan)
+
+        # A modification in a sub Dict change the parent plan
+        plan = a._compiled
+        a.d.add_to_model("g", String())
+        self.assertIsNone(a._compiled)
+        with self.assertRaises(STypeError):
+            a.check({"d": {"g": 12}})
+
+        # A copy shares the plan, until its own model change
+        b = a.copy()
+        self.assertIs(b._compiled, a._compiled)
+        self.assertIs(b.d._compiled, a.d._compiled)
+        b.add_to_model("h", Int())
+        b.check({"h": 1})
+        with self.assertRaises(SAttributeError):
+            a.check({"h": 1})
+        with self.assertRaises(STypeError):
+            b.check({"d": {"g": 12}})
+
+        # The type of elements of a List or a Tuple has no parent
+        c = Dict({"l": List(Dict({"x": Int()})), "t": Tuple((Dict({"x": Int()}),))})
+        c.set({"l": [{"x": 1}], "t": ({"x": 1},)})
+        c.l._type.add_to_model("y", Int())
+        c.t._schema[0].add_to_model("y", Int())
+        c.set({"l": [{"x": 1, "y": 2}], "t": ({"x": 1, "y": 2},)})
+        self.assertEqual(c.l[0].y, 2)
+        self.assertEqual(c.t[0].y, 2)
+
+    def test_compile_exists(self):
+        """
+        non existing keys are skipped, as in check()
+        """
+
+        def has_b(value, o):  # pylint: disable=unused-argument
+            return o.b == 1
+
+        a = Dict(
+            {
+                "b": Int(),
+                "c": Int(exists=has_b),
+                "t": Tuple((Int(), Dict({"x": Int()}, exists=False))),
+            }
+        )
+        a.set({"b": 0})
+        a.check({"c": "not checked", "t": (1, {"x": "not checked"})})
+        a.set({"b": 1})
+        with self.assertRaises(STypeError):
+            a.check({"c": "checked"})
+        with self.assertRaises(STypeError):
+            a.check({"t": ("a", {})})
+
+    def test_validate(self):
+        """
+        validate() returns the error set() would raise, without modifying
+        """
+        a = Dict({"b": Int(max=10), "c": String(transform=lambda v, o: v.upper())})
+        a.set({"b": 1, "c": "hop"})
+
+        self.assertEqual(a.validate({"b": 2}), None)
+        e = a.validate({"b": 12})
+        self.assertEqual(isinstance(e, SConstraintError), True)
+        self.assertEqual(e.to_string(), '$.b: Must be below Maximal ("12")')
+        self.assertEqual(a.get_value(), {"b": 1, "c": "HOP"})
+
+        with self.assertRaises(SConstraintError) as ee:
+            a.set({"b": 12})
+        self.assertEqual(ee.exception.to_string(), e.to_string())
+
+        self.assertEqual(isinstance(a.b.validate("12"), STypeError), True)
+
+    def test_validate_many(self):
+        """
+        validate_many() yields one result per value, lazily
+        """
+        a = List(Dict({"b": Int()}))
+
+        def records():
+            yield [{"b": 1}]
+            yield [{"b": "x"}]
+            yield 12
+            raise RuntimeError("must not be consumed")
+
+        results = a.validate_many(records())
+        self.assertEqual(next(results), None)
+        self.assertEqual(isinstance(next(results), STypeError), True)
+        self.assertEqual(next(results).to_string(), '$: Must be a list (value="12")')
+        self.assertEqual(a.get_value(), None)
+
+    def test_validate_candidate(self):
+        """
+        cross-field constraints see the candidate value, as in set()
+        """
+        a = Dict(
+            {
+                "a": Int(default=0),
+                "b": Int(default=0, constraint=lambda v, root: v >= root.a),
+            }
+        )
+        e = a.validate({"a": 5, "b": 3})
+        self.assertEqual(isinstance(e, SConstraintError), True)
+        with self.assertRaises(SConstraintError) as ee:
+            a.set({"a": 5, "b": 3})
+        self.assertEqual(ee.exception.to_string(), e.to_string())
+        # each value is checked alone (the previous one is not kept)
+        results = list(a.validate_many([{"a": 1, "b": 3}, {"a": 4}, {"a": 2, "b": 3}]))
+        self.assertEqual(results[0], None)
+        self.assertEqual(
+            results[1].to_string(), '$.b: Constraint not validated for value="0"'
+        )
+        self.assertEqual(results[2], None)
+        self.assertEqual(a.get_value(), {"a": 0, "b": 0})
+
+        # on a sub object, other values are those of the object
+        b = Dict(
+            {
+                "a": Int(default=0),
+                "s": Dict({"c": Int(constraint=lambda v, o: v >= o.a)}),
+            }
+        )
+        b.set({"a": 4, "s": {"c": 9}})
+        self.assertEqual(b.s.validate({"c": 5}), None)
+        self.assertEqual(isinstance(b.s.validate({"c": 3}), SConstraintError), True)
+        self.assertEqual(b.get_value(), {"a": 4, "s": {"c": 9}})
+
+        # nothing is set, no event is triggered, rules see a read-only view
+        calls = []
+
+        def modify(v, o):  # pylint: disable=unused-argument
+            o.a = 3
+
+        c = Dict(
+            {
+                "a": Int(default=0, onchange=lambda o, n, r: calls.append("a")),
+                "n": String(on=[("change", lambda e, r, s: calls.append("n"))]),
+                "l": List(
+                    Dict({"i": Int(constraint=lambda v, o: v <= o.a + len(o.l))})
+                ),
+                "m": Int(constraint=modify),
+            }
+        )
+        results = list(
+            c.validate_many(
+                [
+                    {"a": 3, "n": "x", "l": [{"i": 4}]},
+                    {"a": 1, "l": [{"i": 4}]},
+                    {"m": 1},
+                ]
+            )
+        )
+        self.assertEqual(results[0], None)
+        self.assertEqual(isinstance(results[1], SConstraintError), True)
+        self.assertEqual(isinstance(results[2], SRightError), True)
+        self.assertEqual(calls, [])
+        self.assertEqual(c.a, 0)
+        c.set({"a": 1})
+        self.assertEqual(c.l.validate([{"i": 2}]), None)
+        self.assertEqual(isinstance(c.l.validate([{"i": 3}]), SConstraintError), True)
+
+    def test_compile_query(self):
+        """Test a compiled query matches like the query"""
+        a = Dict(
+            {
+                "a": Int(),
+                "b": Dict({"l": List(Dict({"i": String()}))}),
+                "c": Tuple((Int(), String())),
+                "h": Int(exists=lambda v, o: o.a > 20),
+                "s": String(),
+                "t": List(Int()),
+            }
+        )
+        a.set(
+            {
+                "a": 12,
+                "b": {"l": [{"i": "fir"}, {"i": "sec"}]},
+                "c": (22, "h"),
+                "s": "bananas",
+                "t": [12, 13],
+            }
+        )
+        for query, result in (
+            ({"a": 12, "s": "bananas"}, True),
+            ({"a": ("$and", [("$gt", 11), ("$lt", 13)])}, True),
+            ({"a": ("$or", [("$gt", 11), ("$lt", 10)])}, True),
+            ({"a": ("$or", [("$gt", 13), ("$lt", 10)])}, False),
+            ({"a": ("$or", [])}, False),
+            ({"a": ("$unknownoperator", 11)}, False),
+            ({"a": ("$gt", "11")}, False),
+            ({"a": ("$not", ("$gt", 13))}, True),
+            ({"a": ("$not", ("$reg", r"toto"))}, True),
+            ({"s": ("$reg", "ban.*")}, True),
+            ({"s": ("$reg", "(")}, False),
+            ({"b": {"l": ("$contains", {"i": ("$reg", r"sec")})}}, True),
+            ({"b": {"l": [{"i": "fir"}, {"i": "sec"}]}}, True),
+            ({"b": {"l": [{"i": "fir"}]}}, False),
+            ({"c": (22, "h")}, True),
+            ({"h": None}, False),
+            ({"h": ("$not", ("$gt", 1))}, False),
+            ({"t": ("$contains", ("$gt", 12))}, True),
+            ({"nokey": 1}, False),
+            (("$and", [{"a": 12}, {"s": "bananas"}]), True),
+            (("$or", [{"a": 11}, {"s": "apple"}]), False),
+            (("$or", [{"nokey": 11}, {"a": 12}]), True),
+            (("$and", [("$gt", 1)]), False),
+            (None, False),
+        ):
+            compiled = compile_query(query)
+            self.assertEqual(a.match(query), result, query)
+            self.assertEqual(a.match(compiled), result, query)
+            self.assertEqual(compiled.match(a), result, query)
+        self.assertEqual(a.t.match(compile_query([12, 13])), True)
+        self.assertEqual(a.s.match(compile_query(("$reg", "b"))), True)
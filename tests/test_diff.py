@@ -6,7 +6,18 @@ test for Bool()
 import unittest
 import hashlib
 import json
-from stricto import Int, Dict, Bool, Tuple, Float, In, List, String
+from stricto import (
+    Int,
+    Dict,
+    Bool,
+    Tuple,
+    Float,
+    In,
+    List,
+    String,
+    STypeError,
+    SConstraintError,
+)
 
 
 def check_pair(value, o):  # pylint: disable=unused-argument
@@ -74,6 +85,51 @@ class TestDiff(unittest.TestCase):
         dhash2.update(encoded2)
         self.assertEqual(dhash1.hexdigest(), dhash2.hexdigest())
 
+    def test_schema_digest(self):
+        """
+        Test the kept schema and its digest
+        """
+        a = Dict({"b": List(String()), "c": Dict({"d": Int(min=1)})})
+        b = Dict({"c": Dict({"d": Int(min=1)}), "b": List(String())})
+        self.assertEqual(a.schema_digest(), b.schema_digest())
+        self.assertEqual(a.c.schema_digest(), b.c.schema_digest())
+        self.assertNotEqual(a.schema_digest(), a.c.schema_digest())
+        self.assertNotEqual(Int(min=1).schema_digest(), Int(min=2).schema_digest())
+
+        # the schema returned can be modified
+        schema = a.get_schema()
+        schema["sub_scheme"]["c"]["sub_scheme"]["d"]["min"] = 12
+        schema["constraints"].append("func")
+        self.assertEqual(a.get_schema()["sub_scheme"]["c"]["sub_scheme"]["d"]["min"], 1)
+        self.assertEqual(a.get_schema()["constraints"], [])
+
+        # changes of the model
+        digest = a.schema_digest()
+        c_digest = a.c.schema_digest()
+        a.c.add_to_model("e", String())
+        self.assertNotEqual(a.schema_digest(), digest)
+        self.assertNotEqual(a.c.schema_digest(), c_digest)
+        self.assertIn("e", a.get_schema()["sub_scheme"]["c"]["sub_scheme"])
+        self.assertEqual(b.schema_digest(), digest)
+        a.c.remove_model("e")
+        self.assertEqual(a.schema_digest(), digest)
+        self.assertNotIn("e", a.get_schema()["sub_scheme"]["c"]["sub_scheme"])
+
+        # copies share the schema until one of them changes
+        d = a.copy()
+        self.assertEqual(d.schema_digest(), digest)
+        d.add_to_model("f", Bool())
+        self.assertNotEqual(d.schema_digest(), digest)
+        self.assertEqual(a.schema_digest(), digest)
+        self.assertNotIn("f", a.get_schema()["sub_scheme"])
+
+        # the type of elements of a List has no parent
+        e = Dict({"l": List(Dict({"x": Int()}))})
+        digest = e.schema_digest()
+        e.l._type.add_to_model("y", Int())
+        self.assertNotEqual(e.schema_digest(), digest)
+        self.assertIn("y", e.get_schema()["sub_scheme"]["l"]["sub_type"]["sub_scheme"])
+
     def test_diff_simple(self):
         """
         Test a diff
@@ -86,3 +142,146 @@ class TestDiff(unittest.TestCase):
         a.set({"b": 12})
         self.assertEqual(a.b, 12)
         self.assertEqual(a.c, 2)
+
+    def test_diff_operations(self):
+        """
+        Test diff() between two objects
+        """
+
+        def new_object():
+            return Dict(
+                {
+                    "b": Int(),
+                    "s": String(),
+                    "t": Tuple((Int(), String())),
+                    "l": List(Dict({"x": Int(), "y": String()})),
+                    "d": Dict({"e": Bool(), "f": List(Int())}),
+                }
+            )
+
+        a = new_object()
+        a.set(
+            {
+                "b": 1,
+                "s": "a/b",
+                "t": (1, "a"),
+                "l": [{"x": 1}, {"x": 2}, {"x": 3}],
+                "d": {"e": True, "f": [1, 2]},
+            }
+        )
+        b = a.copy()
+        self.assertEqual(a.diff(b), [])
+        self.assertEqual(a.diff(a), [])
+
+        b.set(
+            {
+                "b": 2,
+                "t": (1, "b"),
+                "l": [{"x": 0}, {"x": 1}, {"x": 2, "y": "new"}],
+                "d": {"f": None},
+            }
+        )
+        self.assertEqual(
+            a.diff(b),
+            [
+                {"op": "replace", "path": "/b", "value": 2},
+                {"op": "replace", "path": "/t/1", "value": "b"},
+                {"op": "add", "path": "/l/0", "value": {"x": 0, "y": None}},
+                {"op": "replace", "path": "/l/2/y", "value": "new"},
+                {"op": "remove", "path": "/l/3"},
+                {"op": "replace", "path": "/d/f", "value": None},
+            ],
+        )
+        a.patch_many(a.diff(b))
+        self.assertEqual(a.get_value(), b.get_value())
+
+        # keys are escaped, fields which exist only on one side
+        c = Dict({"a/b": Int(), "c": Int(exists=lambda value, o: False)})
+        d = Dict({"a/b": Int(), "d": Int()})
+        c.set({"a/b": 1})
+        d.set({"a/b": 2, "d": 3})
+        self.assertEqual(
+            c.diff(d),
+            [
+                {"op": "replace", "path": "/a~1b", "value": 2},
+                {"op": "add", "path": "/d", "value": 3},
+            ],
+        )
+        self.assertEqual(d.diff(c)[1], {"op": "remove", "path": "/d"})
+        self.assertEqual(
+            Int(default=1).diff(String(default="1")),
+            [{"op": "replace", "path": "", "value": "1"}],
+        )
+        with self.assertRaises(STypeError):
+            a.diff({"b": 2})
+
+    def test_digest(self):
+        """
+        Test digest() and equality with digests
+        """
+        a = Dict(
+            {
+                "b": Int(),
+                "f": Float(),
+                "l": List(Dict({"x": Int(), "y": String()})),
+                "t": Tuple((Int(), String())),
+            }
+        )
+        a.set({"b": 1, "f": 2.0, "l": [{"x": 1}, {"x": 2}], "t": (1, "a")})
+        b = a.copy()
+        digest = a.digest()
+        self.assertEqual(len(digest), 32)
+        self.assertEqual(b.digest(), digest)
+        self.assertEqual(a, b)
+
+        # the digest changes with the value, and only it
+        b.l[1].y = "new"
+        self.assertNotEqual(b.digest(), digest)
+        self.assertNotEqual(a, b)
+        self.assertNotEqual(a.l, b.l)
+        self.assertEqual(a.t, b.t)
+        b.l[1].y = None
+        self.assertEqual(b.digest(), digest)
+        self.assertEqual(a, b)
+
+        # equal values have equal digests
+        self.assertEqual(Int(default=2).digest(), Float(default=2.0).digest())
+        b.l.append({"x": 3})
+        b.l.pop()
+        b.l.sort(key=lambda e: e.x, reverse=True)
+        self.assertNotEqual(b.digest(), digest)
+        b.l.rollback()
+        self.assertEqual(b.digest(), digest)
+        with b.transaction() as t:
+            b.t = None
+            b.l.clear()
+            t.rollback()
+        self.assertEqual(b.digest(), digest)
+        self.assertNotEqual(List(Int()).digest(), Int().digest())
+
+        # digests are computed each time if values depend on other fields
+        c = Dict(
+            {
+                "b": Int(),
+                "c": Int(default=2, exists=lambda value, o: o.b == 1),
+            }
+        )
+        d = c.copy()
+        c.set({"b": 1})
+        d.set({"b": 2})
+        digest = c.digest()
+        self.assertNotEqual(d.digest(), digest)
+        self.assertNotEqual(c, d)
+        d.b = 1
+        self.assertEqual(d.digest(), digest)
+        self.assertEqual(c, d)
+        c.enable_permissions()
+        self.assertEqual(c.digest(), digest)
+
+        # uniq lists
+        u = List(Dict({"x": Int()}), uniq=True)
+        u.set([{"x": 1}, {"x": 2}])
+        with self.assertRaises(SConstraintError):
+            u.append({"x": 1})
+        u.append({"x": 3})
+        self.assertEqual(len(u), 3)
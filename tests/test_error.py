@@ -4,7 +4,7 @@ test for Errors()
 """
 import unittest
 
-from stricto import StrictoError, STypeError, SError
+from stricto import StrictoError, STypeError, SError, SConstraintError, Dict, List, Int
 
 
 class TestError(unittest.TestCase):
@@ -48,3 +48,21 @@ class TestError(unittest.TestCase):
         self.assertEqual(
             repr(ee.exception), 'SError(ZeroDivisionError("division by zero"))'
         )
+
+    def test_lazy_error(self):
+        """
+        test the message is built when needed, with a short preview of values
+        """
+        a = Dict({"b": Dict({"c": List(Int(), max=3)})})
+        e = a.validate({"b": {"c": list(range(1000))}})
+        self.assertEqual(isinstance(e, SConstraintError), True)
+        self.assertEqual(e._message, None)  # pylint: disable=protected-access
+        self.assertEqual(
+            e.to_string(),
+            "$.b.c: Must be below Maximal (value=\"[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, "
+            + "10, 11, 12, 13, 14, 15, 16, 17, 18, 19, ...]\")",
+        )
+        self.assertIs(e.to_string(), e.to_string())
+
+        e = StrictoError("{0} {name}", "x" * 1000, name=[1, 2])
+        self.assertEqual(e.to_string(), "x" * 197 + "... [1, 2]")
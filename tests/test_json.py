@@ -0,0 +1,195 @@
+# pylint: disable=duplicate-code
+"""
+test for JSON encoding and decoding
+"""
+
+# pylint: disable=no-member
+import unittest
+import io
+import json
+import ipaddress
+from datetime import datetime
+
+from stricto import (
+    Dict,
+    Int,
+    Float,
+    String,
+    Bool,
+    List,
+    Tuple,
+    In,
+    Bytes,
+    Datetime,
+    Ipaddress,
+    Ipnetwork,
+    Complex,
+    FreeDict,
+    StrictoEncoder,
+    dumps,
+    STypeError,
+    SConstraintError,
+    SSyntaxError,
+)
+
+
+class Upper(String):
+    """
+    A String with its own encoding
+    """
+
+    __slots__ = ()
+
+    def __json_encode__(self):
+        v = self.get_value()
+        return None if v is None else v.upper()
+
+
+class TestJson(unittest.TestCase):
+    """
+    test for JSON
+    """
+
+    def test_dumps(self):
+        """
+        dumps() and to_json() are the same as json.dumps( cls=StrictoEncoder )
+        """
+        a = Dict(
+            {
+                "i": Int(),
+                "f": Float(),
+                "nan": Float(),
+                "s": String(),
+                "u": Upper(),
+                "b": Bool(default=True),
+                "d": Int(default=lambda o: 7),
+                "hidden": Int(exists=False),
+                "secret": String(can_read=False),
+                "l": List(
+                    Dict(
+                        {
+                            "a": Int(),
+                            "x": List(String()),
+                            "t": Tuple((Int(), String())),
+                        }
+                    )
+                ),
+                "ll": List(List(Int())),
+                "lu": List(Upper()),
+                "empty": List(Int()),
+                "none": List(Int()),
+                "ed": Dict({}),
+                "t": Tuple((Int(), Dict({"z": Bytes()}))),
+                "by": Bytes(),
+                "dt": Datetime(),
+                "ip": Ipaddress(),
+                "net": Ipnetwork(),
+                "c": Complex(),
+                "fd": FreeDict(),
+                "in": In([Int(), String()]),
+            }
+        )
+        a.set(
+            {
+                "i": 12,
+                "f": 1.5e300,
+                "nan": float("nan"),
+                "s": 'é"\n\u2028 x',
+                "u": "abc",
+                "secret": "pw",
+                "l": [{"a": 1, "x": ["p", "q"], "t": (1, "z")}, {"a": None}],
+                "ll": [[1, 2], []],
+                "lu": ["a", "b"],
+                "empty": [],
+                "t": (3, {"z": b"\x00\xff"}),
+                "by": b"hello",
+                "dt": datetime(2024, 1, 2, 3, 4, 5),
+                "ip": ipaddress.ip_address("10.0.0.1"),
+                "net": ipaddress.ip_network("10.0.0.0/8"),
+                "c": {"real": 1.0, "imag": -2.0},
+                "fd": {"k": [1, {"m": None}], "é": 1.0},
+                "in": "str",
+            }
+        )
+        a.enable_permissions()
+
+        reference = json.dumps(a, cls=StrictoEncoder)
+        self.assertEqual(a.to_json(), reference)
+        self.assertEqual(dumps(a), reference)
+        self.assertEqual(json.loads(reference)["lu"], ["A", "B"])
+        self.assertEqual("secret" in json.loads(reference), False)
+        for key in json.loads(reference):
+            self.assertEqual(
+                a[key].to_json(), json.dumps(a[key], cls=StrictoEncoder), key
+            )
+        self.assertEqual(dumps({"a": [1, a.i]}), '{"a": [1, 12]}')
+
+        # unreadable elements of a list
+        b = List(Dict({"v": Int(), "h": Int(exists=lambda v, o: False)}))
+        b.set([{"v": 1}, {"v": 2}])
+        c = Dict({"l": b, "ll": List(b)})
+        c.set({"l": [{"v": 1}], "ll": [[{"v": 2}]]})
+        for o in (b, c, c.ll):
+            self.assertEqual(o.to_json(), json.dumps(o, cls=StrictoEncoder))
+
+        # a Dict which does not exist
+        d = Dict({"e": Dict({"i": Int(default=1)}, exists=False), "j": Int()})
+        e = d._children["e"]  # pylint: disable=protected-access
+        self.assertEqual(e.to_json(), json.dumps(e, cls=StrictoEncoder))
+        self.assertEqual(d.to_json(), '{"j": null}')
+
+    def test_load_stream(self):
+        """
+        List.load_stream() reads a JSON array element by element
+        """
+        a = List(Dict({"id": Int(), "name": String()}), max=3)
+        values = [{"id": 123456, "name": "é"}, {"id": 7, "name": None}]
+        text = json.dumps(values, ensure_ascii=False, indent=2)
+        for chunk_size in (1, 3, 64, 100000):
+            a.load_stream(io.StringIO(text), chunk_size)
+            self.assertEqual(a.get_value(), values)
+            a.load_stream(io.BytesIO(text.encode("utf-8")), chunk_size)
+            self.assertEqual(a.get_value(), values)
+        self.assertIs(a[1].id.get_root(), a)
+        self.assertEqual(a[1].id.path_name(), "$[1].id")
+        a.load_stream(io.StringIO(" [ ] "))
+        self.assertEqual(a.get_value(), [])
+
+        # On error, the list is not modified
+        a.set(values)
+        with self.assertRaises(STypeError) as e:
+            a.load_stream(io.StringIO('[{"id": 1}, {"id": "x"}]'))
+        self.assertEqual(e.exception.to_string(), '$[1].id: Must be a int ("x")')
+        with self.assertRaises(SConstraintError):
+            a.load_stream(io.StringIO("[{}, {}, {}, {}]"))
+        self.assertEqual(a.get_value(), values)
+        a.load_stream(io.StringIO("[{}]"))
+        a.rollback()
+        self.assertEqual(a.get_value(), values)
+
+        b = List(Int())
+        for text, message in (
+            ("{}", "$[0]: Invalid JSON (Expecting '[')"),
+            ("[1, 2", "$[2]: Invalid JSON (Expecting ',' delimiter)"),
+            ("[1,]", "$[1]: Invalid JSON (Expecting value)"),
+            ("[1 2]", "$[1]: Invalid JSON (Expecting ',' delimiter)"),
+            ("[1] x", "$[1]: Invalid JSON (Extra data)"),
+        ):
+            with self.assertRaises(SSyntaxError) as e:
+                b.load_stream(io.StringIO(text), 2)
+            self.assertEqual(e.exception.to_string(), message)
+
+        # values cut at any place, a syntax error is raised without reading on
+        c = List(FreeDict())
+        values = [
+            {"a": -1.5e3, "b": 0.25, "c": True, "d": False, "e": None},
+            {"f": "a\u00e9\"b", "g": {"k": [1, -2]}},
+        ]
+        text = json.dumps(values)
+        for chunk_size in (1, 2, 5):
+            c.load_stream(io.StringIO(text), chunk_size)
+            self.assertEqual(c.get_value(), values)
+        stream = io.StringIO("[1, tru, " + "2, " * 10000 + "3]")
+        with self.assertRaises(SSyntaxError):
+            b.load_stream(stream, 16)
+        self.assertLess(stream.tell(), 100)
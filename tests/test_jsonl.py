@@ -0,0 +1,105 @@
+# pylint: disable=duplicate-code
+"""
+test for JSON Lines validation
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from stricto import Dict, Int, String, JsonlValidator, SSyntaxError
+from stricto.jsonl import load_schema
+from stricto.__main__ import main
+
+
+SCHEMA = Dict({"name": String(require=True), "age": Int(min=0)})
+
+LINES = [
+    '{"name": "Edward", "age": 12}',
+    '{"name": "Kim", "age": -1}',
+    "",
+    '{"name": "Peg"}',
+    "{not json",
+    '{"name": 3}',
+    '{"name": "Bill", "age": 50}',
+    '{"name": "Joyce", "unknown": 50}',
+]
+
+
+class TestJsonl(unittest.TestCase):
+    """
+    test for JsonlValidator
+    """
+
+    def setUp(self):
+        """
+        write the file to validate
+        """
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".jsonl", delete=False, encoding="utf-8"
+        ) as f:
+            f.write("\n".join(LINES) + "\n")
+            self.filename = f.name
+
+    def tearDown(self):
+        os.unlink(self.filename)
+
+    def test_load_schema(self):
+        """
+        load a schema as module:attribute
+        """
+        self.assertIs(load_schema("tests.test_jsonl:SCHEMA"), SCHEMA)
+        with self.assertRaises(SSyntaxError):
+            load_schema("tests.test_jsonl")
+        with self.assertRaises(SSyntaxError):
+            load_schema("tests.test_jsonl:LINES")
+        with self.assertRaises(SSyntaxError):
+            load_schema("tests.test_jsonl:nothing")
+
+    def test_validate(self):
+        """
+        errors are line numbered, whatever the chunks and workers
+        """
+        expected = None
+        for workers, chunk_size in ((1, 1 << 20), (1, 7), (2, 13), (3, 1)):
+            v = JsonlValidator(
+                "tests.test_jsonl:SCHEMA",
+                self.filename,
+                workers=workers,
+                chunk_size=chunk_size,
+            )
+            errors = list(v.errors())
+            self.assertEqual([line for line, _ in errors], [2, 5, 6, 8])
+            if expected is None:
+                expected = errors
+            self.assertEqual(errors, expected)
+            self.assertEqual(v.stats["lines"], 8)
+            self.assertEqual(v.stats["records"], 6)
+            self.assertEqual(v.stats["errors"], 4)
+
+        self.assertEqual(
+            expected[0][1], 'ConstraintsError("$.age: Must be above Minimal ("-1")")'
+        )
+
+        # A schema object in the same process
+        v = JsonlValidator(SCHEMA, self.filename)
+        self.assertEqual(list(v.errors()), expected)
+        with self.assertRaises(SSyntaxError):
+            JsonlValidator(SCHEMA, self.filename, workers=2)
+
+    def test_command_line(self):
+        """
+        python -m stricto validate
+        """
+        out = io.StringIO()
+        err = io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            code = main(
+                ["validate", "tests.test_jsonl:SCHEMA", self.filename, "--workers", "2"]
+            )
+        self.assertEqual(code, 1)
+        self.assertEqual(len(out.getvalue().splitlines()), 4)
+        self.assertTrue(out.getvalue().startswith(f"{self.filename}:2: "))
+        self.assertRegex(err.getvalue(), "^6 records, 4 errors")
@@ -3,6 +3,7 @@
 test for List()
 """
 
+import gc
 import unittest
 
 from stricto import (
@@ -12,7 +13,10 @@ from stricto import (
     String,
     STypeError,
     SConstraintError,
+    SSyntaxError,
+    SAttributeError,
 )
+from stricto.list_index import ListIndex
 
 
 class TestList(unittest.TestCase):  # pylint: disable=too-many-public-methods
@@ -379,6 +383,23 @@ class TestList(unittest.TestCase):  # pylint: disable=too-many-public-methods
             "$: duplicate value in list (value=\"['Ford', 'BMW', 'Volvo', 'BMW', 'yolo']\")",
         )
 
+        # elements are counted by digest, kept up to date with the list
+        b = List(Dict({"n": Int()}), uniq=True)
+        b.set([{"n": 1}, {"n": 2}])
+        b[0] = {"n": 1}
+        b.append({"n": 3})
+        b[2].n = 4
+        b.append({"n": 3})
+        with self.assertRaises(SConstraintError):
+            b.append({"n": 4})
+        b.rollback()
+        b.append({"n": 3})
+        del b[0]
+        b.extend([{"n": 1}])
+        with self.assertRaises(SConstraintError):
+            b.insert(0, {"n": 2})
+        self.assertEqual(b.get_value(), [{"n": 2}, {"n": 4}, {"n": 3}, {"n": 1}])
+
     def test_rollback(self):
         """
         test rollback
@@ -398,6 +419,117 @@ class TestList(unittest.TestCase):  # pylint: disable=too-many-public-methods
         a.rollback()
         self.assertEqual(len(a), 2)
 
+    def test_rollback_operations(self):
+        """
+        rollback undo the last modification, whatever it is
+        """
+        a = List(Int())
+        a.set([1, 2, 3])
+        elements = [a[i] for i in range(len(a))]
+
+        a.insert(0, 0)
+        self.assertEqual(a.get_value(), [0, 1, 2, 3])
+        self.assertEqual(a[1].path_name(), "$[1]")
+        a.rollback()
+        self.assertEqual(a.get_value(), [1, 2, 3])
+        self.assertEqual(a[0].path_name(), "$[0]")
+
+        a.pop(0)
+        a.rollback()
+        a.remove(2)
+        a.rollback()
+        del a[1:]
+        a.rollback()
+        a.sort(reverse=True)
+        self.assertEqual(a.get_value(), [3, 2, 1])
+        a.rollback()
+        a.extend([4, 5])
+        a.rollback()
+        a.clear()
+        a.rollback()
+        self.assertEqual(a.get_value(), [1, 2, 3])
+        # the elements are not copied
+        for i, element in enumerate(elements):
+            self.assertIs(a[i], element)
+
+        a[-1] = 9
+        self.assertEqual(a[2].path_name(), "$[2]")
+        a.rollback()
+        a.rollback()
+        self.assertEqual(a.get_value(), [1, 2, 3])
+
+        a.set([7])
+        a.rollback()
+        self.assertEqual(a.get_value(), [1, 2, 3])
+
+    def test_incremental_checks(self):
+        """
+        list level checks on modifications
+        """
+        a = List(Int(), uniq=True, max=3)
+        a.set([1, 2])
+        with self.assertRaises(SConstraintError) as e:
+            a.append(2)
+        self.assertEqual(
+            e.exception.to_string(), '$: duplicate value in list (value="[1, 2, 2]")'
+        )
+        with self.assertRaises(SConstraintError):
+            a.insert(0, 1)
+        with self.assertRaises(SConstraintError):
+            a[0] = 2
+        a[0] = 1
+        a.append(3)
+        with self.assertRaises(SConstraintError) as e:
+            a.extend([4])
+        self.assertEqual(
+            e.exception.to_string(), '$: Must be below Maximal (value="[1, 2, 3, 4]")'
+        )
+        with self.assertRaises(STypeError):
+            a.insert(1, "x")
+        self.assertEqual(a.get_value(), [1, 2, 3])
+
+        with self.assertRaises(IndexError):
+            a[5] = 1
+        with self.assertRaises(ValueError):
+            a.remove(12)
+
+        # constraints on the whole list are still checked
+        b = List(Int(), constraint=lambda value, o: len(value) < 4)
+        b.set([1, 2])
+        b.append(3)
+        with self.assertRaises(SConstraintError):
+            b.append(4)
+        b.sort(reverse=True)
+        self.assertEqual(b.get_value(), [3, 2, 1])
+
+    def test_rejected_change(self):
+        """
+        a rejected modification does not change the value
+        """
+        a = List(Int(), min=2)
+        with self.assertRaises(SConstraintError):
+            a.append(1)
+        self.assertEqual(a.get_value(), None)
+        with self.assertRaises(SConstraintError):
+            a.insert(0, 1)
+        self.assertEqual(a.get_value(), None)
+        with self.assertRaises(SConstraintError):
+            a.extend([1])
+        self.assertEqual(a.get_value(), None)
+        with self.assertRaises(IndexError):
+            a.pop()
+        self.assertEqual(a.get_value(), None)
+        with self.assertRaises(IndexError):
+            a[0] = 1
+        self.assertEqual(a.get_value(), None)
+
+        a.set([1, 2])
+        with self.assertRaises(SConstraintError):
+            a.pop()
+        with self.assertRaises(STypeError):
+            a.insert(0, "x")
+        self.assertEqual(a.get_value(), [1, 2])
+
     def test_min_max(self):
         """
         Test min and max()
@@ -457,3 +589,91 @@ class TestList(unittest.TestCase):  # pylint: disable=too-many-public-methods
         b = List(String(require=False), require=True, default=[".*"])
         b.copy()
         Dict({"b": List(String(require=False), default=[".*"])})
+
+    def test_find_with_indexes(self):
+        """
+        Test find() with indexes
+        """
+        a = List(
+            Dict(
+                {
+                    "name": String(),
+                    "age": Int(),
+                    "tags": List(String()),
+                    "address": Dict({"city": String()}),
+                }
+            )
+        )
+        a.set(
+            [
+                {"name": "bob", "age": 20, "tags": ["x"], "address": {"city": "P"}},
+                {"name": "al", "age": 30, "tags": ["y"], "address": {"city": "L"}},
+                {"name": "bob", "age": 40, "tags": None, "address": {"city": "P"}},
+            ]
+        )
+        queries = [
+            {"name": "bob"},
+            {"name": "bob", "age": ("$gte", 30)},
+            {"age": ("$and", [("$gt", 20), ("$lt", 50)])},
+            {"tags": ("$contains", "y")},
+            {"address": {"city": "P"}},
+            ("$and", [{"name": "bob"}, {"address": {"city": "L"}}]),
+            ("$or", [{"name": "al"}, {"age": 40}]),
+        ]
+
+        def check():
+            for query in queries:
+                self.assertEqual(
+                    [id(e) for e in a.find(query)],
+                    [id(e) for e in a if e.match(query)],
+                    query,
+                )
+
+        check()
+        a.create_index("$.name")
+        a.create_index("$.age", "sorted")
+        a.create_index("$.tags")
+        a.create_index("$.address.city")
+        self.assertEqual([e.age for e in a.find({"name": "bob"})], [20, 40])
+        self.assertEqual(
+            [e.age for e in a.find({"age": ("$gt", 20), "address": {"city": "P"}})],
+            [40],
+        )
+        check()
+
+        # indexes follow modifications
+        a.append({"name": "bob", "age": 25, "tags": ["y"]})
+        a.insert(0, {"name": "zoe", "age": 50})
+        a[1].name = "bobby"
+        a[2].tags.append("x")
+        a[3].set({"name": "al", "address": {"city": "L"}})
+        a.pop(1)
+        check()
+        self.assertEqual([e.age for e in a.find({"name": "bob"})], [25])
+        a.rollback()
+        check()
+        a.sort(key=lambda e: e.age.get_value() or 0)
+        check()
+        del a[0:2]
+        check()
+        a.set([{"name": "bob"}])
+        self.assertEqual(len(a.find({"name": "bob"})), 1)
+
+        with self.assertRaises(SSyntaxError):
+            a.create_index("$.name", "btree")
+        with self.assertRaises(SSyntaxError):
+            a.create_index("$.tags[0]")
+        with self.assertRaises(SAttributeError):
+            a.create_index("$.nothing")
+        live = len(ListIndex.live)
+        a.drop_index("$.name")
+        self.assertEqual(len(a.find({"name": "bob"})), 1)
+        self.assertEqual(len(ListIndex.live), live - 1)
+
+        # indexes of collected lists are not live any more
+        b = List(Dict({"name": String()}))
+        b.create_index("$.name")
+        self.assertEqual(len(ListIndex.live), live)
+        del b
+        gc.collect()
+        self.assertEqual(len(ListIndex.live), live - 1)
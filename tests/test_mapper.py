@@ -0,0 +1,176 @@
+# pylint: disable=duplicate-code
+"""
+test for mapper()
+"""
+
+# pylint: disable=no-member
+import unittest
+
+from stricto import (
+    String,
+    Int,
+    Float,
+    Dict,
+    List,
+    Tuple,
+    mapper,
+    Constant,
+    SConstraintError,
+    SSyntaxError,
+)
+
+
+class TestMapper(unittest.TestCase):
+    """
+    test for mappers
+    """
+
+    def test_mapper(self):
+        """
+        renames, nesting, constants, functions and lists of records
+        """
+        user = Dict(
+            {
+                "name": String(),
+                "age": Int(min=0),
+                "city": String(),
+                "pos": Tuple((Float(), Float())),
+                "orders": List(Dict({"id": Int(), "amount": Float()})),
+            }
+        )
+        public = Dict(
+            {
+                "full_name": String(require=True),
+                "age": Int(min=0),
+                "address": Dict({"city": String(), "lat": Float()}),
+                "version": Int(),
+                "nb": Int(max=5),
+                "items": List(Dict({"ref": Int(), "total": Float(min=0.0)})),
+            }
+        )
+        to_public = mapper(
+            user,
+            public,
+            {
+                "full_name": ("$.name", lambda v, o: v.title()),
+                "age": "$.age",
+                "address": {"city": "$.city", "lat": "$.pos[0]"},
+                "version": Constant(2),
+                "nb": lambda o: len(o.orders),
+                "items": ("$.orders", {"ref": "$.id", "total": "$.amount"}),
+            },
+        )
+
+        u = user.copy()
+        u.set(
+            {
+                "name": "john doe",
+                "age": 33,
+                "city": "Paris",
+                "pos": (48.8, 2.3),
+                "orders": [{"id": 1, "amount": 2.5}, {"id": 2, "amount": 3.0}],
+            }
+        )
+        p = to_public(u)
+        self.assertEqual(
+            p.get_value(),
+            {
+                "full_name": "John Doe",
+                "age": 33,
+                "address": {"city": "Paris", "lat": 48.8},
+                "version": 2,
+                "nb": 2,
+                "items": [{"ref": 1, "total": 2.5}, {"ref": 2, "total": 3.0}],
+            },
+        )
+        self.assertEqual(p.items[1].ref.path_name(), "$.items[1].ref")
+        self.assertEqual(u.name, "john doe")
+
+        # Plain values are accepted, and target rules are checked
+        with self.assertRaises(SConstraintError) as e:
+            to_public({"name": "x", "orders": [{"id": 1, "amount": -1.0}]})
+        self.assertEqual(
+            e.exception.to_string(),
+            '$.items[0].total: Must be above Minimal (value="-1.0")',
+        )
+        with self.assertRaises(SConstraintError):
+            to_public({"name": "x", "orders": [{"id": i} for i in range(6)]})
+        self.assertEqual(to_public({"name": "x"}).items, None)
+
+    def test_mapper_same_rules(self):
+        """
+        fields with the same rules are not checked again
+        """
+        calls = []
+
+        def positive(value, o):  # pylint: disable=unused-argument
+            calls.append(value)
+            return value > 0
+
+        source = Dict({"a": Int(constraint=positive), "b": Int(constraint=positive)})
+        target = Dict(
+            {"x": Int(constraint=positive), "y": Int(constraint=positive, max=10)}
+        )
+        # kept digests and schemas are not rules
+        source.digest()
+        source.get_schema()
+        convert = mapper(source, target, {"x": "$.a", "y": "$.b"})
+        s = source.copy()
+        s.set({"a": 1, "b": 2})
+        calls.clear()
+        self.assertEqual(convert(s).get_value(), {"x": 1, "y": 2})
+        self.assertEqual(calls, [2])
+
+        # indexes of a list are not rules
+        source = Dict({"l": List(Dict({"k": Int(constraint=positive)}))})
+        source.l.create_index("$.k")
+        target = Dict({"m": List(Dict({"k": Int(constraint=positive)}))})
+        convert = mapper(source, target, {"m": "$.l"})
+        s = source.copy()
+        s.set({"l": [{"k": 1}]})
+        calls.clear()
+        self.assertEqual(convert(s).get_value(), {"m": [{"k": 1}]})
+        self.assertEqual(calls, [])
+
+    def test_mapper_unmapped(self):
+        """
+        fields not in the mapping get their default, which is checked
+        """
+        source = Dict({"a": Int()})
+        target = Dict({"x": Int(), "id": Int(required=True), "n": Int(default=5)})
+        with self.assertRaises(SConstraintError):
+            mapper(source, target, {"x": "$.a"})({"a": 1})
+
+        target = Dict({"x": Int(), "n": Int(default=5, min=10)})
+        with self.assertRaises(SConstraintError):
+            mapper(source, target, {"x": "$.a"})({"a": 1})
+
+        target = Dict(
+            {
+                "x": Int(),
+                "n": Int(default=12, min=10),
+                "id": Int(required=True, exists=False),
+                "sub": Dict({"y": Int(default=0, max=-1)}),
+            }
+        )
+        with self.assertRaises(SConstraintError):
+            mapper(source, target, {"x": "$.a"})({"a": 1})
+        convert = mapper(source, target, {"x": "$.a", "sub": {"y": Constant(-3)}})
+        self.assertEqual(
+            convert({"a": 1}).get_value(), {"x": 1, "n": 12, "sub": {"y": -3}}
+        )
+
+    def test_mapper_errors(self):
+        """
+        the mapping is checked when compiled
+        """
+        source = Dict({"a": Int(), "l": List(Int())})
+        target = Dict({"x": Int()})
+        with self.assertRaises(SSyntaxError):
+            mapper(source, target, {"x": "$.b"})
+        with self.assertRaises(SSyntaxError):
+            mapper(source, target, {"z": "$.a"})
+        with self.assertRaises(SSyntaxError):
+            mapper(source, target, {"x": "$.*.a"})
+        with self.assertRaises(SSyntaxError):
+            mapper(source, target, {"x": ("$.a", {"y": "$"})})
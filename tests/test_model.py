@@ -0,0 +1,112 @@
+# pylint: disable=duplicate-code
+"""
+test for Model()
+"""
+
+# pylint: disable=no-member, protected-access
+import unittest
+
+from stricto import (
+    String,
+    Int,
+    Dict,
+    List,
+    Tuple,
+    Datetime,
+    Model,
+    SConstraintError,
+    STypeError,
+)
+
+
+class TestModel(unittest.TestCase):
+    """
+    test for models
+    """
+
+    def test_model_new(self):
+        """
+        new objects are independent, with defaults and their own nodes
+        """
+        user = Dict(
+            {
+                "name": String(default="nobody"),
+                "age": Int(min=0),
+                "address": Dict({"city": String(), "zip": String()}),
+                "tags": List(String()),
+                "pos": Tuple((Int(), Int())),
+            }
+        )
+        model = Model(user)
+
+        a = model.new()
+        b = model()
+        self.assertEqual(a.get_value(), user.get_value())
+        self.assertEqual(a.name, "nobody")
+        self.assertIsNot(a.address, b.address)
+        self.assertIs(a.address.city.get_root(), a)
+        self.assertIs(a.address.city._parent, a.address)
+        self.assertEqual(a.address.city.get_depth(), 2)
+        self.assertEqual(a.address.city.path_name(), "$.address.city")
+
+        a.name = "bob"
+        a.address.city = "Paris"
+        a.tags.append("x")
+        a.pos = (3, 4)
+        self.assertIs(a.pos[1].get_root(), a)
+        self.assertEqual(a.pos[1].path_name(), "$.pos[1]")
+        self.assertEqual(b.name, "nobody")
+        self.assertEqual(b.address.city, None)
+        self.assertEqual(b.tags.get_value(), None)
+        self.assertEqual(b.pos.get_value(), None)
+        self.assertEqual(user.name, "nobody")
+        self.assertEqual(model.new().get_value(), user.get_value())
+
+        with self.assertRaises(SConstraintError) as e:
+            a.age = -1
+        self.assertEqual(
+            e.exception.to_string(), '$.age: Must be above Minimal ("-1")'
+        )
+        with self.assertRaises(STypeError):
+            b.address.zip = 12
+
+        # rights are not shared
+        a.enable_permissions()
+        self.assertEqual(a._permissions._enabled, True)
+        self.assertEqual(b._permissions._enabled, False)
+
+    def test_model_value(self):
+        """
+        new objects filled with a value, checked as set()
+        """
+        model = Model(
+            Dict(
+                {
+                    "start": Datetime(),
+                    "end": Datetime(),
+                    "n": Int(required=True),
+                    "l": List(Dict({"i": Int()}), max=2),
+                },
+                constraints=[lambda v, o: v["n"] < 10],
+            )
+        )
+        a = model.new({"n": 1, "l": [{"i": 1}, {"i": 2}]})
+        self.assertEqual(a.n, 1)
+        self.assertEqual(a.l[1].i, 2)
+        self.assertIs(a.l[1].i.get_root(), a)
+
+        with self.assertRaises(SConstraintError):
+            model.new({"n": 11})
+        with self.assertRaises(SConstraintError):
+            model.new({"n": 1, "l": [{"i": 1}, {"i": 2}, {"i": 3}]})
+        with self.assertRaises(STypeError):
+            model.new({"n": 1, "start": 3})
+
+        # the schema of a model is copied
+        schema = Dict({"i": Int()})
+        model = Model(schema)
+        schema.add_to_model("j", Int())
+        self.assertEqual(model.new().get_value(), {"i": None})
+        a = model.new()
+        a.add_to_model("j", Int())
+        self.assertEqual(model.new().get_value(), {"i": None})
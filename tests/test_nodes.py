@@ -0,0 +1,132 @@
+# pylint: disable=duplicate-code
+"""
+test for the nodes of objects (layout, root, shared rules)
+"""
+
+# pylint: disable=no-member
+import unittest
+
+from stricto import (
+    String,
+    Int,
+    Dict,
+    List,
+    Bool,
+    Tuple,
+    SConstraintError,
+    SAttributeError,
+    SSyntaxError,
+)
+
+
+class TestNodes(unittest.TestCase):
+    """
+    test for the nodes of objects
+    """
+
+    def test_compact_layout(self):
+        """
+        Test nodes have no __dict__, and a subclass still can have one
+        """
+
+        class MyDict(Dict):  # pylint: disable=too-few-public-methods
+            """
+            A subclass without __slots__
+            """
+
+            def __init__(self, **kwargs):
+                self.my_attribute = 12
+                super().__init__({"b": Int()}, **kwargs)
+
+        a = Dict({"b": Int(), "c": List(String()), "d": Tuple((Int(), Bool()))})
+        for o in (a, a.b, a.c, a.d):
+            with self.assertRaises(AttributeError):
+                object.__getattribute__(o, "__dict__")
+
+        with self.assertRaises(SSyntaxError) as e:
+            Dict({"_children": Int()})
+        self.assertEqual(
+            e.exception.to_string(),
+            'Key "_children" is forbidden (already used)',
+        )
+
+        m = MyDict()
+        m.set({"b": 2})
+        n = m.copy()
+        self.assertEqual(n.my_attribute, 12)
+        self.assertEqual(n.b, 2)
+        with self.assertRaises(SAttributeError):
+            n.other_attribute = 1
+
+    def test_root_and_depth(self):
+        """
+        Test the root and the depth are kept when objects are attached
+        """
+        sub = Dict({"e": Int(), "l": List(Dict({"f": Int()}))})
+        a = Dict({"b": Int(), "d": sub})
+        self.assertIs(sub.e.get_root(), sub)
+        self.assertIs(a.d.e.get_root(), a)
+        self.assertEqual(a.get_depth(), 0)
+        self.assertEqual(a.d.e.get_depth(), 2)
+
+        a.set({"d": {"l": [{"f": 1}]}})
+        a.d.l.append({"f": 2})
+        a.d.l.insert(0, {"f": 0})
+        for element in a.d.l:
+            self.assertIs(element.f.get_root(), a)
+            self.assertEqual(element.f.get_depth(), 4)
+        self.assertEqual(a.d.l[2].f.path_name(), "$.d.l[2].f")
+
+        a.add_to_model("g", Dict({"h": Tuple((Int(), Dict({"i": Int()})))}))
+        a.g.h = (1, {"i": 2})
+        self.assertIs(a.g.h[1].i.get_root(), a)
+        self.assertEqual(a.g.h[1].i.get_depth(), 4)
+
+        # A copy is a new root, including list elements
+        b = a.d.copy()
+        self.assertIs(b.get_root(), b)
+        self.assertIs(b.e.get_root(), b)
+        self.assertEqual(b.e.get_depth(), 1)
+        self.assertIs(b.l[1].f.get_root(), b)
+        self.assertEqual(b.l[1].f.get_depth(), 3)
+
+    def test_shared_rules(self):
+        """
+        Test copies share rules until one of them is modified
+        """
+        # pylint: disable=protected-access
+        a = Dict({"b": Int(max=3), "l": List(Dict({"f": Int()}))})
+        b = a.copy()
+        self.assertIs(a.b._spec, b.b._spec)
+        self.assertIs(a.b._permissions, b.b._permissions)
+        a.l.set([{"f": 1}, {"f": 2}])
+        self.assertIs(a.l[0].f._spec, a.l[1].f._spec)
+
+        # caches built from rules (views...) are shared too
+        a.l.get_view("v")
+        self.assertIs(a.l[0]._spec, a.l[1]._spec)
+
+        # a modification of a rule is only for this object
+        b.b._max = 10
+        b.b = 5
+        with self.assertRaises(SConstraintError):
+            a.b = 5
+        self.assertIsNot(a.b._spec, b.b._spec)
+        self.assertEqual(a.b._max, 3)
+
+        # the model of a copy can change
+        b.add_to_model("c", Int())
+        self.assertIsNot(a._spec, b._spec)
+        self.assertEqual(a.validate({"c": 1}) is None, False)
+        self.assertEqual(b.validate({"c": 1}), None)
+
+        # enabled permissions are not shared
+        a.l[0].f.enable_permissions()
+        self.assertIsNot(a.l[0].f._permissions, a.l[1].f._permissions)
+        self.assertEqual(a.l[1].f._permissions._enabled, False)
+        c = a.l[0].f.copy()
+        self.assertIsNot(c._permissions, a.l[0].f._permissions)
+        self.assertEqual(c._permissions._enabled, True)
+
+        with self.assertRaises(SSyntaxError):
+            Dict({"_views": Int()})
@@ -5,8 +5,18 @@ test for Permissions()
 
 # pylint: disable=no-member
 import unittest
+import io
+import json
+import types
 
-from stricto import String, Int, Dict, SRightError, SAttributeError
+from stricto import (
+    String,
+    Int,
+    Dict,
+    StrictoEncoder,
+    SRightError,
+    SAttributeError,
+)
 
 
 increment = 0  # pylint: disable=invalid-name
@@ -140,3 +150,55 @@ class TestRights(unittest.TestCase):  # pylint: disable=too-many-public-methods
         a.disable_permissions()
         a.set({"b": 1, "c": "test"})
         self.assertEqual(a.c, "test")
+
+    def test_decisions_cache(self):
+        """
+        Test rights and exists functions are called once by operation
+        """
+        calls = {"read": 0, "exists": 0}
+
+        def can_read(right_name, o):  # pylint: disable=unused-argument
+            calls["read"] += 1
+            return o.role == "admin"
+
+        def exists(value, o):  # pylint: disable=unused-argument
+            calls["exists"] += 1
+            return o.role != ""
+
+        a = Dict(
+            {
+                "role": String(),
+                "b": Dict({"x": Int(), "y": Int(), "z": Int()}, can_read=can_read),
+                "c": Dict({"x": Int(), "y": Int()}, exists=exists),
+            },
+        )
+        a.set({"role": "admin", "b": {"x": 1, "y": 2, "z": 3}, "c": {"x": 4}})
+        a.enable_permissions()
+
+        calls.update(read=0, exists=0)
+        self.assertEqual(
+            a.get_value(),
+            {"role": "admin", "b": {"x": 1, "y": 2, "z": 3}, "c": {"x": 4, "y": None}},
+        )
+        self.assertEqual(calls, {"read": 1, "exists": 1})
+
+        calls.update(read=0, exists=0)
+        self.assertEqual(
+            json.loads(json.dumps(a, cls=StrictoEncoder))["b"], {"x": 1, "y": 2, "z": 3}
+        )
+        self.assertEqual(calls, {"read": 1, "exists": 1})
+
+        # json.dump() writes chunks as they are encoded, in one operation
+        calls.update(read=0, exists=0)
+        chunks = StrictoEncoder().iterencode(a)
+        self.assertIsInstance(chunks, types.GeneratorType)
+        stream = io.StringIO()
+        json.dump(a, stream, cls=StrictoEncoder)
+        self.assertEqual(json.loads(stream.getvalue()), json.loads("".join(chunks)))
+        self.assertEqual(calls, {"read": 2, "exists": 2})
+
+        # A modification forget decisions
+        a.role = "user"
+        self.assertEqual(a.get_value(), {"role": "user", "c": {"x": 4, "y": None}})
+        a.role = ""
+        self.assertEqual(a.get_value(), {"role": ""})
@@ -7,6 +7,8 @@ test for selectors
 import unittest
 from stricto import (
     Selector,
+    JsonPath,
+    compile_path,
     String,
     Int,
     Dict,
@@ -14,6 +16,8 @@ from stricto import (
     Tuple,
     STypeError,
     SAttributeError,
+    SSyntaxError,
+    SConstraintError,
 )
 
 
@@ -30,6 +34,12 @@ class TestSelectors(unittest.TestCase):  # pylint: disable=too-many-public-metho
 
         self.event_name = None
 
+    def setUp(self):
+        """
+        reset the count of change events
+        """
+        self.changes = 0
+
     def test_selectors(self):
         """
         test selectors
@@ -64,6 +74,17 @@ class TestSelectors(unittest.TestCase):  # pylint: disable=too-many-public-metho
         self.assertEqual(sel2.pop(), ("$", None))
         self.assertEqual(sel2.pop(), ("name", None))
 
+        # the parsed selector is shared and kept in cache
+        sel = Selector("$.name")
+        self.assertIs(sel.selector, sel2.selector)
+        sel.pop()
+        sel2 = sel.copy()
+        self.assertEqual(sel2.first(), ("name", None))
+        self.assertEqual(sel2.pop(), ("name", None))
+        self.assertEqual(sel2.empty(), True)
+        self.assertEqual(sel2.first(), (None, None))
+        self.assertEqual(sel.pop(), ("name", None))
+
     def test_selector_list(self):
         """
         test selector
@@ -214,6 +235,92 @@ class TestSelectors(unittest.TestCase):  # pylint: disable=too-many-public-metho
         a.patch("remove", "$.b.l", 1)
         self.assertEqual(len(a.b.l), 1)
 
+    def test_patch_many(self):
+        """
+        test patch_many (RFC6902, atomic)
+        """
+
+        def count_change(event_name, root, me):  # pylint: disable=unused-argument
+            self.changes += 1
+
+        a = Dict(
+            {
+                "a": Int(default=1),
+                "n": String(),
+                "b": Dict(
+                    {
+                        "l": List(Dict({"i": String()})),
+                        "t": Tuple((Int(), String())),
+                    }
+                ),
+                "li": List(Int(), max=3),
+                "c": Int(on=[("change", count_change)]),
+            }
+        )
+        a.set({"a": 12, "b": {"l": [{"i": "fir"}], "t": (1, "x")}, "li": [1, 2]})
+        first = a.b.l[0]
+        self.changes = 0
+        a.patch_many(
+            [
+                {"op": "replace", "path": "$.a", "value": 13},
+                {"op": "add", "path": "$.b.l[0]", "value": {"i": "zero"}},
+                {"op": "add", "path": "/b/l/-", "value": {"i": "last"}},
+                {"op": "move", "from": "$.b.l[0]", "path": "$.b.l[-]"},
+                {"op": "copy", "from": "/b/t/1", "path": "/n"},
+                {"op": "remove", "path": "$.li[0]"},
+                {"op": "replace", "path": "$.b.t[0]", "value": 7},
+                {"op": "test", "path": "$.a", "value": 1},
+            ]
+        )
+        self.assertEqual(self.changes, 1)
+        self.assertEqual(a.a, 13)
+        self.assertEqual(a.n, "x")
+        self.assertEqual(
+            a.b.get_value()["l"], [{"i": "fir"}, {"i": "last"}, {"i": "zero"}]
+        )
+        self.assertIs(a.b.l[0], first)
+        self.assertEqual(a.b.l[2].path_name(), "$.b.l[2]")
+        self.assertEqual(a.b.t, (7, "x"))
+        self.assertEqual(a.get_value()["li"], [2])
+
+        # Nothing is changed if one operation fails
+        value = a.get_value()
+        with self.assertRaises(SConstraintError):
+            a.patch_many(
+                [
+                    {"op": "replace", "path": "$.a", "value": 1},
+                    {"op": "add", "path": "$.li", "value": 1},
+                    {"op": "add", "path": "$.li", "value": 1},
+                    {"op": "add", "path": "$.li", "value": 1},
+                ]
+            )
+        with self.assertRaises(STypeError) as e:
+            a.patch_many([{"op": "test", "path": "$.a", "value": "notint"}])
+        self.assertEqual(e.exception.to_string(), '$.a: Must be a int ("notint")')
+        with self.assertRaises(SAttributeError) as e:
+            a.patch_many([{"op": "replace", "path": "$.b.l[9].i", "value": "x"}])
+        self.assertEqual(
+            e.exception.to_string(), '$.b.l: Attribut does not exists "$.b.l[9].i"'
+        )
+        with self.assertRaises(STypeError) as e:
+            a.patch_many([{"op": "remove", "path": "$.a"}])
+        self.assertEqual(e.exception.to_string(), '$.a: invalid operator "remove"')
+        with self.assertRaises(SSyntaxError) as e:
+            a.patch_many([{"op": "move", "from": "$.b", "path": "$.b.l"}])
+        self.assertEqual(
+            e.exception.to_string(), 'Cannot move "$.b" into itself "$.b.l"'
+        )
+        with self.assertRaises(SSyntaxError) as e:
+            a.patch_many([{"op": "copy", "path": "$.a"}])
+        self.assertEqual(
+            e.exception.to_string(),
+            "Missing \"from\" in patch operation \"{'op': 'copy', 'path': '$.a'}\"",
+        )
+        with self.assertRaises(SSyntaxError) as e:
+            a.patch_many([{"op": "replace", "path": "$.b.l[*]", "value": 1}])
+        self.assertEqual(e.exception.to_string(), 'Invalid path "$.b.l[*]"')
+        self.assertEqual(a.get_value(), value)
+
     def test_multi_selection_basic(self):
         """
         test selector
@@ -271,3 +378,105 @@ class TestSelectors(unittest.TestCase):  # pylint: disable=too-many-public-metho
 
         ms = a.multi_select(["$.a", "$.b.c"])
         self.assertEqual(ms, [12, 1])
+
+    def test_jsonpath(self):
+        """
+        rfc 9535 queries
+        """
+        a = Dict(
+            {
+                "store": Dict(
+                    {
+                        "book": List(
+                            Dict(
+                                {
+                                    "author": String(),
+                                    "title": String(),
+                                    "isbn": String(exists=lambda v, o: False),
+                                    "price": Int(),
+                                    "tags": List(String()),
+                                }
+                            )
+                        ),
+                        "bicycle": Dict({"color": String(), "price": Int()}),
+                    }
+                ),
+                "limit": Int(default=10),
+            }
+        )
+        a.set(
+            {
+                "store": {
+                    "book": [
+                        {"author": "Nigel Rees", "price": 8, "tags": ["a"]},
+                        {"author": "Evelyn Waugh", "price": 12, "tags": []},
+                        {"author": "Herman Melville", "price": 9, "tags": None},
+                    ],
+                    "bicycle": {"color": "red", "price": 399},
+                }
+            }
+        )
+
+        def values(query):
+            return [o.get_value() for o in a.select(query)]
+
+        self.assertEqual(values("$..price"), [8, 12, 9, 399])
+        self.assertEqual(values("$.store..author")[2], "Herman Melville")
+        self.assertEqual(values("$.store.book[?@.price < 10].price"), [8, 9])
+        self.assertEqual(values("$.store.book[?@.price < $.limit].price"), [8, 9])
+        self.assertEqual(
+            values("$.store.book[?@.price > 8 && @.price < 10 || @.price == 12].price"),
+            [12, 9],
+        )
+        self.assertEqual(values("$.store.book[?!(@.price < 10)].price"), [12])
+        self.assertEqual(values("$.store.book[?@.tags].price"), [8, 12, 9])
+        self.assertEqual(values("$.store.book[?@.isbn].price"), [])
+        self.assertEqual(values("$.store.book[?@.nothing == @.isbn].price"), [8, 12, 9])
+        self.assertEqual(values("$.store.book[?@.price == '8'].price"), [])
+        self.assertEqual(values("$.store.book[?length(@.tags) == 0].price"), [12])
+        self.assertEqual(values("$.store.book[?count(@.tags[*]) == 1].price"), [8])
+        self.assertEqual(values("$.store.book[?match(@.author, 'N.*s')].price"), [8])
+        self.assertEqual(
+            values("$.store.book[?search(@.author, 'Wa|Me')].price"), [12, 9]
+        )
+        self.assertEqual(values("$.store.book[?value(@..tags) == null].price"), [9])
+        self.assertEqual(values("$.store.book[0, -1].price"), [8, 9])
+        self.assertEqual(values("$.store.book[::-2].price"), [9, 8])
+        self.assertEqual(values("$.store.book[*].isbn"), [])
+        self.assertEqual(values("$.store['bicycle', 'nothing'].color"), ["red"])
+        self.assertEqual(values("$.store[*].color"), ["red"])
+        self.assertEqual(len(a.select("$..*")), 22)
+
+        # singular queries return the object
+        self.assertEqual(a.select("$['store']['bicycle'].color"), "red")
+        self.assertEqual(a.select("$.store['book'][1]['price']"), 12)
+        self.assertEqual(a.select("$['nothing']"), None)
+        self.assertEqual(
+            a.store.book.select("@[?@.price > 10]")[0].author, "Evelyn Waugh"
+        )
+        self.assertEqual(a.multi_select(["$['limit']", "$..color"]), [10, ["red"]])
+
+        # compiled once
+        query = compile_path("$..book[?@.price == 9].author")
+        self.assertIsInstance(query, JsonPath)
+        self.assertIs(compile_path("$..book[?@.price == 9].author"), query)
+        self.assertEqual(a.select(query), ["Herman Melville"])
+        self.assertEqual(
+            query.nodes(a.store.bicycle)[0].path_name(), "$.store.book[2].author"
+        )
+
+        for query in (
+            "$[",
+            "$..",
+            "$.a b",
+            "$[01]",
+            "$['a",
+            "$[?@.a < ]",
+            "$[?@.* == 1]",
+            "$[?1]",
+            "$[?length(@.*) == 1]",
+            "$[?unknown(@)]",
+            "$[?count(1) == 1]",
+        ):
+            with self.assertRaises(SSyntaxError, msg=query):
+                compile_path(query)
@@ -0,0 +1,143 @@
+# pylint: disable=duplicate-code
+"""
+test for transactions
+"""
+
+import unittest
+
+from stricto import (
+    Dict,
+    Int,
+    String,
+    List,
+    Tuple,
+    Transaction,
+    STypeError,
+    SSyntaxError,
+)
+
+
+def new_object() -> Dict:
+    """
+    An object with all kinds of values
+    """
+    a = Dict(
+        {
+            "i": Int(),
+            "s": String(default="none"),
+            "t": Tuple((Int(), String())),
+            "l": List(Dict({"x": Int()})),
+        }
+    )
+    a.set({"i": 1, "t": (1, "a"), "l": [{"x": 1}, {"x": 2}]})
+    return a
+
+
+class TestTransaction(unittest.TestCase):
+    """
+    test for transactions
+    """
+
+    def test_commit_and_rollback(self):
+        """
+        A transaction is commited at the end, rolled back on exception
+        """
+        a = new_object()
+        value = a.get_value()
+        with a.transaction() as t:
+            self.assertEqual(t.is_open(), True)
+            a.i = 2
+            a.l.append({"x": 3})
+        self.assertEqual(t.is_open(), False)
+        self.assertEqual(a.i, 2)
+        self.assertEqual(len(a.l), 3)
+
+        a.set(value)
+        with self.assertRaises(STypeError):
+            with a.transaction():
+                a.s = "changed"
+                a.t = (2, "b")
+                a.l[0].x = 12
+                a.l.insert(0, {"x": 0})
+                del a.l[1:]
+                a.l.sort(key=lambda e: e.x)
+                a.set({"i": "wrong"})
+        self.assertEqual(a.get_value(), value)
+        self.assertEqual(a.l[1].path_name(), "$.l[1]")
+        self.assertEqual(Transaction.count, 0)
+
+        # a transaction on a sub object is on the whole tree
+        with a.l[0].transaction() as t:
+            a.i = 3
+            t.rollback()
+        self.assertEqual(a.i, 1)
+
+        # a copy made during a transaction is not in it
+        with a.transaction() as t:
+            b = a.copy()
+            b.i = 4
+            a.i = 5
+            t.rollback()
+        self.assertEqual((a.i, b.i), (1, 4))
+
+    def test_nested_and_savepoints(self):
+        """
+        Nested transactions and savepoints undo only their changes
+        """
+        a = new_object()
+        with a.transaction() as t:
+            a.i = 2
+            savepoint = t.savepoint()
+            a.l.pop()
+            a.l[0].x = 5
+            with a.transaction() as nested:
+                a.s = "nested"
+                nested.rollback()
+            self.assertEqual(a.s, "none")
+            with a.transaction():
+                a.t = None
+            self.assertEqual(a.t, None)
+            t.rollback(savepoint)
+            self.assertEqual(t.is_open(), True)
+            self.assertEqual(a.get_value()["l"], [{"x": 1}, {"x": 2}])
+            self.assertEqual(a.t, (1, "a"))
+            self.assertEqual(a.i, 2)
+            a.l.clear()
+        self.assertEqual(a.i, 2)
+        self.assertEqual(len(a.l), 0)
+
+        # Indexes are updated
+        a.l.set([{"x": 1}, {"x": 2}])
+        a.l.create_index("$.x")
+        with a.transaction() as t:
+            a.l[0].x = 7
+            a.l.append({"x": 7})
+            self.assertEqual(len(a.l.find({"x": 7})), 2)
+            t.rollback()
+        self.assertEqual(a.l.find({"x": 7}), [])
+        self.assertEqual(a.l.find({"x": 1})[0].path_name(), "$.l[0]")
+
+    def test_errors(self):
+        """
+        Transaction misuses
+        """
+        a = new_object()
+        t = a.transaction()
+        with self.assertRaises(SSyntaxError) as e:
+            t.commit()
+        self.assertEqual(e.exception.to_string(), "Transaction not started")
+        t.begin()
+        with self.assertRaises(SSyntaxError) as e:
+            t.begin()
+        self.assertEqual(e.exception.to_string(), "Transaction already started")
+        with self.assertRaises(SSyntaxError) as e:
+            t.rollback(12)
+        self.assertEqual(e.exception.to_string(), 'Invalid savepoint "12"')
+
+        # ending a transaction ends the nested ones
+        nested = a.transaction().begin()
+        a.i = 5
+        t.rollback()
+        self.assertEqual(nested.is_open(), False)
+        self.assertEqual(a.i, 1)
+        self.assertEqual(Transaction.count, 0)
@@ -5,8 +5,20 @@ test for views()
 
 # pylint: disable=no-member
 import unittest
+import json
+from unittest import mock
 
-from stricto import String, Int, Dict, List, Tuple
+from stricto import (
+    String,
+    Int,
+    Dict,
+    List,
+    Tuple,
+    SAttributeError,
+    SRightError,
+    StrictoEncoder,
+    ViewProxy,
+)
 
 
 class TestView(unittest.TestCase):  # pylint: disable=too-many-public-methods
@@ -126,3 +138,170 @@ class TestView(unittest.TestCase):  # pylint: disable=too-many-public-methods
         a.set({"b": 1, "c": (2, "aa")})
         v2 = a.get_view("v2")
         self.assertEqual(v2.get_value(), {"c": (2,)})
+
+    def test_view_model(self):
+        """
+        Test views after changes of the model, and the model of a view
+        """
+        a = Dict(
+            {
+                "b": Int(views=["v1"]),
+                "c": Int(views=["!v1"]),
+                "d": Dict({"e": Int(views=["v1"]), "f": Int()}),
+            }
+        )
+        a.set({"b": 1, "c": 2, "d": {"e": 3, "f": 4}})
+        self.assertEqual(a.get_view("+v1").get_value(), {"b": 1, "d": {"e": 3}})
+        self.assertEqual(a.get_view("v1").get_value(), {"b": 1, "d": {"e": 3, "f": 4}})
+
+        # the keys in a view follow the model
+        a.add_to_model("g", Int(default=5, views=["v1"]))
+        a.d.add_to_model("h", Int(default=6, views=["!v1"]))
+        self.assertEqual(a.get_view("+v1").get_value(), {"b": 1, "d": {"e": 3}, "g": 5})
+        self.assertEqual(
+            a.get_view("v1").get_value(), {"b": 1, "d": {"e": 3, "f": 4}, "g": 5}
+        )
+        a.remove_model("g")
+        self.assertEqual(a.get_view("+v1").get_value(), {"b": 1, "d": {"e": 3}})
+
+        # a view has its own model
+        v1 = a.get_view("+v1")
+        v1.set({"b": 10, "d": {"e": 30}})
+        self.assertEqual(v1.d.get_root(), v1)
+        with self.assertRaises(SAttributeError):
+            v1.set({"c": 2})
+        a.set({"c": 20, "d": {"f": 40}})
+        self.assertEqual(a.c, 20)
+        self.assertEqual(a.b, 1)
+
+    def test_view_exists_on_root(self):
+        """
+        Test a view keeps fields whose existence depends on the root
+        """
+        a = Dict(
+            {
+                "kind": String(),
+                "x": Int(exists=lambda value, root: root.kind == "a"),
+                "sub": Dict(
+                    {"y": Int(exists=lambda value, root: root.kind == "a")}
+                ),
+            }
+        )
+        a.set({"kind": "a", "x": 3, "sub": {"y": 4}})
+        for view_name in ("v", "!v"):
+            self.assertEqual(
+                a.get_view(view_name).get_value(),
+                {"kind": "a", "x": 3, "sub": {"y": 4}},
+            )
+        # a sub object with no field left is not in the view
+        a.kind = "b"
+        self.assertEqual(a.get_view("v").get_value(), {"kind": "b"})
+
+    def test_view_proxy(self):
+        """
+        Test read-only views without copy
+        """
+        a = Dict(
+            {
+                "b": Int(views=["v1"]),
+                "c": Int(views=["!v1"]),
+                "d": Dict({"e": Int(views=["v1"]), "f": Int()}),
+                "l": List(Dict({"g": Int(views=["v1"]), "h": Int()})),
+                "t": Tuple((Int(), String(views=["!v1"]))),
+            }
+        )
+        a.set(
+            {
+                "b": 1,
+                "c": 2,
+                "d": {"e": 3, "f": 4},
+                "l": [{"g": 5, "h": 6}, {"g": 7, "h": 8}],
+                "t": (9, "aa"),
+            }
+        )
+        for view in ["+v1", "v1", "!v1", "other", "+other"]:
+            proxy = a.view_proxy(view)
+            self.assertEqual(proxy, a.get_view(view).get_value())
+            self.assertEqual(
+                json.dumps(proxy, cls=StrictoEncoder),
+                json.dumps(a.get_view(view), cls=StrictoEncoder),
+            )
+            self.assertEqual(proxy.to_json(), a.get_view(view).to_json())
+        self.assertIsNone(a.d.view_proxy("+v2"))
+
+        v1 = a.view_proxy("+v1")
+        self.assertIsInstance(v1, ViewProxy)
+        self.assertEqual(list(v1), ["b", "d", "l", "t"])
+        self.assertEqual(v1.b, 1)
+        self.assertEqual(v1["b"], 1)
+        self.assertEqual(v1.d, {"e": 3})
+        self.assertEqual(v1.l[-1], {"g": 7})
+        self.assertEqual(len(v1.l), 2)
+        self.assertEqual(v1.l[0].g, 5)
+        self.assertEqual(v1.t, ())
+        # in : keys of a Dict, values of elements of a List or a Tuple
+        self.assertEqual(len(v1), 4)
+        self.assertIn("d", v1)
+        self.assertNotIn("c", v1)
+        self.assertIn({"g": 7}, v1.l)
+        self.assertNotIn({"g": 7, "h": 8}, v1.l)
+        self.assertEqual(len(v1.t), 0)
+        t = a.view_proxy("v1").t
+        self.assertEqual(len(t), 1)
+        self.assertIn(9, t)
+        self.assertNotIn("aa", t)
+        with self.assertRaises(SAttributeError):
+            v1.c  # pylint: disable=pointless-statement
+        with self.assertRaises(SAttributeError):
+            v1.d.f  # pylint: disable=pointless-statement
+        with self.assertRaises(KeyError):
+            v1["c"]  # pylint: disable=pointless-statement
+
+        # values are read from the object
+        a.b = 10
+        self.assertEqual(v1.b, 10)
+
+        # read-only
+        with self.assertRaises(SRightError):
+            v1.b = 2
+        with self.assertRaises(SRightError):
+            v1.l[0].g = 2
+        with self.assertRaises(SRightError):
+            v1.set({"b": 2})
+        self.assertEqual(a.b, 10)
+
+        # read rights
+        r = Dict({"b": Int(), "c": Int(can_read=False)})
+        r.set({"b": 1})
+        r.enable_permissions()
+        self.assertEqual(r.view_proxy("v1").get_value(), {"b": 1})
+        self.assertEqual(list(r.view_proxy("v1")), ["b"])
+
+    def test_view_proxy_index(self):
+        """
+        Test elements of a List are found by their index, or skipped if not in the view
+        """
+        e = Dict(
+            {
+                "l": List(Dict({"g": Int(views=["v1"]), "h": Int()})),
+                "m": List(Dict({"g": Int(views=["v1"], exists=lambda v, o: True)})),
+                "n": List(Dict({"o": List(Int()), "p": Int()}, views=["v1"])),
+            }
+        )
+        e.set({"l": [{"g": i} for i in range(300)], "m": [{"g": 1}, {"g": 2}]})
+        e.n = [{"o": [1]}, {"p": 2}]
+        for view in ("v1", "+v1", "other", "+other"):
+            value = e.get_view(view).get_value()
+            for name, values in value.items():
+                proxy = e.view_proxy(view)[name]
+                for index in range(-min(len(values), 2), min(len(values), 2)):
+                    self.assertEqual(proxy[index], values[index])
+                with self.assertRaises(KeyError):
+                    proxy[len(values)]  # pylint: disable=expression-not-assigned
+        l = e.view_proxy("+v1").l
+        with mock.patch.object(
+            Dict, "_in_view", autospec=True, side_effect=Dict._in_view
+        ) as in_view:
+            for index in range(300):
+                self.assertEqual(l[index].g, index)
+        self.assertEqual(in_view.call_count, 0)